@@ -32,12 +32,25 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/arima.py'),
                                      'statsforecast.arima.AutoARIMA.summary': ( 'src/arima.html#autoarima.summary',
                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_batch_result': ( 'src/arima.html#_arima_batch_result',
+                                                                                  'statsforecast/arima.py'),
+                                     'statsforecast.arima._candidates_executor': ( 'src/arima.html#_candidates_executor',
+                                                                                   'statsforecast/arima.py'),
+                                     'statsforecast.arima._compact_arima_mean_se': ( 'src/arima.html#_compact_arima_mean_se',
+                                                                                     'statsforecast/arima.py'),
+                                     'statsforecast.arima._compact_arima_state_space': ( 'src/arima.html#_compact_arima_state_space',
+                                                                                         'statsforecast/arima.py'),
+                                     'statsforecast.arima._fit_candidates': ('src/arima.html#_fit_candidates', 'statsforecast/arima.py'),
                                      'statsforecast.arima._make_arima': ('src/arima.html#_make_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._predict_xreg_mean': ( 'src/arima.html#_predict_xreg_mean',
+                                                                                 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima': ('src/arima.html#arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima2': ('src/arima.html#arima2', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_bfgs': ('src/arima.html#arima_bfgs', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_css': ('src/arima.html#arima_css', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_gradtrans': ('src/arima.html#arima_gradtrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_like': ('src/arima.html#arima_like', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.arima_objective': ('src/arima.html#arima_objective', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_string': ('src/arima.html#arima_string', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_transpar': ('src/arima.html#arima_transpar', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima_undopars': ('src/arima.html#arima_undopars', 'statsforecast/arima.py'),
@@ -45,6 +58,7 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.change_drift_name': ( 'src/arima.html#change_drift_name',
                                                                                 'statsforecast/arima.py'),
                                      'statsforecast.arima.checkarima': ('src/arima.html#checkarima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.compact_arima': ('src/arima.html#compact_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.convert_coef_name': ( 'src/arima.html#convert_coef_name',
                                                                                 'statsforecast/arima.py'),
                                      'statsforecast.arima.diff': ('src/arima.html#diff', 'statsforecast/arima.py'),
@@ -54,12 +68,19 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.fixed_params_from_dict': ( 'src/arima.html#fixed_params_from_dict',
                                                                                      'statsforecast/arima.py'),
                                      'statsforecast.arima.forecast_arima': ('src/arima.html#forecast_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.forecast_arima_batch': ( 'src/arima.html#forecast_arima_batch',
+                                                                                   'statsforecast/arima.py'),
+                                     'statsforecast.arima.forecast_arima_compact': ( 'src/arima.html#forecast_arima_compact',
+                                                                                     'statsforecast/arima.py'),
                                      'statsforecast.arima.forward_arima': ('src/arima.html#forward_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.getQ0': ('src/arima.html#getq0', 'statsforecast/arima.py'),
                                      'statsforecast.arima.inclu2': ('src/arima.html#inclu2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.invpartrans': ('src/arima.html#invpartrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.is_constant': ('src/arima.html#is_constant', 'statsforecast/arima.py'),
                                      'statsforecast.arima.kalman_forecast': ('src/arima.html#kalman_forecast', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.kalman_forecast_batch': ( 'src/arima.html#kalman_forecast_batch',
+                                                                                    'statsforecast/arima.py'),
+                                     'statsforecast.arima.kpss_test': ('src/arima.html#kpss_test', 'statsforecast/arima.py'),
                                      'statsforecast.arima.make_arima': ('src/arima.html#make_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.myarima': ('src/arima.html#myarima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.ndiffs': ('src/arima.html#ndiffs', 'statsforecast/arima.py'),
@@ -71,17 +92,29 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'statsforecast/arima.py'),
                                      'statsforecast.arima.search_arima': ('src/arima.html#search_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py')},
+                                     'statsforecast.arima.seas_strength': ('src/arima.html#seas_strength', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl_ess': ('src/arima.html#stl_ess', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl_est': ('src/arima.html#stl_est', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl_fit': ('src/arima.html#stl_fit', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl_ma': ('src/arima.html#stl_ma', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.stl_ss': ('src/arima.html#stl_ss', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.update_arima': ('src/arima.html#update_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.warm_start_arima': ('src/arima.html#warm_start_arima', 'statsforecast/arima.py')},
             'statsforecast.ces': { 'statsforecast.ces._simulate_pred_intervals': ( 'src/ces.html#_simulate_pred_intervals',
                                                                                    'statsforecast/ces.py'),
+                                   'statsforecast.ces._simulate_quantiles': ('src/ces.html#_simulate_quantiles', 'statsforecast/ces.py'),
                                    'statsforecast.ces.auto_ces': ('src/ces.html#auto_ces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.ces_target_fn': ('src/ces.html#ces_target_fn', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cescalc': ('src/ces.html#cescalc', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesfcst': ('src/ces.html#cesfcst', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesforecast': ('src/ces.html#cesforecast', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.cesforecast_many': ('src/ces.html#cesforecast_many', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesmodel': ('src/ces.html#cesmodel', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.cessimulate': ('src/ces.html#cessimulate', 'statsforecast/ces.py'),
                                    'statsforecast.ces.cesupdate': ('src/ces.html#cesupdate', 'statsforecast/ces.py'),
                                    'statsforecast.ces.forecast_ces': ('src/ces.html#forecast_ces', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.forecast_ces_compact': ('src/ces.html#forecast_ces_compact', 'statsforecast/ces.py'),
                                    'statsforecast.ces.forward_ces': ('src/ces.html#forward_ces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.initparamces': ('src/ces.html#initparamces', 'statsforecast/ces.py'),
                                    'statsforecast.ces.initstate': ('src/ces.html#initstate', 'statsforecast/ces.py'),
@@ -90,10 +123,15 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsfcast_C': ('src/ces.html#pegelsfcast_c', 'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsresid_ces': ('src/ces.html#pegelsresid_ces', 'statsforecast/ces.py'),
-                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py')},
+                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.update_ces': ('src/ces.html#update_ces', 'statsforecast/ces.py')},
             'statsforecast.core': { 'statsforecast.core.GroupedArray': ('src/core/core.html#groupedarray', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__eq__': ( 'src/core/core.html#groupedarray.__eq__',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._can_forecast_batch': ( 'src/core/core.html#groupedarray._can_forecast_batch',
+                                                                                             'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._forecast_batch': ( 'src/core/core.html#groupedarray._forecast_batch',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._get_cols': ( 'src/core/core.html#groupedarray._get_cols',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._output_fcst': ( 'src/core/core.html#groupedarray._output_fcst',
@@ -113,6 +151,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.take': ( 'src/core/core.html#groupedarray.take',
                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.update': ( 'src/core/core.html#groupedarray.update',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend': ('src/core/core.html#parallelbackend', 'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend.cross_validation': ( 'src/core/core.html#parallelbackend.cross_validation',
                                                                                              'statsforecast/core.py'),
@@ -127,17 +167,79 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast.forecast_fitted_values': ( 'src/core/core.html#statsforecast.forecast_fitted_values',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._CompactFitted': ('src/core/core.html#_compactfitted', 'statsforecast/core.py'),
+                                    'statsforecast.core._CompactFitted.__getitem__': ( 'src/core/core.html#_compactfitted.__getitem__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._CompactFitted.__init__': ( 'src/core/core.html#_compactfitted.__init__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._CompactFitted.from_fitted': ( 'src/core/core.html#_compactfitted.from_fitted',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._CompactFitted.shape': ( 'src/core/core.html#_compactfitted.shape',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels': ('src/core/core.html#_compactmodels', 'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.__init__': ( 'src/core/core.html#_compactmodels.__init__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.__len__': ( 'src/core/core.html#_compactmodels.__len__',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.from_fitted': ( 'src/core/core.html#_compactmodels.from_fitted',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.predict': ( 'src/core/core.html#_compactmodels.predict',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.supports': ( 'src/core/core.html#_compactmodels.supports',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._CompactModels.take': ( 'src/core/core.html#_compactmodels.take',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._MemmapChunk': ('src/core/core.html#_memmapchunk', 'statsforecast/core.py'),
+                                    'statsforecast.core._MemmapChunk.__init__': ( 'src/core/core.html#_memmapchunk.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._MemmapChunk._output': ( 'src/core/core.html#_memmapchunk._output',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._MemmapChunk.load': ( 'src/core/core.html#_memmapchunk.load',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._MemmapChunk.run': ('src/core/core.html#_memmapchunk.run', 'statsforecast/core.py'),
+                                    'statsforecast.core._SavedResult': ('src/core/core.html#_savedresult', 'statsforecast/core.py'),
+                                    'statsforecast.core._SavedResult.__init__': ( 'src/core/core.html#_savedresult.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._SavedResult.load': ( 'src/core/core.html#_savedresult.load',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._SharedChunk': ('src/core/core.html#_sharedchunk', 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedChunk.__init__': ( 'src/core/core.html#_sharedchunk.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._SharedChunk._output': ( 'src/core/core.html#_sharedchunk._output',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._SharedChunk.load': ( 'src/core/core.html#_sharedchunk.load',
+                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast': ('src/core/core.html#_statsforecast', 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__enter__': ( 'src/core/core.html#_statsforecast.__enter__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__exit__': ( 'src/core/core.html#_statsforecast.__exit__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__getstate__': ( 'src/core/core.html#_statsforecast.__getstate__',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__init__': ( 'src/core/core.html#_statsforecast.__init__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__repr__': ( 'src/core/core.html#_statsforecast.__repr__',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_batches': ( 'src/core/core.html#_statsforecast._cross_validation_batches',
+                                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_chunks': ( 'src/core/core.html#_statsforecast._cross_validation_chunks',
+                                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_df': ( 'src/core/core.html#_statsforecast._cross_validation_df',
+                                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._cross_validation_ga': ( 'src/core/core.html#_statsforecast._cross_validation_ga',
+                                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._cross_validation_parallel': ( 'src/core/core.html#_statsforecast._cross_validation_parallel',
                                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._directory_files': ( 'src/core/core.html#_statsforecast._directory_files',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._executor': ( 'src/core/core.html#_statsforecast._executor',
+                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_parallel': ( 'src/core/core.html#_statsforecast._fit_parallel',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_predict_parallel': ( 'src/core/core.html#_statsforecast._fit_predict_parallel',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_batches': ( 'src/core/core.html#_statsforecast._forecast_batches',
+                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_parallel': ( 'src/core/core.html#_statsforecast._forecast_parallel',
                                                                                               'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_cap_size': ( 'src/core/core.html#_statsforecast._get_cap_size',
@@ -146,16 +248,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_pool': ( 'src/core/core.html#_statsforecast._get_pool',
                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._load_directory': ( 'src/core/core.html#_statsforecast._load_directory',
+                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._make_future_df': ( 'src/core/core.html#_statsforecast._make_future_df',
                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._parse_X_level': ( 'src/core/core.html#_statsforecast._parse_x_level',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._predict_parallel': ( 'src/core/core.html#_statsforecast._predict_parallel',
                                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._prepare_cross_validation': ( 'src/core/core.html#_statsforecast._prepare_cross_validation',
+                                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._prepare_fit': ( 'src/core/core.html#_statsforecast._prepare_fit',
                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._saved_data_path': ( 'src/core/core.html#_statsforecast._saved_data_path',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._series_idxs': ( 'src/core/core.html#_statsforecast._series_idxs',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._set_prediction_intervals': ( 'src/core/core.html#_statsforecast._set_prediction_intervals',
                                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._set_uid_index': ( 'src/core/core.html#_statsforecast._set_uid_index',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._split': ( 'src/core/core.html#_statsforecast._split',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._split_costs': ( 'src/core/core.html#_statsforecast._split_costs',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._take_series': ( 'src/core/core.html#_statsforecast._take_series',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._use_threads': ( 'src/core/core.html#_statsforecast._use_threads',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_exog': ( 'src/core/core.html#_statsforecast._validate_exog',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_model_names': ( 'src/core/core.html#_statsforecast._validate_model_names',
@@ -166,6 +286,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation_fitted_values': ( 'src/core/core.html#_statsforecast.cross_validation_fitted_values',
                                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.cross_validation_iter': ( 'src/core/core.html#_statsforecast.cross_validation_iter',
+                                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit': ( 'src/core/core.html#_statsforecast.fit',
                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit_predict': ( 'src/core/core.html#_statsforecast.fit_predict',
@@ -174,6 +296,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast_fitted_values': ( 'src/core/core.html#_statsforecast.forecast_fitted_values',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_iter': ( 'src/core/core.html#_statsforecast.forecast_iter',
+                                                                                         'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.load': ( 'src/core/core.html#_statsforecast.load',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.plot': ( 'src/core/core.html#_statsforecast.plot',
@@ -182,13 +306,35 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.save': ( 'src/core/core.html#_statsforecast.save',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.update': ( 'src/core/core.html#_statsforecast.update',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._append_to_groups': ( 'src/core/core.html#_append_to_groups',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._gather_results': ('src/core/core.html#_gather_results', 'statsforecast/core.py'),
                                     'statsforecast.core._get_n_jobs': ('src/core/core.html#_get_n_jobs', 'statsforecast/core.py'),
+                                    'statsforecast.core._group_by_id': ('src/core/core.html#_group_by_id', 'statsforecast/core.py'),
+                                    'statsforecast.core._group_rows': ('src/core/core.html#_group_rows', 'statsforecast/core.py'),
                                     'statsforecast.core._id_as_idx': ('src/core/core.html#_id_as_idx', 'statsforecast/core.py'),
+                                    'statsforecast.core._iter_frame_batches': ( 'src/core/core.html#_iter_frame_batches',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._iter_series_batches': ( 'src/core/core.html#_iter_series_batches',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._load_models': ('src/core/core.html#_load_models', 'statsforecast/core.py'),
                                     'statsforecast.core._maybe_warn_sort_df': ( 'src/core/core.html#_maybe_warn_sort_df',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._memmap_split': ('src/core/core.html#_memmap_split', 'statsforecast/core.py'),
+                                    'statsforecast.core._read_parquet_batches': ( 'src/core/core.html#_read_parquet_batches',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._series_costs': ('src/core/core.html#_series_costs', 'statsforecast/core.py'),
+                                    'statsforecast.core._shared_split': ('src/core/core.html#_shared_split', 'statsforecast/core.py'),
+                                    'statsforecast.core._split_idxs': ('src/core/core.html#_split_idxs', 'statsforecast/core.py'),
+                                    'statsforecast.core._warm_start_models': ( 'src/core/core.html#_warm_start_models',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._warm_up_worker': ('src/core/core.html#_warm_up_worker', 'statsforecast/core.py'),
                                     'statsforecast.core._warn_df_constructor': ( 'src/core/core.html#_warn_df_constructor',
                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._warn_id_as_idx': ('src/core/core.html#_warn_id_as_idx', 'statsforecast/core.py'),
+                                    'statsforecast.core._with_X_batches': ('src/core/core.html#_with_x_batches', 'statsforecast/core.py'),
                                     'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py')},
             'statsforecast.distributed.fugue': { 'statsforecast.distributed.fugue.FugueBackend': ( 'src/core/distributed.fugue.html#fuguebackend',
                                                                                                    'statsforecast/distributed/fugue.py'),
@@ -232,10 +378,15 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                          'statsforecast/distributed/multiprocess.py'),
                                                         'statsforecast.distributed.multiprocess.MultiprocessBackend.forecast': ( 'src/distributed.multiprocess.html#multiprocessbackend.forecast',
                                                                                                                                  'statsforecast/distributed/multiprocess.py')},
-            'statsforecast.ets': { 'statsforecast.ets._class3models': ('src/ets.html#_class3models', 'statsforecast/ets.py'),
+            'statsforecast.ets': { 'statsforecast.ets._analytic_sigmah': ('src/ets.html#_analytic_sigmah', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._class3models': ('src/ets.html#_class3models', 'statsforecast/ets.py'),
                                    'statsforecast.ets._compute_pred_intervals': ( 'src/ets.html#_compute_pred_intervals',
                                                                                   'statsforecast/ets.py'),
                                    'statsforecast.ets._compute_sigmah': ('src/ets.html#_compute_sigmah', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._nelder_mead_iterate': ('src/ets.html#_nelder_mead_iterate', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._nelder_mead_request': ('src/ets.html#_nelder_mead_request', 'statsforecast/ets.py'),
+                                   'statsforecast.ets._simulate_pred_intervals': ( 'src/ets.html#_simulate_pred_intervals',
+                                                                                   'statsforecast/ets.py'),
                                    'statsforecast.ets.admissible': ('src/ets.html#admissible', 'statsforecast/ets.py'),
                                    'statsforecast.ets.check_param': ('src/ets.html#check_param', 'statsforecast/ets.py'),
                                    'statsforecast.ets.cospi': ('src/ets.html#cospi', 'statsforecast/ets.py'),
@@ -243,16 +394,22 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.ets_target_fn': ('src/ets.html#ets_target_fn', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etscalc': ('src/ets.html#etscalc', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etsforecast': ('src/ets.html#etsforecast', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.etsforecast_many': ('src/ets.html#etsforecast_many', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etsmodel': ('src/ets.html#etsmodel', 'statsforecast/ets.py'),
                                    'statsforecast.ets.etssimulate': ('src/ets.html#etssimulate', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.etssimulate_many': ('src/ets.html#etssimulate_many', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forecast': ('src/ets.html#forecast', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forecast_ets': ('src/ets.html#forecast_ets', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.forecast_ets_compact': ('src/ets.html#forecast_ets_compact', 'statsforecast/ets.py'),
                                    'statsforecast.ets.forward_ets': ('src/ets.html#forward_ets', 'statsforecast/ets.py'),
                                    'statsforecast.ets.fourier': ('src/ets.html#fourier', 'statsforecast/ets.py'),
                                    'statsforecast.ets.initparam': ('src/ets.html#initparam', 'statsforecast/ets.py'),
                                    'statsforecast.ets.initstate': ('src/ets.html#initstate', 'statsforecast/ets.py'),
                                    'statsforecast.ets.is_constant': ('src/ets.html#is_constant', 'statsforecast/ets.py'),
                                    'statsforecast.ets.nelder_mead_ets': ('src/ets.html#nelder_mead_ets', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.nelder_mead_init': ('src/ets.html#nelder_mead_init', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.nelder_mead_result': ('src/ets.html#nelder_mead_result', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.nelder_mead_tell': ('src/ets.html#nelder_mead_tell', 'statsforecast/ets.py'),
                                    'statsforecast.ets.optimize_ets_target_fn': ( 'src/ets.html#optimize_ets_target_fn',
                                                                                  'statsforecast/ets.py'),
                                    'statsforecast.ets.pegelsfcast_C': ('src/ets.html#pegelsfcast_c', 'statsforecast/ets.py'),
@@ -260,16 +417,22 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.restrict_to_bounds': ('src/ets.html#restrict_to_bounds', 'statsforecast/ets.py'),
                                    'statsforecast.ets.sinpi': ('src/ets.html#sinpi', 'statsforecast/ets.py'),
                                    'statsforecast.ets.switch': ('src/ets.html#switch', 'statsforecast/ets.py'),
-                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py')},
+                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.update_ets': ('src/ets.html#update_ets', 'statsforecast/ets.py')},
             'statsforecast.feature_engineering': { 'statsforecast.feature_engineering.mstl_decomposition': ( 'src/feature_engineering.html#mstl_decomposition',
                                                                                                              'statsforecast/feature_engineering.py')},
             'statsforecast.garch': { 'statsforecast.garch.garch_cons': ('src/garch.html#garch_cons', 'statsforecast/garch.py'),
+                                     'statsforecast.garch.garch_fcst': ('src/garch.html#garch_fcst', 'statsforecast/garch.py'),
+                                     'statsforecast.garch.garch_fit': ('src/garch.html#garch_fit', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_forecast': ('src/garch.html#garch_forecast', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_loglik': ('src/garch.html#garch_loglik', 'statsforecast/garch.py'),
+                                     'statsforecast.garch.garch_loglik_grad': ( 'src/garch.html#garch_loglik_grad',
+                                                                                'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_model': ('src/garch.html#garch_model', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_sigma2': ('src/garch.html#garch_sigma2', 'statsforecast/garch.py'),
                                      'statsforecast.garch.generate_garch_data': ( 'src/garch.html#generate_garch_data',
-                                                                                  'statsforecast/garch.py')},
+                                                                                  'statsforecast/garch.py'),
+                                     'statsforecast.garch.solve_qp': ('src/garch.html#solve_qp', 'statsforecast/garch.py')},
             'statsforecast.models': { 'statsforecast.models.ADIDA': ('src/core/models.html#adida', 'statsforecast/models.py'),
                                       'statsforecast.models.ADIDA.__init__': ( 'src/core/models.html#adida.__init__',
                                                                                'statsforecast/models.py'),
@@ -292,6 +455,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.__repr__': ( 'src/core/models.html#arima.__repr__',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA._compact': ( 'src/core/models.html#arima._compact',
+                                                                               'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.batch_predict': ( 'src/core/models.html#arima.batch_predict',
+                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.batch_predict_fitted': ( 'src/core/models.html#arima.batch_predict_fitted',
+                                                                                           'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.fit': ('src/core/models.html#arima.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.forecast': ( 'src/core/models.html#arima.forecast',
                                                                                'statsforecast/models.py'),
@@ -301,11 +470,18 @@ d = { 'settings': { 'branch': 'main',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.predict_in_sample': ( 'src/core/models.html#arima.predict_in_sample',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.update': ('src/core/models.html#arima.update', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA': ('src/core/models.html#autoarima', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__init__': ( 'src/core/models.html#autoarima.__init__',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__repr__': ( 'src/core/models.html#autoarima.__repr__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA._compact': ( 'src/core/models.html#autoarima._compact',
+                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.batch_predict': ( 'src/core/models.html#autoarima.batch_predict',
+                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.batch_predict_fitted': ( 'src/core/models.html#autoarima.batch_predict_fitted',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.fit': ( 'src/core/models.html#autoarima.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.forecast': ( 'src/core/models.html#autoarima.forecast',
@@ -316,11 +492,17 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.predict_in_sample': ( 'src/core/models.html#autoarima.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.update': ( 'src/core/models.html#autoarima.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES': ('src/core/models.html#autoces', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__init__': ( 'src/core/models.html#autoces.__init__',
                                                                                  'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__repr__': ( 'src/core/models.html#autoces.__repr__',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES._compact': ( 'src/core/models.html#autoces._compact',
+                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES.batch_predict': ( 'src/core/models.html#autoces.batch_predict',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.fit': ('src/core/models.html#autoces.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.forecast': ( 'src/core/models.html#autoces.forecast',
                                                                                  'statsforecast/models.py'),
@@ -330,11 +512,17 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.predict_in_sample': ( 'src/core/models.html#autoces.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES.update': ( 'src/core/models.html#autoces.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS': ('src/core/models.html#autoets', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.__init__': ( 'src/core/models.html#autoets.__init__',
                                                                                  'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.__repr__': ( 'src/core/models.html#autoets.__repr__',
                                                                                  'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS._compact': ( 'src/core/models.html#autoets._compact',
+                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.batch_predict': ( 'src/core/models.html#autoets.batch_predict',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.fit': ('src/core/models.html#autoets.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.forecast': ( 'src/core/models.html#autoets.forecast',
                                                                                  'statsforecast/models.py'),
@@ -344,6 +532,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.predict_in_sample': ( 'src/core/models.html#autoets.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.update': ( 'src/core/models.html#autoets.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoRegressive': ( 'src/core/models.html#autoregressive',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.AutoRegressive.__init__': ( 'src/core/models.html#autoregressive.__init__',
@@ -358,6 +548,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.__repr__': ( 'src/core/models.html#autotheta.__repr__',
                                                                                    'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta._compact': ( 'src/core/models.html#autotheta._compact',
+                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta.batch_predict': ( 'src/core/models.html#autotheta.batch_predict',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.fit': ( 'src/core/models.html#autotheta.fit',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.forecast': ( 'src/core/models.html#autotheta.forecast',
@@ -368,6 +562,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.predict_in_sample': ( 'src/core/models.html#autotheta.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta.update': ( 'src/core/models.html#autotheta.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel': ( 'src/core/models.html#constantmodel',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.__init__': ( 'src/core/models.html#constantmodel.__init__',
@@ -454,6 +650,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.__repr__': ( 'src/core/models.html#historicaverage.__repr__',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage._compact': ( 'src/core/models.html#historicaverage._compact',
+                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage.batch_forecast': ( 'src/core/models.html#historicaverage.batch_forecast',
+                                                                                               'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage.batch_predict': ( 'src/core/models.html#historicaverage.batch_predict',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.fit': ( 'src/core/models.html#historicaverage.fit',
                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.forecast': ( 'src/core/models.html#historicaverage.forecast',
@@ -504,6 +706,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.Naive.__repr__': ( 'src/core/models.html#naive.__repr__',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.Naive._compact': ( 'src/core/models.html#naive._compact',
+                                                                               'statsforecast/models.py'),
+                                      'statsforecast.models.Naive.batch_forecast': ( 'src/core/models.html#naive.batch_forecast',
+                                                                                     'statsforecast/models.py'),
+                                      'statsforecast.models.Naive.batch_predict': ( 'src/core/models.html#naive.batch_predict',
+                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models.Naive.fit': ('src/core/models.html#naive.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forecast': ( 'src/core/models.html#naive.forecast',
                                                                                'statsforecast/models.py'),
@@ -523,6 +731,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.__repr__': ( 'src/core/models.html#randomwalkwithdrift.__repr__',
                                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift._compact': ( 'src/core/models.html#randomwalkwithdrift._compact',
+                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift.batch_forecast': ( 'src/core/models.html#randomwalkwithdrift.batch_forecast',
+                                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift.batch_predict': ( 'src/core/models.html#randomwalkwithdrift.batch_predict',
+                                                                                                  'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.fit': ( 'src/core/models.html#randomwalkwithdrift.fit',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.forecast': ( 'src/core/models.html#randomwalkwithdrift.forecast',
@@ -565,6 +779,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.__repr__': ( 'src/core/models.html#seasonalnaive.__repr__',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive._compact': ( 'src/core/models.html#seasonalnaive._compact',
+                                                                                       'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive.batch_forecast': ( 'src/core/models.html#seasonalnaive.batch_forecast',
+                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive.batch_predict': ( 'src/core/models.html#seasonalnaive.batch_predict',
+                                                                                            'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.fit': ( 'src/core/models.html#seasonalnaive.fit',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.forecast': ( 'src/core/models.html#seasonalnaive.forecast',
@@ -644,6 +864,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.__repr__': ( 'src/core/models.html#windowaverage.__repr__',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage._compact': ( 'src/core/models.html#windowaverage._compact',
+                                                                                       'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage.batch_forecast': ( 'src/core/models.html#windowaverage.batch_forecast',
+                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage.batch_predict': ( 'src/core/models.html#windowaverage.batch_predict',
+                                                                                            'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.fit': ( 'src/core/models.html#windowaverage.fit',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.forecast': ( 'src/core/models.html#windowaverage.forecast',
@@ -672,8 +898,12 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._add_fitted_pi': ( 'src/core/models.html#_add_fitted_pi',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._adida': ('src/core/models.html#_adida', 'statsforecast/models.py'),
+                                      'statsforecast.models._calculate_sigma_batch': ( 'src/core/models.html#_calculate_sigma_batch',
+                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._chunk_forecast': ( 'src/core/models.html#_chunk_forecast',
                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models._chunk_prefix_forecasts': ( 'src/core/models.html#_chunk_prefix_forecasts',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._chunk_sums': ('src/core/models.html#_chunk_sums', 'statsforecast/models.py'),
                                       'statsforecast.models._croston_classic': ( 'src/core/models.html#_croston_classic',
                                                                                  'statsforecast/models.py'),
@@ -685,21 +915,36 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._expand_fitted_intervals': ( 'src/core/models.html#_expand_fitted_intervals',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models._flatten_arima_batch': ( 'src/core/models.html#_flatten_arima_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models._get_conformal_method': ( 'src/core/models.html#_get_conformal_method',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._historic_average': ( 'src/core/models.html#_historic_average',
                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models._historic_average_batch': ( 'src/core/models.html#_historic_average_batch',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._imapa': ('src/core/models.html#_imapa', 'statsforecast/models.py'),
+                                      'statsforecast.models._imapa_forecast': ( 'src/core/models.html#_imapa_forecast',
+                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._imapa_prefix_forecasts': ( 'src/core/models.html#_imapa_prefix_forecasts',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._intervals': ('src/core/models.html#_intervals', 'statsforecast/models.py'),
+                                      'statsforecast.models._naive_batch': ('src/core/models.html#_naive_batch', 'statsforecast/models.py'),
                                       'statsforecast.models._optimized_ses_forecast': ( 'src/core/models.html#_optimized_ses_forecast',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._optimized_ses_prefix_forecasts': ( 'src/core/models.html#_optimized_ses_prefix_forecasts',
+                                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._predict_mstl_seas': ( 'src/core/models.html#_predict_mstl_seas',
                                                                                    'statsforecast/models.py'),
                                       'statsforecast.models._probability': ('src/core/models.html#_probability', 'statsforecast/models.py'),
                                       'statsforecast.models._random_walk_with_drift': ( 'src/core/models.html#_random_walk_with_drift',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._random_walk_with_drift_batch': ( 'src/core/models.html#_random_walk_with_drift_batch',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_exponential_smoothing': ( 'src/core/models.html#_seasonal_exponential_smoothing',
                                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_naive_batch': ( 'src/core/models.html#_seasonal_naive_batch',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_ses_optimized': ( 'src/core/models.html#_seasonal_ses_optimized',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_window_average': ( 'src/core/models.html#_seasonal_window_average',
@@ -710,11 +955,19 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._ses_forecast': ( 'src/core/models.html#_ses_forecast',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._ses_mse': ('src/core/models.html#_ses_mse', 'statsforecast/models.py'),
+                                      'statsforecast.models._ses_mse_derivatives': ( 'src/core/models.html#_ses_mse_derivatives',
+                                                                                     'statsforecast/models.py'),
+                                      'statsforecast.models._ses_optimal_alpha': ( 'src/core/models.html#_ses_optimal_alpha',
+                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models._ses_optimized': ( 'src/core/models.html#_ses_optimized',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._ses_warm_alpha': ( 'src/core/models.html#_ses_warm_alpha',
+                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._tsb': ('src/core/models.html#_tsb', 'statsforecast/models.py'),
                                       'statsforecast.models._window_average': ( 'src/core/models.html#_window_average',
-                                                                                'statsforecast/models.py')},
+                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._window_average_batch': ( 'src/core/models.html#_window_average_batch',
+                                                                                      'statsforecast/models.py')},
             'statsforecast.mstl': {'statsforecast.mstl.mstl': ('src/mstl.html#mstl', 'statsforecast/mstl.py')},
             'statsforecast.tbats': { 'statsforecast.tbats._compute_sigmah': ('src/tbats.html#_compute_sigmah', 'statsforecast/tbats.py'),
                                      'statsforecast.tbats.calcLikelihoodTBATS': ( 'src/tbats.html#calclikelihoodtbats',
@@ -746,6 +999,8 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.theta.compute_pi_samples': ( 'src/theta.html#compute_pi_samples',
                                                                                  'statsforecast/theta.py'),
                                      'statsforecast.theta.forecast_theta': ('src/theta.html#forecast_theta', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.forecast_theta_compact': ( 'src/theta.html#forecast_theta_compact',
+                                                                                     'statsforecast/theta.py'),
                                      'statsforecast.theta.forward_theta': ('src/theta.html#forward_theta', 'statsforecast/theta.py'),
                                      'statsforecast.theta.initparamtheta': ('src/theta.html#initparamtheta', 'statsforecast/theta.py'),
                                      'statsforecast.theta.initstate': ('src/theta.html#initstate', 'statsforecast/theta.py'),
@@ -761,8 +1016,16 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.theta.thetacalc': ('src/theta.html#thetacalc', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetafcst': ('src/theta.html#thetafcst', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetaforecast': ('src/theta.html#thetaforecast', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetaforecast_many': ( 'src/theta.html#thetaforecast_many',
+                                                                                 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetamodel': ('src/theta.html#thetamodel', 'statsforecast/theta.py'),
-                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py')},
+                                     'statsforecast.theta.thetasimulate': ('src/theta.html#thetasimulate', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetasimulate_many': ( 'src/theta.html#thetasimulate_many',
+                                                                                 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetastep': ('src/theta.html#thetastep', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.thetaupdate_many': ('src/theta.html#thetaupdate_many', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.update_theta': ('src/theta.html#update_theta', 'statsforecast/theta.py')},
             'statsforecast.utils': { 'statsforecast.utils.ConformalIntervals': ( 'src/utils.html#conformalintervals',
                                                                                  'statsforecast/utils.py'),
                                      'statsforecast.utils.ConformalIntervals.__init__': ( 'src/utils.html#conformalintervals.__init__',
@@ -777,4 +1040,5 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.utils._repeat_val': ('src/utils.html#_repeat_val', 'statsforecast/utils.py'),
                                      'statsforecast.utils._repeat_val_seas': ('src/utils.html#_repeat_val_seas', 'statsforecast/utils.py'),
                                      'statsforecast.utils._seasonal_naive': ('src/utils.html#_seasonal_naive', 'statsforecast/utils.py'),
+                                     'statsforecast.utils._stack_padded': ('src/utils.html#_stack_padded', 'statsforecast/utils.py'),
                                      'statsforecast.utils.generate_series': ('src/utils.html#generate_series', 'statsforecast/utils.py')}}}
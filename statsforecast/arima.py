@@ -6,8 +6,11 @@ __all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'a
 
 # %% ../nbs/src/arima.ipynb 4
 import math
+import os
 import warnings
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import partial
 from typing import Optional, Dict, Union, Tuple
 
@@ -18,8 +21,7 @@ from numba import njit
 from scipy.optimize import minimize
 from scipy.stats import norm
 
-from .mstl import mstl
-from .utils import CACHE, NOGIL
+from .utils import CACHE, NOGIL, _stack_padded
 
 # %% ../nbs/src/arima.ipynb 6
 OptimResult = namedtuple("OptimResult", "success status x fun hess_inv")
@@ -617,6 +619,159 @@ def fixed_params_from_dict(
     return list(full_dict.values())
 
 # %% ../nbs/src/arima.ipynb 32
+@njit(nogil=NOGIL, cache=CACHE)
+def arima_objective(
+    p, css, x, coef, mask, xreg, narma, arma, ncond, trans, delta, a, P, Pn
+):
+    # conditional sum of squares (arma_css_op) or gaussian likelihood (armafn) of R's arima
+    par = coef.copy()
+    par[mask] = p
+    phi, theta = arima_transpar(par, arma, trans)
+    if xreg.shape[1] > 0:
+        x = x - np.dot(xreg, par[narma:])
+    if css:
+        res, resid = arima_css(x, arma, phi, theta, ncond)
+        if res <= 0.0:
+            return -math.inf
+        return 0.5 * math.log(res)
+    # update the state space model in place (upARIMA)
+    r = max(phi.size, theta.size + 1)
+    if r > 1:
+        Pn[:r, :r] = getQ0(phi, theta)
+    elif phi.size > 0:
+        denom = 1 - phi[0] ** 2
+        Pn[0, 0] = 1 / denom if denom != 0.0 else math.inf
+    else:
+        Pn[0, 0] = 1.0
+    a[:] = 0.0
+    res = arima_like(x, phi, theta, delta, a, P, Pn, 0, False)
+    if res[2] == 0.0:
+        return math.inf
+    s2 = res[0] / res[2]
+    if s2 <= 0:
+        return math.nan
+    return 0.5 * (math.log(s2) + res[1] / res[2])
+
+# %% ../nbs/src/arima.ipynb 33
+@njit(nogil=NOGIL, cache=CACHE, error_model="numpy")
+def arima_bfgs(x0, args, gtol, maxiter):
+    """Minimizes `arima_objective` with BFGS and a backtracking line search.
+
+    Used by `arima` when `optim_method='BFGS-numba'`. The line search differs from the one
+    of scipy, so the inverse hessian, and with it `var_coef`, isn't the same as scipy's.
+
+    The gradient uses forward differences with the step of scipy. Returns the solution,
+    the objective value, the inverse hessian approximation and a status code like the one
+    of `scipy.optimize.minimize`: 1 if `maxiter` was reached, 2 if the line search couldn't
+    decrease the objective and 3 if the objective is nan."""
+    n = x0.size
+    eps = 1.4901161193847656e-08
+    Hk = np.zeros((n, n))
+    Hy = np.zeros(n)
+    xk = x0.copy()
+    gk = np.zeros(n)
+    fk = math.nan
+    xnew = x0.copy()
+    gnew = np.zeros(n)
+    fnew = math.nan
+    pk = np.zeros(n)
+    alpha = slope = fprev = 0.0
+    # the objective is only called in one place, which keeps the compiled code small.
+    # xt is the point to evaluate and i the coordinate of the finite difference,
+    # -1 while searching the next point
+    xt = x0.copy()
+    i = -1
+    k = 0
+    status = 0
+    while True:
+        ft = arima_objective(xt, *args)
+        if i == -1:
+            if k > 0 and not (math.isfinite(ft) and ft <= fk + 1e-4 * alpha * slope):
+                if math.isfinite(ft):
+                    # minimum of the quadratic interpolation, kept in [0.1, 0.5] alpha
+                    step = -slope * alpha / (2.0 * ((ft - fk) / alpha - slope))
+                    alpha = min(max(step, 0.1 * alpha), 0.5 * alpha)
+                else:
+                    alpha *= 0.1
+                xt = xk + alpha * pk
+                if np.all(xt == xk):
+                    status = 2
+                    break
+                continue
+            xnew[:] = xt
+            fnew = ft
+        else:
+            gnew[i] = (ft - fnew) / (xt[i] - xnew[i])
+            xt[i] = xnew[i]
+        i += 1
+        if i < n:
+            h = eps
+            if (xnew[i] + h) - xnew[i] == 0.0:
+                h = eps * max(1.0, abs(xnew[i])) * (1.0 if xnew[i] >= 0 else -1.0)
+            xt[i] = xnew[i] + h
+            continue
+        # the gradient at the new point is complete
+        if k == 0:
+            for r in range(n):
+                Hk[r, r] = 1.0
+            # sets the initial step guess to dx ~ 1, like scipy
+            fprev = fnew + math.sqrt(np.sum(gnew * gnew)) / 2
+        else:
+            fprev = fk
+            # inverse hessian update, skipped if the curvature condition doesn't hold
+            sk = xnew - xk
+            yk = gnew - gk
+            sy = np.sum(sk * yk)
+            yHy = 0.0
+            for r in range(n):
+                Hy[r] = np.sum(Hk[r] * yk)
+                yHy += yk[r] * Hy[r]
+            if sy > 0.0:
+                for r in range(n):
+                    for c in range(n):
+                        Hk[r, c] += (
+                            (sy + yHy) * sk[r] * sk[c] / sy
+                            - Hy[r] * sk[c]
+                            - sk[r] * Hy[c]
+                        ) / sy
+        xk[:] = xnew
+        gk[:] = gnew
+        fk = fnew
+        gnorm = np.max(np.abs(gk)) if n > 0 else 0.0
+        if math.isnan(gnorm) or math.isnan(fk):
+            status = 3
+            break
+        if gnorm <= gtol:
+            break
+        if math.isinf(fk) or math.isinf(gnorm):
+            # there's no direction to search from an infinite value
+            status = 2
+            break
+        if k >= maxiter:
+            status = 1
+            break
+        k += 1
+        for r in range(n):
+            pk[r] = -np.sum(Hk[r] * gk)
+        slope = np.sum(gk * pk)
+        if not slope < 0.0:
+            # lost the positive definiteness, restart from the gradient
+            Hk[:] = 0.0
+            for r in range(n):
+                Hk[r, r] = 1.0
+            pk[:] = -gk
+            slope = -np.sum(gk * gk)
+        alpha = min(1.0, 2.02 * (fk - fprev) / slope)
+        if not alpha > 0.0:
+            alpha = 1.0
+        xt = xk + alpha * pk
+        if np.all(xt == xk):
+            status = 2
+            break
+        i = -1
+    return xk, fk, Hk, status
+
+# %% ../nbs/src/arima.ipynb 35
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -636,25 +791,6 @@ def arima(
     SSG = SSinit == "Gardner1980"
     x = x.copy()
 
-    def upARIMA(mod, phi, theta):
-        p = len(phi)
-        q = len(theta)
-        mod["phi"] = phi
-        mod["theta"] = theta
-        r = max(p, q + 1)
-        if p > 0:
-            mod["T"][:p, 0] = phi
-        if r > 1:
-            if SSG:
-                mod["Pn"][:r, :r] = getQ0(phi, theta)
-            else:
-                raise NotImplementedError('SSinit != "Gardner1980"')
-                # mod['Pn'][:r, :r] = getQ0bis(phi, theta, tol=0)
-        else:
-            mod["Pn"][0, 0] = 1 / (1 - phi[0] ** 2) if p > 0 else 1
-        mod["a"][:] = 0  # a es vector?
-        return mod
-
     def arimaSS(y, mod):
         # arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid)
         return arima_like(
@@ -669,34 +805,45 @@ def arima(
             True,
         )
 
-    def armafn(p, x, trans):
-        x = x.copy()
-        par = coef.copy()
-        par[mask] = p
-        trarma = arima_transpar(par, arma, trans)
-        Z = upARIMA(mod, trarma[0], trarma[1])
-        if Z is None:
-            return np.finfo(np.float64).max
-        if ncxreg > 0:
-            x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
-        res = arima_like(
-            x,
-            Z["phi"],
-            Z["theta"],
-            Z["delta"],
-            Z["a"],
-            Z["P"],
-            Z["Pn"],
-            0,
-            False,
+    def objective_args(css, trans=False):
+        # arguments of arima_objective, read at call time like R's closures
+        if css:
+            a, P, Pn = np.empty(0), np.empty((0, 0)), np.empty((0, 0))
+        else:
+            a, P, Pn = mod["a"], mod["P"], mod["Pn"]
+        return (
+            css,
+            x_obj,
+            coef,
+            mask,
+            xreg_obj,
+            narma,
+            arma,
+            ncond,
+            trans,
+            Delta,
+            a,
+            P,
+            Pn,
         )
-        if res[2] == 0.0:
-            return math.inf
 
-        s2 = res[0] / res[2]
-        if s2 <= 0:
-            return math.nan
-        return 0.5 * (math.log(s2) + res[1] / res[2])
+    def optimize(p0, args):
+        if optim_method == "BFGS-numba":
+            sol, fun, hess_inv, status = arima_bfgs(
+                np.asarray(p0, dtype=np.float64),
+                args,
+                optim_control.get("gtol", tol),
+                optim_control.get("maxiter", 200 * len(p0)),
+            )
+            return OptimResult(status == 0, status, sol, fun, hess_inv)
+        return minimize(
+            arima_objective,
+            p0,
+            args=args,
+            method=optim_method,
+            tol=tol,
+            options=optim_control,
+        )
 
     def arCheck(ar):
         p = np.argmax(np.append(1, -ar) != 0)
@@ -880,34 +1027,18 @@ def arima(
     else:
         init = init0
 
-    def arma_css_op(p, x):
-        x = x.copy()
-        par = coef.copy()
-        par[mask] = p
-        phi, theta = arima_transpar(par, arma, False)
-
-        if ncxreg > 0:
-            x -= np.dot(xreg, par[narma + np.arange(ncxreg)])
-
-        res, resid = arima_css(x, arma, phi, theta, ncond)
-        if res <= 0.0:
-            return -math.inf
-        return 0.5 * math.log(res)
-
     coef = np.array(fixed)
+    x_obj = x.astype(np.float64)
+    if ncxreg > 0:
+        xreg_obj = np.ascontiguousarray(xreg, dtype=np.float64)
+    else:
+        xreg_obj = np.empty((n, 0))
     # parscale definition, think about it, scipy doesn't use it
     if method == "CSS":
         if no_optim:
             res = OptimResult(True, 0, np.array([]), 0.0, np.array([]))
         else:
-            res = minimize(
-                arma_css_op,
-                init[mask],
-                args=(x,),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = optimize(init[mask], objective_args(True))
 
         if res.status > 0:
             warnings.warn(
@@ -924,14 +1055,7 @@ def arima(
     else:
         if method == "CSS-ML":
             if not no_optim:
-                res = minimize(
-                    arma_css_op,
-                    init[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = optimize(init[mask], objective_args(True))
                 # only update the initial parameters if they're valid
                 candidate = init.copy()
                 candidate[mask] = res.x
@@ -954,27 +1078,14 @@ def arima(
                 ind = np.sum(arma[:3]) + np.arange(arma[3])
                 init[ind] = maInvert(init[ind])
         trarma = arima_transpar(init, arma, transform_pars)
+        if not SSG and max(len(trarma[0]), len(trarma[1]) + 1) > 1:
+            raise NotImplementedError('SSinit != "Gardner1980"')
         mod = make_arima(trarma[0], trarma[1], Delta, kappa, SSinit)
         if no_optim:
-            res = OptimResult(
-                True,
-                0,
-                np.array([]),
-                armafn(np.array([]), x, transform_pars),
-                np.array([]),
-            )
+            fun = arima_objective(np.array([]), *objective_args(False, transform_pars))
+            res = OptimResult(True, 0, np.array([]), fun, np.array([]))
         else:
-            res = minimize(
-                armafn,
-                init[mask],
-                args=(
-                    x,
-                    transform_pars,
-                ),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = optimize(init[mask], objective_args(False, transform_pars))
         coef[mask] = res.x
         if transform_pars:
             if arma[1] > 0:
@@ -987,14 +1098,7 @@ def arima(
                     coef[ind] = maInvert(coef[ind])
             if any(coef[mask] != res.x):
                 oldcode = res.status
-                res = minimize(
-                    arma_css_op,
-                    coef[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = optimize(coef[mask], objective_args(True))
                 res = OptimResult(res.success, oldcode, res.x, res.fun, res.hess_inv)
                 coef[mask] = res.x
             A = arima_gradtrans(coef, arma)
@@ -1054,7 +1158,7 @@ def arima(
     }
     return ans
 
-# %% ../nbs/src/arima.ipynb 40
+# %% ../nbs/src/arima.ipynb 44
 @njit(nogil=NOGIL, cache=CACHE)
 def kalman_forecast(n, Z, a, P, T, V, h):
     p = len(a)
@@ -1096,14 +1200,25 @@ def kalman_forecast(n, Z, a, P, T, V, h):
 
     return forecasts, se
 
-# %% ../nbs/src/arima.ipynb 43
+# %% ../nbs/src/arima.ipynb 45
+@njit(nogil=NOGIL, cache=CACHE)
+def kalman_forecast_batch(n, Z, a, P, T, V, h):
+    # the models are stacked in the first axis and have the same state dimension
+    n_models = a.shape[0]
+    forecasts = np.empty((n_models, n))
+    se = np.empty((n_models, n))
+    for i in range(n_models):
+        forecasts[i], se[i] = kalman_forecast(n, Z[i], a[i], P[i], T[i], V[i], h[i])
+    return forecasts, se
+
+# %% ../nbs/src/arima.ipynb 48
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../nbs/src/arima.ipynb 44
-def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
+# %% ../nbs/src/arima.ipynb 49
+def _predict_xreg_mean(model, n_ahead, newxreg=None):
     myNCOL = lambda x: x.shape[1] if x is not None else 0
     # rsd = model['residuals']
     # xreg = model['xreg']
@@ -1136,6 +1251,11 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
         xm = xm.flatten()
     else:
         xm = 0
+    return xm
+
+# %% ../nbs/src/arima.ipynb 50
+def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
+    xm = _predict_xreg_mean(model, n_ahead, newxreg)
 
     # just warnings
     # if (arma[2L] > 0L) {
@@ -1160,7 +1280,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../nbs/src/arima.ipynb 48
+# %% ../nbs/src/arima.ipynb 54
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -1182,13 +1302,13 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../nbs/src/arima.ipynb 49
+# %% ../nbs/src/arima.ipynb 55
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../nbs/src/arima.ipynb 50
+# %% ../nbs/src/arima.ipynb 56
 def myarima(
     x,
     order=(0, 0, 0),
@@ -1200,6 +1320,8 @@ def myarima(
     offset=0,
     xreg=None,
     method=None,
+    init=None,
+    optim_method="BFGS",
     **kwargs,
 ):
     missing = np.isnan(x)
@@ -1224,17 +1346,47 @@ def myarima(
             else:
                 xreg = drift
             if use_season:
-                fit = arima(x, order, seasonal, xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    seasonal,
+                    xreg,
+                    method=method,
+                    init=init,
+                    optim_method=optim_method,
+                )
             else:
-                fit = arima(x, order, xreg=xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    xreg=xreg,
+                    method=method,
+                    init=init,
+                    optim_method=optim_method,
+                )
             fit["coef"] = change_drift_name(fit["coef"])
         else:
             if use_season:
                 fit = arima(
-                    x, order, seasonal, include_mean=constant, method=method, xreg=xreg
+                    x,
+                    order,
+                    seasonal,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    init=init,
+                    optim_method=optim_method,
                 )
             else:
-                fit = arima(x, order, include_mean=constant, method=method, xreg=xreg)
+                fit = arima(
+                    x,
+                    order,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    init=init,
+                    optim_method=optim_method,
+                )
         # nxreg = 0 if xreg is None else xreg.shape[1]
         nstar = n - order[1] - seas_order[1] * m
         if diffs == 1 and constant:
@@ -1287,7 +1439,24 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../nbs/src/arima.ipynb 53
+# %% ../nbs/src/arima.ipynb 59
+@contextmanager
+def _candidates_executor(n_jobs):
+    """Thread pool that fits candidate models concurrently, `None` if `n_jobs == 1`."""
+    if n_jobs == 1:
+        yield None
+        return
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        yield executor
+
+
+def _fit_candidates(fit_fn, candidates, executor=None):
+    """Lazily fit the `candidates` in order, concurrently if an `executor` is provided."""
+    if executor is None:
+        return map(fit_fn, candidates)
+    return executor.map(fit_fn, candidates)
+
+# %% ../nbs/src/arima.ipynb 60
 def search_arima(
     x,
     d=0,
@@ -1306,38 +1475,47 @@ def search_arima(
     allow_drift=True,
     allow_mean=True,
     period=1,
+    n_jobs=1,
     **kwargs
 ):
     m = period
     allow_drift = allow_drift and (d + D) == 1
     allow_mean = allow_mean and (d + D) == 0
     max_K = int(allow_drift or allow_mean)
+    candidates = [
+        (i, j, I, J, K)
+        for i in range(max_p + 1)
+        for j in range(max_q + 1)
+        for I in range(max_P + 1)
+        for J in range(max_Q + 1)
+        if i + j + I + J <= max_order
+        for K in range(max_K + 1)
+    ]
+
+    def fit_candidate(candidate):
+        i, j, I, J, K = candidate
+        return myarima(
+            x,
+            order=(i, d, j),
+            seasonal={"order": (I, D, J), "period": m},
+            constant=K == 1,
+            trace=trace,
+            ic=ic,
+            approximation=approximation,
+            offset=offset,
+            xreg=xreg,
+            **kwargs,
+        )
 
     best_ic = np.inf
     best_fit = None
-    for i in range(max_p + 1):
-        for j in range(max_q + 1):
-            for I in range(max_P + 1):
-                for J in range(max_Q + 1):
-                    if i + j + I + J > max_order:
-                        continue
-                    for K in range(max_K + 1):
-                        fit = myarima(
-                            x,
-                            order=(i, d, j),
-                            seasonal={"order": (I, D, J), "period": m},
-                            constant=K == 1,
-                            trace=trace,
-                            ic=ic,
-                            approximation=approximation,
-                            offset=offset,
-                            xreg=xreg,
-                            **kwargs,
-                        )
-                        if fit["ic"] < best_ic:
-                            best_ic = fit["ic"]
-                            best_fit = fit
-                            constant = K == 1
+    with _candidates_executor(n_jobs) as executor:
+        fits = _fit_candidates(fit_candidate, candidates, executor)
+        for (i, j, I, J, K), fit in zip(candidates, fits):
+            if fit["ic"] < best_ic:
+                best_ic = fit["ic"]
+                best_fit = fit
+                constant = K == 1
     if best_fit is None:
         raise RuntimeError("No ARIMA model able to be estimated")
     if approximation:
@@ -1377,11 +1555,12 @@ def search_arima(
                 offset=offset,
                 allow_drift=allow_drift,
                 allow_mean=allow_mean,
+                n_jobs=n_jobs,
                 **kwargs,
             )
     return best_fit
 
-# %% ../nbs/src/arima.ipynb 55
+# %% ../nbs/src/arima.ipynb 62
 def arima2(x, model, xreg, method):
     m = model["arma"][4]  # 5
     use_drift = "drift" in model["coef"].keys()
@@ -1448,7 +1627,7 @@ def arima2(x, model, xreg, method):
         refit["coef"] = change_drift_name(refit["coef"])
     return refit
 
-# %% ../nbs/src/arima.ipynb 56
+# %% ../nbs/src/arima.ipynb 63
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1542,7 +1721,7 @@ def Arima(
         tmp["sigma2"] = np.nansum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../nbs/src/arima.ipynb 64
+# %% ../nbs/src/arima.ipynb 71
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1572,11 +1751,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../nbs/src/arima.ipynb 67
+# %% ../nbs/src/arima.ipynb 74
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/arima.ipynb 68
+# %% ../nbs/src/arima.ipynb 75
 def forecast_arima(
     model,
     h=None,
@@ -1671,7 +1850,98 @@ def forecast_arima(
 
     return ans
 
-# %% ../nbs/src/arima.ipynb 75
+# %% ../nbs/src/arima.ipynb 76
+def compact_arima(model):
+    """Arrays with everything the forecasts of a fitted model without exogenous regressors depend on.
+
+    The transition and noise matrices are rebuilt from the coefficients when forecasting.
+    """
+    if any("ex_" in name for name in model["coef"]):
+        raise Exception("No regressors provided")
+    ss = model["model"]
+    return {
+        "constant": np.array(is_constant(model["x"])),
+        "x0": np.array(model["x"][0]),
+        "nobs": np.array(len(model["x"])),
+        "intercept": np.array(model["coef"].get("intercept", 0.0)),
+        "drift": np.array(model["coef"].get("drift", 0.0)),
+        "sigma2": np.array(model["sigma2"]),
+        "phi": ss["phi"],
+        "theta": ss["theta"],
+        "r": np.array(ss["a"].size - ss["delta"].size),
+        "d": np.array(ss["delta"].size),
+        **{var: np.asarray(ss[var]) for var in ["Z", "a", "P", "h"]},
+    }
+
+
+def _compact_arima_state_space(params):
+    # transition and noise matrices of the state spaces, as built by make_arima
+    n_models, dim = params["a"].shape
+    r, d = params["r"].astype(np.int64), params["d"].astype(np.int64)
+    idxs = np.arange(1, dim)
+    T = np.zeros((n_models, dim, dim))
+    T[:, idxs - 1, idxs] = idxs < r[:, None]
+    T[:, idxs, idxs - 1] = (idxs > r[:, None]) & (idxs < (r + d)[:, None])
+    T[:, : params["phi"].shape[1], 0] = params["phi"]
+    differenced = np.flatnonzero(d > 0)
+    T[differenced, r[differenced]] = params["Z"][differenced]
+    R = np.zeros((n_models, dim))
+    R[:, 0] = 1.0
+    R[:, 1 : 1 + params["theta"].shape[1]] = params["theta"]
+    V = R[:, :, None] * R[:, None, :]
+    return T, V
+
+
+def _compact_arima_mean_se(params, h):
+    # the state spaces of different sizes are padded with zeros,
+    # which leaves the kalman forecasts unchanged
+    T, V = _compact_arima_state_space(params)
+    with np.errstate(invalid="ignore"):
+        mean, se = kalman_forecast_batch(
+            h, params["Z"], params["a"], params["P"], T, V, params["h"]
+        )
+        se = np.sqrt(se * params["sigma2"][:, None])
+    steps = params["nobs"][:, None] + np.arange(1, h + 1)
+    mean += params["intercept"][:, None] + params["drift"][:, None] * steps
+    constant = params["constant"].astype(bool)
+    mean[constant] = params["x0"][constant, None]
+    se[constant] = 0.0
+    return mean, se
+
+
+def _arima_batch_result(mean, se, level):
+    res = {"mean": mean}
+    if level is not None:
+        quantiles = norm.ppf(0.5 * (1 + np.asarray(level) / 100))
+        res["lower"] = {f"{l}%": mean - q * se for l, q in zip(level, quantiles)}
+        res["upper"] = {f"{l}%": mean + q * se for l, q in zip(level, quantiles)}
+    return res
+
+
+def forecast_arima_compact(params, h, level=None):
+    """Forecast several models from the stacked arrays of `compact_arima`.
+
+    The arrays of the models with smaller state spaces must be padded with zeros."""
+    return _arima_batch_result(*_compact_arima_mean_se(params, h), level)
+
+
+def forecast_arima_batch(models, h, level=None):
+    """Forecast several fitted models that don't use exogenous regressors.
+
+    The Kalman forecasts of the models with the same state dimension
+    are computed in a single call."""
+    rows = [compact_arima(model) for model in models]
+    mean = np.empty((len(models), h))
+    se = np.empty((len(models), h))
+    by_dim = {}
+    for i, row in enumerate(rows):
+        by_dim.setdefault(row["a"].size, []).append(i)
+    for idxs in by_dim.values():
+        params = {key: _stack_padded([rows[i][key] for i in idxs]) for key in rows[0]}
+        mean[idxs], se[idxs] = _compact_arima_mean_se(params, h)
+    return _arima_batch_result(mean, se, level)
+
+# %% ../nbs/src/arima.ipynb 83
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1687,19 +1957,174 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../nbs/src/arima.ipynb 80
+# %% ../nbs/src/arima.ipynb 88
+@njit(nogil=NOGIL, cache=CACHE)
+def stl_est(y, n, len_, ideg, xs, nleft, nright, w):
+    # loess fit at xs using the points nleft..nright (1-based), as in the STL fortran
+    h = float(max(xs - nleft, nright - xs))
+    if len_ > n:
+        h += (len_ - n) // 2
+    h9 = 0.999 * h
+    h1 = 0.001 * h
+    a = 0.0
+    for j in range(nleft - 1, nright):
+        w[j] = 0.0
+        r = abs(j + 1 - xs)
+        if r <= h9:
+            if r <= h1:
+                w[j] = 1.0
+            else:
+                w[j] = (1.0 - (r / h) ** 3) ** 3
+            a += w[j]
+    if a <= 0:
+        return np.nan
+    for j in range(nleft - 1, nright):
+        w[j] /= a
+    if h > 0 and ideg > 0:
+        a = 0.0
+        for j in range(nleft - 1, nright):
+            a += w[j] * (j + 1)
+        b = xs - a
+        c = 0.0
+        for j in range(nleft - 1, nright):
+            c += w[j] * (j + 1 - a) ** 2
+        if math.sqrt(c) > 0.001 * (n - 1.0):
+            b /= c
+            for j in range(nleft - 1, nright):
+                w[j] *= b * (j + 1 - a) + 1.0
+    ys = 0.0
+    for j in range(nleft - 1, nright):
+        ys += w[j] * y[j]
+    return ys
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def stl_ess(y, n, len_, ideg, ys, res):
+    # loess smoothing of y[:n] evaluated at every point (jump of 1)
+    if n < 2:
+        ys[0] = y[0]
+        return
+    nsh = (len_ + 2) // 2
+    nleft = 1
+    nright = min(len_, n)
+    for i in range(n):
+        if i + 1 > nsh and nright != n:
+            nleft += 1
+            nright += 1
+        ys[i] = stl_est(y, n, len_, ideg, i + 1, nleft, nright, res)
+        if np.isnan(ys[i]):
+            ys[i] = y[i]
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def stl_ma(x, n, len_, ave):
+    v = 0.0
+    for i in range(len_):
+        v += x[i]
+    ave[0] = v / len_
+    for j in range(1, n - len_ + 1):
+        v += x[len_ + j - 1] - x[j - 1]
+        ave[j] = v / len_
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def stl_ss(y, n, period, seasonal, ideg, season, work1, work2, work3):
+    # smooths each cycle-subseries and extends it one period on each side
+    for j in range(period):
+        k = (n - (j + 1)) // period + 1
+        for i in range(k):
+            work1[i] = y[i * period + j]
+        stl_ess(work1, k, seasonal, ideg, work2[1:], work3)
+        work2[0] = stl_est(work1, k, seasonal, ideg, 0, 1, min(seasonal, k), work3)
+        if np.isnan(work2[0]):
+            work2[0] = work2[1]
+        work2[k + 1] = stl_est(
+            work1, k, seasonal, ideg, k + 1, max(1, k - seasonal + 1), k, work3
+        )
+        if np.isnan(work2[k + 1]):
+            work2[k + 1] = work2[k]
+        for m in range(k + 2):
+            season[m * period + j] = work2[m]
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def stl_fit(
+    y,
+    period,
+    seasonal,
+    trend,
+    low_pass,
+    seasonal_deg,
+    trend_deg,
+    low_pass_deg,
+    inner_iter,
+):
+    """Non-robust STL decomposition of `y` (statsmodels' `STL.fit` with unit jumps)."""
+    n = y.size
+    season = np.zeros(n)
+    trend_ = np.zeros(n)
+    work = np.zeros((5, n + 2 * period))
+    for _ in range(inner_iter):
+        for i in range(n):
+            work[0, i] = y[i] - trend_[i]
+        stl_ss(
+            work[0],
+            n,
+            period,
+            seasonal,
+            seasonal_deg,
+            work[1],
+            work[2],
+            work[3],
+            work[4],
+        )
+        # low-pass filter of the cycle-subseries
+        stl_ma(work[1], n + 2 * period, period, work[2])
+        stl_ma(work[2], n + period + 1, period, work[0])
+        stl_ma(work[0], n + 2, 3, work[2])
+        stl_ess(work[2], n, low_pass, low_pass_deg, work[0], work[4])
+        for i in range(n):
+            season[i] = work[1, period + i] - work[0, i]
+            work[0, i] = y[i] - season[i]
+        stl_ess(work[0], n, trend, trend_deg, trend_, work[2])
+    return season, trend_
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def seas_strength(x, period, seasonal=11):
+    # strength of seasonality from the STL decomposition used by `mstl`
+    trend = int(math.ceil(1.5 * period / (1 - 1.5 / seasonal)))
+    if trend % 2 == 0:
+        trend += 1
+    low_pass = period + 1
+    if low_pass % 2 == 0:
+        low_pass += 1
+    season, trend_ = stl_fit(x, period, seasonal, trend, low_pass, 0, 1, 1, 5)
+    n = x.size
+    detrend = x - trend_
+    remainder = detrend - season
+    mean_r = remainder.mean()
+    mean_d = detrend.mean()
+    vare = 0.0
+    vard = 0.0
+    for i in range(n):
+        vare += (remainder[i] - mean_r) ** 2
+        vard += (detrend[i] - mean_d) ** 2
+    if vard == 0.0:
+        return np.nan
+    return 1 - vare / vard
+
+# %% ../nbs/src/arima.ipynb 90
 def seas_heuristic(x, period):
     # nperiods = period > 1
-    season = math.nan
-    stlfit = mstl(x, period)
-    remainder = stlfit["remainder"]
-    seasonal = stlfit.get("seasonal", None)
-    vare = np.var(remainder, ddof=1)
-    if seasonal is not None:
-        season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
-    return season
-
-# %% ../nbs/src/arima.ipynb 82
+    x = np.asarray(x, dtype=np.float64)
+    if np.isnan(x).any():
+        raise ValueError("seas_heuristic cannot handle missing values.")
+    if not isinstance(period, (int, np.integer)) or period < 2:
+        raise ValueError("period must be a positive integer >= 2")
+    return max(0, min(1, seas_strength(x, period)))
+
+# %% ../nbs/src/arima.ipynb 92
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1762,7 +2187,34 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../nbs/src/arima.ipynb 84
+# %% ../nbs/src/arima.ipynb 94
+@njit(nogil=NOGIL, cache=CACHE)
+def kpss_test(x, nlags):
+    """KPSS level stationarity test. Returns the statistic and its interpolated p-value."""
+    n = x.size
+    resids = x - x.mean()
+    eta = 0.0
+    cumsum = 0.0
+    s_hat = 0.0
+    for i in range(n):
+        cumsum += resids[i]
+        eta += cumsum * cumsum
+        s_hat += resids[i] * resids[i]
+    eta /= n * n
+    for lag in range(1, nlags + 1):
+        prod = 0.0
+        for i in range(lag, n):
+            prod += resids[i] * resids[i - lag]
+        s_hat += 2 * prod * (1.0 - lag / (nlags + 1.0))
+    s_hat /= n
+    stat = eta / s_hat if s_hat > 0 else np.nan
+    if np.isnan(stat):
+        return stat, np.nan
+    crit = np.array([0.347, 0.463, 0.574, 0.739])
+    pvals = np.array([0.10, 0.05, 0.025, 0.01])
+    return stat, np.interp(stat, crit, pvals)
+
+# %% ../nbs/src/arima.ipynb 96
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
     x = x[~np.isnan(x)]
     d = 0
@@ -1784,7 +2236,7 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 nlags = math.floor(3 * math.sqrt(len(x)) / 13)
-                diff = sm.tsa.kpss(x, "c", nlags=nlags)[1] < alpha
+                diff = kpss_test(x, nlags)[1] < alpha
         except Exception as e:
             warnings.warn(
                 f"The chosen unit root test encountered an error when testing for the {d} difference.\n"
@@ -1807,13 +2259,13 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../nbs/src/arima.ipynb 86
+# %% ../nbs/src/arima.ipynb 98
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../nbs/src/arima.ipynb 88
+# %% ../nbs/src/arima.ipynb 100
 def auto_arima_f(
     x,
     d=None,
@@ -1848,9 +2300,13 @@ def auto_arima_f(
     blambda=None,
     biasadj=False,
     period=1,
+    n_jobs=1,
+    optim_method="BFGS",
 ):
     if approximation is None:
         approximation = len(x) > 150 or period > 12
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
     if x.ndim > 1:
         raise ValueError("auto_arima can only handle univariate time series")
     if test_kwargs is None:
@@ -2018,13 +2474,14 @@ def auto_arima_f(
                 x = x[-truncate:]
         try:
             if D == 0:
-                fit = arima(x, order=(0, d, 0), xreg=xreg)
+                fit = arima(x, order=(0, d, 0), xreg=xreg, optim_method=optim_method)
             else:
                 fit = arima(
                     x,
                     order=(0, d, 0),
                     seasonal={"order": (0, D, 0), "period": m},
                     xreg=xreg,
+                    optim_method=optim_method,
                 )
             offset = -2 * fit["loglik"] - series_len * math.log(fit["sigma2"])
         except:
@@ -2056,6 +2513,8 @@ def auto_arima_f(
             allowdrift=allowdrift,
             allowmean=allowmean,
             period=m,
+            n_jobs=n_jobs,
+            optim_method=optim_method,
         )
         bestfit["lambda"] = blambda
         bestfit["x"] = origx
@@ -2082,6 +2541,7 @@ def auto_arima_f(
         offset=offset,
         xreg=xreg,
         method=method,
+        optim_method=optim_method,
     )
     bestfit = p_myarima(
         order=(p, d, q),
@@ -2137,211 +2597,108 @@ def auto_arima_f(
             p = q = P = Q = 0
         k += 1
 
-    def try_params(p, d, q, P, D, Q, constant, k, bestfit):
-        k += 1
-        improved = False
-        if k >= results.shape[0]:
-            return k, bestfit, improved
-        fit = p_myarima(
+    # changes of (p, q, P, Q) tried from the current model, in order
+    steps = [
+        (0, 0, -1, 0),
+        (0, 0, 0, -1),
+        (0, 0, 1, 0),
+        (0, 0, 0, 1),
+        (0, 0, -1, -1),
+        (0, 0, -1, 1),
+        (0, 0, 1, -1),
+        (0, 0, 1, 1),
+        (-1, 0, 0, 0),
+        (0, -1, 0, 0),
+        (1, 0, 0, 0),
+        (0, 1, 0, 0),
+        (-1, -1, 0, 0),
+        (-1, 1, 0, 0),
+        (1, -1, 0, 0),
+        (1, 1, 0, 0),
+    ]
+
+    def fit_candidate(candidate):
+        p, q, P, Q, _ = candidate
+        return p_myarima(
             order=(p, d, q),
             seasonal={"order": (P, D, Q), "period": m},
         )
-        results[k] = (p, d, q, P, D, Q, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            improved = True
-        return k, bestfit, improved
-
-    startk = 0
-    while startk < k and k < nmodels:
-        startk = k
-        if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                continue
-        if Q > 0 and newmodel(p, d, q, P, D, Q - 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                Q -= 1
-                continue
-        if P < max_P and newmodel(p, d, q, P + 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                continue
-        if Q < max_Q and newmodel(p, d, q, P, D, Q + 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q += 1
-                continue
-        if p > 0 and newmodel(p - 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p - 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                continue
-        if q > 0 and newmodel(p, d, q - 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q -= 1
-                continue
-        if p < max_p and newmodel(p + 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p + 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                continue
-        if q < max_q and newmodel(p, d, q + 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q += 1
-                continue
-        if (
-            q > 0
-            and p > 0
-            and newmodel(p - 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p > 0
-            and newmodel(p - 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q += 1
-                continue
-        if (
-            q > 0
-            and p < max_p
-            and newmodel(p + 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p < max_p
-            and newmodel(p + 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q += 1
-                continue
-        if (allowdrift or allowmean) and newmodel(
-            p, d, q, P, D, Q, not constant, results[:k]
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q, not constant, k, bestfit
-            )
-            if improved:
-                constant = not constant
-                continue
-    if k >= nmodels:
-        warnings.warn(
-            f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
+
+    def refit_candidate(k):
+        p, q, P, Q, constant = map(int, results[k, [0, 2, 3, 5, 6]])
+        return myarima(
+            x,
+            (p, d, q),
+            {"order": (P, D, Q), "period": m},
+            constant=results[k, 6],
+            ic=ic,
+            trace=trace,
+            approximation=False,
+            method=method,
+            xreg=xreg,
+            optim_method=optim_method,
         )
-    if approximation or bestfit["arma"] is not None:
-        if trace:
-            print("Now re-fitting the best model(s) without approximations...\n")
-        icorder = np.argsort(results[:, 7])
-        nmodels = np.sum(~np.isnan(results[:, 7]))
-        for i in range(nmodels):
-            k = icorder[i]
-            p, q, P, Q, constant = map(int, results[k, [0, 2, 3, 5, 6]])
-            fit = myarima(
-                x,
-                (p, d, q),
-                {"order": (P, D, Q), "period": m},
-                constant=results[k, 6],
-                ic=ic,
-                trace=trace,
-                approximation=False,
-                method=method,
-                xreg=xreg,
+
+    with _candidates_executor(n_jobs) as executor:
+        startk = 0
+        while startk < k and k < nmodels:
+            startk = k
+            candidates = [
+                (p + dp, q + dq, P + dP, Q + dQ, constant)
+                for dp, dq, dP, dQ in steps
+                if 0 <= p + dp <= max_p
+                and 0 <= q + dq <= max_q
+                and 0 <= P + dP <= max_P
+                and 0 <= Q + dQ <= max_Q
+            ]
+            if allowdrift or allowmean:
+                candidates.append((p, q, P, Q, not constant))
+            candidates = [
+                c
+                for c in candidates
+                if newmodel(c[0], d, c[1], c[2], D, c[3], c[4], results[:k])
+            ]
+            # the candidates are fitted in batches of n_jobs and processed in order,
+            # so the first improvement is the same as in the sequential search
+            n_fits = min(len(candidates), max(nmodels - k - 1, 0))
+            improved = False
+            for start in range(0, n_fits, n_jobs):
+                batch = candidates[start : min(start + n_jobs, n_fits)]
+                for candidate, fit in zip(
+                    batch, _fit_candidates(fit_candidate, batch, executor)
+                ):
+                    k += 1
+                    cp, cq, cP, cQ, cconstant = candidate
+                    results[k] = (cp, d, cq, cP, D, cQ, cconstant, fit["ic"])
+                    if fit["ic"] < bestfit["ic"]:
+                        bestfit = fit
+                        p, q, P, Q, constant = candidate
+                        improved = True
+                        break
+                if improved:
+                    break
+            if not improved:
+                # candidates over the limit count as tried
+                k += len(candidates) - n_fits
+        if k >= nmodels:
+            warnings.warn(
+                f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
             )
-            if fit["ic"] < math.inf:
-                bestfit = fit
-                break
+        if approximation or bestfit["arma"] is not None:
+            if trace:
+                print("Now re-fitting the best model(s) without approximations...\n")
+            nmodels = np.sum(~np.isnan(results[:, 7]))
+            icorder = np.argsort(results[:, 7])[:nmodels]
+            found = False
+            for start in range(0, nmodels, n_jobs):
+                batch = icorder[start : start + n_jobs]
+                for fit in _fit_candidates(refit_candidate, batch, executor):
+                    if fit["ic"] < math.inf:
+                        bestfit = fit
+                        found = True
+                        break
+                if found:
+                    break
     if math.isinf(bestfit["ic"]) and method != "CSS":
         raise ValueError("No suitable ARIMA model found")
 
@@ -2351,11 +2708,104 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../nbs/src/arima.ipynb 90
+# %% ../nbs/src/arima.ipynb 103
+def warm_start_arima(model, x, ic="aicc", xreg=None, method=None, ic_tol=0.05):
+    """Re-estimate the coefficients of a fitted `model` on `x` keeping its order.
+
+    The optimization starts from the previous coefficients. Returns `None` if the
+    information criterion per observation increases more than `ic_tol` with respect
+    to the previous fit, which indicates that the order should be searched again.
+    """
+    p, q, P, Q, m, d, D = model["arma"]
+    coef = model["coef"]
+    prev_ic = model[ic]
+    if not math.isfinite(prev_ic):
+        return None
+    # the regressors are initialized with OLS
+    init = np.array(list(coef.values()), dtype=np.float64)
+    init[p + q + P + Q :] = np.nan
+    try:
+        fit = myarima(
+            x,
+            order=(p, d, q),
+            seasonal={"order": (P, D, Q), "period": m},
+            constant="intercept" in coef or "drift" in coef,
+            ic=ic,
+            xreg=xreg,
+            method=method,
+            init=init,
+        )
+    except ValueError:
+        return None
+    prev_nstar = np.sum(~np.isnan(model["residuals"])) - d - D * m
+    nstar = np.sum(~np.isnan(fit["residuals"])) - d - D * m
+    if not fit["ic"] / nstar <= prev_ic / prev_nstar + ic_tol:
+        return None
+    fit["x"] = x
+    fit["ic"] = None
+    fit["lambda"] = None
+    return fit
+
+# %% ../nbs/src/arima.ipynb 105
 def forward_arima(fitted_model, y, xreg=None, method="CSS-ML"):
     return Arima(x=y, model=fitted_model, xreg=xreg, method=method)
 
-# %% ../nbs/src/arima.ipynb 99
+# %% ../nbs/src/arima.ipynb 106
+def update_arima(fitted_model, y, xreg=None, method="CSS-ML"):
+    """Run the Kalman filter of `fitted_model` over the new observations `y`
+    without re-estimating its coefficients."""
+    x = np.append(fitted_model["x"], y)
+    if fitted_model["n_cond"] > 0 or is_constant(fitted_model["x"]):
+        # the state of these models isn't filtered, so we apply them to the whole series
+        old_xreg = fitted_model["xreg"]
+        if "drift" in fitted_model["coef"]:
+            old_xreg = old_xreg[:, 1:] if old_xreg.shape[1] > 1 else None
+        if old_xreg is not None:
+            xreg = np.vstack([old_xreg, xreg])
+        return forward_arima(fitted_model, y=x, xreg=xreg, method=method)
+    coef = fitted_model["coef"]
+    narma = sum(fitted_model["arma"][:4])
+    newxreg = []
+    if "drift" in coef:
+        n = len(fitted_model["x"])
+        newxreg.append(
+            np.arange(n + 1, n + y.size + 1, dtype=np.float64).reshape(-1, 1)
+        )
+    if xreg is not None:
+        newxreg.append(xreg)
+    newxreg = np.hstack(newxreg) if newxreg else None
+    y_adj = y.astype(np.float64)
+    if "intercept" in coef:
+        y_adj = y_adj - coef["intercept"]
+    if newxreg is not None:
+        y_adj = (
+            y_adj
+            - newxreg @ np.array(list(coef.values()))[narma + ("intercept" in coef) :]
+        )
+    mod = fitted_model["model"]
+    a = mod["a"].copy()
+    P = mod["P"].copy()
+    _, _, _, resid = arima_like(
+        y_adj,
+        mod["phi"],
+        mod["theta"],
+        mod["delta"],
+        a,
+        P,
+        mod["Pn"].copy(),
+        -1,
+        True,
+    )
+    return {
+        **fitted_model,
+        "model": {**mod, "a": a, "P": P},
+        "x": x,
+        "residuals": np.append(fitted_model["residuals"], resid),
+        "xreg": None if newxreg is None else np.vstack([fitted_model["xreg"], newxreg]),
+        "fitted": None,
+    }
+
+# %% ../nbs/src/arima.ipynb 117
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -2385,7 +2835,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../nbs/src/arima.ipynb 101
+# %% ../nbs/src/arima.ipynb 119
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -2398,7 +2848,7 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../nbs/src/arima.ipynb 102
+# %% ../nbs/src/arima.ipynb 120
 class AutoARIMA:
     """An AutoARIMA estimator.
 
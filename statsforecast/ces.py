@@ -11,7 +11,7 @@ import numpy as np
 from numba import njit
 from statsmodels.tsa.seasonal import seasonal_decompose
 
-from .ets import restrict_to_bounds, results
+from .ets import nelder_mead_init, nelder_mead_result, nelder_mead_tell
 from .utils import CACHE, NOGIL
 
 # %% ../nbs/src/ces.ipynb 4
@@ -418,105 +418,35 @@ def nelder_mead_ces(
     max_iter: int = 2_000,
     tol_std: float = 1e-10,
     adaptive: bool = False,
+    tol_x: float = 0.0,
+    max_stall: int = 0,
+    init_simplex: np.ndarray = np.empty((0, 0)),
+    batch: bool = False,
 ):
-    # We are trying to minimize the function fn(x, args)
-    # with initial point x0.
-    # Step 0:
-    # get x1, ..., x_{n+1}
-    # the original article suggested a simplex where an initial point is given as x0
-    # with the others generated with a fixed step along each dimension in turn.
-    bounds = len(lower) and len(upper)
-    if bounds:
-        x0 = restrict_to_bounds(x0, lower, upper)
-
-    n = x0.size
-    if adaptive:
-        gamma = 1.0 + 2.0 / n
-        rho = 0.75 - 1.0 / (2.0 * n)
-        sigma = 1.0 - 1.0 / n
-    simplex = np.full(
-        (n + 1, n), fill_value=np.nan, dtype=np.float64
-    )  # each row is x_j
-    simplex[:] = x0
-    # perturb simplex using `init_step`
-    diag = np.copy(np.diag(simplex))
-    diag[diag == 0.0] = zero_pert
-    diag[diag != 0.0] *= 1 + init_step
-    np.fill_diagonal(simplex, diag)
-    # restrict simplex to bounds if passed
-    if bounds:
-        for j in range(n + 1):
-            simplex[j] = restrict_to_bounds(simplex[j], lower, upper)
-    # array of the value of f
-    f_simplex = np.full(n + 1, fill_value=np.nan)
-    for j in range(n + 1):
-        f_simplex[j] = ces_target_fn(simplex[j], *args)
-    for it in range(max_iter):
-        # Step1: order of f_simplex
-        # print(simplex)
-        # print(f_simplex)
-        order_f = f_simplex.argsort()
-        best_idx = order_f[0]
-        worst_idx = order_f[-1]
-        second_worst_idx = order_f[-2]
-        # Check whether method should stop.
-        if np.std(f_simplex) < tol_std:
-            break
-        # calculate centroid except argmax f_simplex
-        x_o = simplex[np.delete(order_f, -1)].sum(axis=0) / n
-        # Step2: Reflection, Compute reflected point
-        x_r = x_o + alpha * (x_o - simplex[worst_idx])
-        # restrict x_r to bounds if passed
-        if bounds:
-            x_r = restrict_to_bounds(x_r, lower, upper)
-        f_r = ces_target_fn(x_r, *args)
-        if f_simplex[best_idx] <= f_r < f_simplex[second_worst_idx]:
-            simplex[worst_idx] = x_r
-            f_simplex[worst_idx] = f_r
-            continue
-        # Step3: Expansion, reflected point is the best point so far
-        if f_r < f_simplex[best_idx]:
-            x_e = x_o + gamma * (x_r - x_o)
-            # restrict x_e to bounds if passed
-            if bounds:
-                x_e = restrict_to_bounds(x_e, lower, upper)
-            f_e = ces_target_fn(x_e, *args)
-            if f_e < f_r:
-                simplex[worst_idx] = x_e
-                f_simplex[worst_idx] = f_e
-            else:
-                simplex[worst_idx] = x_r
-                f_simplex[worst_idx] = f_r
-            continue
-        # Step4: outside Contraction
-        if f_simplex[second_worst_idx] <= f_r < f_simplex[worst_idx]:
-            x_oc = x_o + rho * (x_r - x_o)
-            if bounds:
-                x_oc = restrict_to_bounds(x_oc, lower, upper)
-            f_oc = ces_target_fn(x_oc, *args)
-            if f_oc <= f_r:
-                simplex[worst_idx] = x_oc
-                f_simplex[worst_idx] = f_oc
-                continue
-        # step 5 inside contraction
-        else:
-            x_ic = x_o - rho * (x_r - x_o)
-            # restrict x_c to bounds if passed
-            if bounds:
-                x_ic = restrict_to_bounds(x_ic, lower, upper)
-            f_ic = ces_target_fn(x_ic, *args)
-            if f_ic < f_simplex[worst_idx]:
-                simplex[worst_idx] = x_ic
-                f_simplex[worst_idx] = f_ic
-                continue
-        # step 6: shrink
-        simplex[np.delete(order_f, 0)] = simplex[best_idx] + sigma * (
-            simplex[np.delete(order_f, 0)] - simplex[best_idx]
-        )
-        for i in np.delete(order_f, 0):
-            simplex[i] = restrict_to_bounds(simplex[i], lower, upper)
-            f_simplex[i] = ces_target_fn(simplex[i], *args)
-    return results(simplex[best_idx], f_simplex[best_idx], it + 1, simplex)
+    state = nelder_mead_init(
+        x0,
+        lower,
+        upper,
+        init_step,
+        zero_pert,
+        alpha,
+        gamma,
+        rho,
+        sigma,
+        max_iter,
+        tol_std,
+        adaptive,
+        tol_x,
+        max_stall,
+        init_simplex,
+        batch,
+    )
+    n_points = state.points.shape[0]
+    while n_points:
+        for j in range(n_points):
+            state.fvals[j] = ces_target_fn(state.points[j], *args)
+        n_points = nelder_mead_tell(state)
+    return nelder_mead_result(state)
 
 # %% ../nbs/src/ces.ipynb 27
 def optimize_ces_target_fn(
@@ -678,46 +608,140 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     return forecast
 
 # %% ../nbs/src/ces.ipynb 31
-def _simulate_pred_intervals(model, h, level):
-    np.random.seed(1)
-    nsim = 5000
-    y_path = np.zeros([nsim, h])
-
-    for k in range(nsim):
-        e = np.random.normal(0, np.sqrt(model["sigma2"]), model["states"].shape)
-        states = model["states"]
-        fcsts = np.zeros(h, dtype=np.float32)
-        cesforecast(
-            states=states + e,
-            n=model["n"],
-            m=model["m"],
-            season=switch_ces(model["seasontype"]),
-            h=h,
-            f=fcsts,
-            **model["par"],
-        )
-        y_path[k,] = fcsts
+@njit(nogil=NOGIL, cache=CACHE)
+def cessimulate(states, sigma, noise, season, h, par):
+    # states are the last m filtered states of several models, one model by row, and
+    # noise the standard normal perturbations of the states, shared by all the models
+    n_models, m = states.shape[:2]
+    n_paths = noise.shape[0]
+    paths = np.empty((n_models, n_paths, h))
+    f = np.zeros(h, dtype=np.float32)
+    for i in range(n_models):
+        for k in range(n_paths):
+            cesfcst(
+                states[i] + sigma[i] * noise[k],
+                m,
+                m,
+                season[i],
+                f,
+                h,
+                par[i, 0],
+                par[i, 1],
+                par[i, 2],
+                par[i, 3],
+            )
+            paths[i, k] = f
+    return paths
 
-    lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
-    upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
+# %% ../nbs/src/ces.ipynb 32
+def _simulate_quantiles(states, sigma, season, par, h, level, n_samples, seed):
+    # quantiles of the simulated paths, with shape (len(level), n_models, h)
+    noise = np.random.default_rng(seed).standard_normal((n_samples, *states.shape[1:]))
+    lower = np.empty((len(level), states.shape[0], h))
+    upper = np.empty_like(lower)
+    # bound the memory used by the paths
+    chunk_size = max(1, 2**24 // (n_samples * h))
+    for start in range(0, states.shape[0], chunk_size):
+        rows = slice(start, start + chunk_size)
+        y_path = cessimulate(
+            states[rows], sigma[rows], noise, season[rows], h, par[rows]
+        )
+        lower[:, rows] = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=1)
+        upper[:, rows] = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=1)
+    return lower, upper
+
+
+def _simulate_pred_intervals(model, h, level, n_samples=5_000, seed=1):
+    # only the states the forecasts start from are perturbed
+    m = 1 if model["seasontype"] == "N" else model["m"]
+    n = model["n"]
+    states = model["states"][n : n + m]
+    lower, upper = _simulate_quantiles(
+        states=states[None],
+        sigma=np.sqrt([model["sigma2"]]),
+        season=np.array([switch_ces(model["seasontype"])]),
+        par=np.array(
+            [[model["par"][k] for k in ["alpha_0", "alpha_1", "beta_0", "beta_1"]]]
+        ),
+        h=h,
+        level=level,
+        n_samples=n_samples,
+        seed=seed,
+    )
     pi = {
-        **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
-        **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
+        **{f"lo-{lv}": lower[i, 0] for i, lv in enumerate(level)},
+        **{f"hi-{lv}": upper[i, 0] for i, lv in enumerate(level)},
     }
 
     return pi
 
-# %% ../nbs/src/ces.ipynb 32
-def forecast_ces(obj, h, level=None):
+# %% ../nbs/src/ces.ipynb 33
+def forecast_ces(obj, h, level=None, n_samples=5_000, seed=1):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
     out["fitted"] = obj["fitted"]
     if level is not None:
-        pi = _simulate_pred_intervals(model=obj, h=h, level=level)
+        pi = _simulate_pred_intervals(
+            model=obj, h=h, level=level, n_samples=n_samples, seed=seed
+        )
         out = {**out, **pi}
     return out
 
 # %% ../nbs/src/ces.ipynb 34
+@njit(nogil=NOGIL, cache=CACHE)
+def cesforecast_many(states, season, h, par):
+    # forecasts of several models from the states of their last season, one model by row
+    n_models, m = states.shape[:2]
+    f = np.full((n_models, h), np.nan)
+    for i in range(n_models):
+        cesfcst(
+            states[i],
+            m,
+            m,
+            season[i],
+            f[i],
+            h,
+            par[i, 0],
+            par[i, 1],
+            par[i, 2],
+            par[i, 3],
+        )
+    return f
+
+
+def forecast_ces_compact(params, h, level=None, n_samples=5_000, seed=1):
+    """Forecast several models from their stacked season types, parameters, last states
+    and variances, as stored by `AutoCES`.
+
+    Returns arrays with one row per model."""
+    seasontypes, inverse = np.unique(params["seasontype"], return_inverse=True)
+    season = np.array([switch_ces(seasontype) for seasontype in seasontypes])[
+        inverse.ravel()
+    ]
+    sigma = np.sqrt(params["sigma2"])
+    par = params["par"]
+    n_models = par.shape[0]
+    out = {"mean": np.empty((n_models, h))}
+    if level is not None:
+        lower = np.empty((len(level), n_models, h))
+        upper = np.empty_like(lower)
+    # models with the same number of states are forecasted together
+    shapes, groups = np.unique(params["n_states"], axis=0, return_inverse=True)
+    groups = groups.ravel()
+    for i, (n_rows, n_cols) in enumerate(shapes):
+        idxs = np.where(groups == i)[0]
+        states = params["states"][idxs, :n_rows, :n_cols]
+        out["mean"][idxs] = cesforecast_many(states, season[idxs], h, par[idxs])
+        if level is not None:
+            lower[:, idxs], upper[:, idxs] = _simulate_quantiles(
+                states, sigma[idxs], season[idxs], par[idxs], h, level, n_samples, seed
+            )
+    if level is not None:
+        out.update({f"lo-{lv}": lower[i] for i, lv in enumerate(level)})
+        out.update({f"hi-{lv}": upper[i] for i, lv in enumerate(level)})
+    return out
+
+# %% ../nbs/src/ces.ipynb 36
 def auto_ces(
     y,
     m,
@@ -782,7 +806,7 @@ def auto_ces(
         raise Exception("no model able to be fitted")
     return model
 
-# %% ../nbs/src/ces.ipynb 37
+# %% ../nbs/src/ces.ipynb 41
 def forward_ces(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["seasontype"]
@@ -799,3 +823,37 @@ def forward_ces(fitted_model, y):
         beta_0=beta_0,
         beta_1=beta_1,
     )
+
+# %% ../nbs/src/ces.ipynb 43
+def update_ces(fitted_model, y):
+    """Advance the states of `fitted_model` with the new observations `y`
+    without re-estimating its parameters."""
+    m = fitted_model["m"]
+    n = fitted_model["n"]
+    old_states = fitted_model["states"]
+    # the last m rows of the states hold the forecast, so we start from the filtered ones
+    states = np.zeros((y.size + 2 * m, old_states.shape[1]), dtype=np.float32)
+    states[:m] = old_states[n : n + m]
+    e = np.full_like(y, fill_value=np.nan)
+    amse = np.full(1, fill_value=np.nan)
+    cescalc(
+        y=y,
+        states=states,
+        m=m,
+        season=switch_ces(fitted_model["seasontype"]),
+        e=e,
+        amse=amse,
+        nmse=1,
+        backfit=0,
+        **fitted_model["par"],
+    )
+    residuals = np.concatenate([fitted_model["residuals"], e])
+    np_ = old_states.shape[1] + 1
+    return {
+        **fitted_model,
+        "residuals": residuals,
+        "fitted": np.concatenate([fitted_model["fitted"], y - e]),
+        "states": np.vstack([old_states[: n + m], states[m:]]),
+        "n": n + y.size,
+        "sigma2": np.sum(residuals**2) / (residuals.size - np_ - 1),
+    }
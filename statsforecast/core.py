@@ -7,14 +7,17 @@ __all__ = ['StatsForecast']
 import datetime as dt
 import errno
 import inspect
+import json
 import logging
 import os
 import pickle
 import re
 import reprlib
+import tempfile
 import warnings
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -29,7 +32,7 @@ from utilsforecast.compat import DataFrame, pl_DataFrame, pl_Series
 from utilsforecast.grouped_array import GroupedArray as BaseGroupedArray
 from utilsforecast.validation import ensure_time_dtype, validate_freq
 
-from .utils import ConformalIntervals
+from .utils import NOGIL, ConformalIntervals, _stack_padded
 
 # %% ../nbs/src/core/core.ipynb 7
 if __name__ == "__main__":
@@ -40,6 +43,151 @@ if __name__ == "__main__":
 logger = logging.getLogger(__name__)
 
 # %% ../nbs/src/core/core.ipynb 10
+def _series_costs(sizes, models):
+    """Rough relative cost of running `models` on series with `sizes` observations."""
+    sizes = sizes.astype(np.float64)
+    costs = np.zeros_like(sizes)
+    for model in models:
+        # automatic models optimize several candidates, their cost grows faster than the size
+        exponent = 1.5 if type(model).__name__.startswith("Auto") else 1.0
+        cost = sizes**exponent
+        # seasonal components are only estimated when there are two full seasons
+        season_length = getattr(model, "season_length", 1)
+        if isinstance(season_length, (int, np.integer)) and season_length > 1:
+            cost *= np.where(sizes >= 2 * season_length, np.log2(season_length), 1.0)
+        costs += cost
+    return costs
+
+
+def _split_idxs(n_groups, n_chunks, costs=None):
+    """Split the series in contiguous chunks with a similar total cost."""
+    n_chunks = min(n_chunks, n_groups)
+    if costs is None:
+        return np.array_split(np.arange(n_groups), n_chunks)
+    cum_costs = np.cumsum(costs)
+    targets = cum_costs[-1] * np.arange(1, n_chunks) / n_chunks
+    # assign each serie to the chunk where its middle point falls
+    cuts = np.searchsorted(cum_costs - costs / 2, targets, side="right")
+    # every chunk must have at least one serie
+    offsets = np.arange(1, n_chunks)
+    cuts = (
+        np.maximum.accumulate(np.clip(cuts - offsets, 0, n_groups - n_chunks)) + offsets
+    )
+    return np.split(np.arange(n_groups), cuts)
+
+# %% ../nbs/src/core/core.ipynb 12
+class _CompactModels:
+    """Fitted models of a single column stored as arrays with one row per serie.
+
+    The unfitted `model` computes the forecasts of all the series at once
+    from the stacked `params` through its `batch_predict` method.
+    Arrays with different shapes across series, like the state spaces of
+    ARIMA models of different orders, are padded with zeros.
+    """
+
+    def __init__(self, model, params: Dict[str, np.ndarray]):
+        self.model = model
+        self.params = params
+
+    @staticmethod
+    def supports(model, fitted_models, attr: str = "_compact") -> bool:
+        # conformal intervals need the scores of each serie
+        # and the series that used the fallback model are kept as objects
+        return (
+            hasattr(model, attr)
+            and getattr(model, "prediction_intervals", None) is None
+            and all(type(fitted) is type(model) for fitted in fitted_models)
+        )
+
+    @classmethod
+    def from_fitted(cls, model, fitted_models) -> Optional["_CompactModels"]:
+        rows = [fitted._compact() for fitted in fitted_models]
+        if any(row is None for row in rows):
+            # e.g. models that need the exogenous regressors to predict
+            return None
+        params = {key: _stack_padded([row[key] for row in rows]) for key in rows[0]}
+        return cls(model, params)
+
+    def __len__(self):
+        return len(next(iter(self.params.values())))
+
+    def take(self, idxs):
+        return _CompactModels(self.model, {k: v[idxs] for k, v in self.params.items()})
+
+    def predict(self, h, level=None):
+        return self.model.batch_predict(params=self.params, h=h, level=level)
+
+
+class _CompactFitted:
+    """Fitted models stored by column.
+
+    Columns of models that support it are `_CompactModels`,
+    the rest keep an array with the fitted model of each serie.
+    """
+
+    def __init__(self, columns: List[Union[_CompactModels, np.ndarray]]):
+        self.columns = columns
+
+    @classmethod
+    def from_fitted(cls, fm, models):
+        columns = []
+        for i_model, model in enumerate(models):
+            col = fm[:, i_model]
+            if _CompactModels.supports(model, col):
+                compact = _CompactModels.from_fitted(model, col)
+                if compact is not None:
+                    col = compact
+            columns.append(col)
+        return cls(columns)
+
+    @property
+    def shape(self):
+        return len(self.columns[0]), len(self.columns)
+
+    def __getitem__(self, idxs):
+        # selects series, like the rows of the array of fitted models
+        return _CompactFitted(
+            [
+                col.take(idxs) if isinstance(col, _CompactModels) else col[idxs]
+                for col in self.columns
+            ]
+        )
+
+
+def _warm_start_models(fitted, idxs):
+    """Fitted models of the rows `idxs` of `fitted` to warm start the next fit.
+
+    The entries of the new series (`idxs == -1`) and of the compact columns are None.
+    """
+    if isinstance(fitted, _CompactFitted):
+        columns = fitted.columns
+    else:
+        columns = [fitted[:, i_model] for i_model in range(fitted.shape[1])]
+    fm = np.full((idxs.size, len(columns)), None, dtype=object)
+    seen = idxs >= 0
+    for i_model, col in enumerate(columns):
+        if isinstance(col, np.ndarray):
+            fm[seen, i_model] = col[idxs[seen]]
+    return fm
+
+# %% ../nbs/src/core/core.ipynb 13
+def _append_to_groups(data, indptr, new_data, new_indptr, idxs):
+    """Append the groups of `new_data` at the end of the groups `idxs` of `data`."""
+    sizes = np.diff(indptr)
+    new_sizes = np.zeros_like(sizes)
+    new_sizes[idxs] = np.diff(new_indptr)
+    out_indptr = np.append(0, np.cumsum(sizes + new_sizes))
+    out = np.empty((out_indptr[-1], *data.shape[1:]), dtype=data.dtype)
+    # each row keeps its position inside its group, the groups are shifted
+    old_pos = np.repeat(out_indptr[:-1] - indptr[:-1], sizes) + np.arange(indptr[-1])
+    new_pos = np.repeat(
+        out_indptr[idxs] + sizes[idxs] - new_indptr[:-1], np.diff(new_indptr)
+    ) + np.arange(new_indptr[-1])
+    out[old_pos] = data
+    out[new_pos] = new_data
+    return out, out_indptr
+
+# %% ../nbs/src/core/core.ipynb 14
 class GroupedArray(BaseGroupedArray):
     def __eq__(self, other):
         if not hasattr(other, "data") or not hasattr(other, "indptr"):
@@ -48,12 +196,45 @@ class GroupedArray(BaseGroupedArray):
             self.indptr, other.indptr
         )
 
-    def fit(self, models, fallback_model=None):
+    def fit(self, models, fallback_model=None, warm_start_fm=None):
         fm = np.full((self.n_groups, len(models)), np.nan, dtype=object)
         for i, grp in enumerate(self):
             y = grp[:, 0] if grp.ndim == 2 else grp
             X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             for i_model, model in enumerate(models):
+                kwargs = {}
+                if (
+                    warm_start_fm is not None
+                    and model.warm_starts
+                    and warm_start_fm[i, i_model] is not None
+                ):
+                    kwargs["warm_start_from"] = warm_start_fm[i, i_model]
+                try:
+                    new_model = model.new()
+                    fm[i, i_model] = new_model.fit(y=y, X=X, **kwargs)
+                except Exception as error:
+                    if fallback_model is not None:
+                        new_fallback_model = fallback_model.new()
+                        fm[i, i_model] = new_fallback_model.fit(y=y, X=X)
+                    else:
+                        raise error
+        return fm
+
+    def update(self, fm, new, idxs, models, fallback_model=None):
+        # self has the full history of the series and new the last values of the series idxs
+        for grp_new, i in zip(new, idxs):
+            y_new = grp_new[:, 0] if grp_new.ndim == 2 else grp_new
+            X_new = (
+                grp_new[:, 1:] if (grp_new.ndim == 2 and grp_new.shape[1] > 1) else None
+            )
+            for i_model, model in enumerate(models):
+                if hasattr(fm[i, i_model], "update"):
+                    # advance the states with the new values only
+                    fm[i, i_model] = fm[i, i_model].update(y=y_new, X=X_new)
+                    continue
+                grp = self[i]
+                y = grp[:, 0] if grp.ndim == 2 else grp
+                X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
                 try:
                     new_model = model.new()
                     fm[i, i_model] = new_model.fit(y=y, X=X)
@@ -95,32 +276,63 @@ class GroupedArray(BaseGroupedArray):
     def predict(self, fm, h, X=None, level=tuple()):
         # fm stands for fitted_models
         # and fm should have fitted_model
+        if isinstance(fm, _CompactFitted):
+            columns = fm.columns
+        else:
+            columns = [fm[:, i_model] for i_model in range(fm.shape[1])]
+        models = [
+            col.model if isinstance(col, _CompactModels) else col[0] for col in columns
+        ]
         fcsts, cuts, has_level_models = self._output_fcst(
-            models=fm[0], attr="predict", h=h, X=X, level=level
+            models=models, attr="predict", h=h, X=X, level=level
         )
         matches = ["mean", "lo", "hi"]
         cols = []
-        for i_model in range(fm.shape[1]):
+        for i_model, col in enumerate(columns):
             has_level = has_level_models[i_model]
             kwargs = {}
             if has_level:
                 kwargs["level"] = level
+            if isinstance(col, _CompactModels):
+                # all the series are predicted at once from the stacked arrays
+                res = col.predict(h=h, **kwargs)
+                model_name = repr(col.model)
+            elif X is None and _CompactModels.supports(
+                col[0], col, attr="batch_predict_fitted"
+            ):
+                # the fitted models predict all the series in a single call
+                res = col[0].batch_predict_fitted(fitted_models=col, h=h, **kwargs)
+                model_name = repr(col[0])
+            else:
+                res = None
+            if res is not None:
+                cols_m = [
+                    key for key in res.keys() if any(key.startswith(m) for m in matches)
+                ]
+                fcsts[:, cuts[i_model] : cuts[i_model + 1]] = np.vstack(
+                    [res[key] for key in cols_m]
+                ).T
+                cols += [
+                    f"{model_name}" if c == "mean" else f"{model_name}-{c}"
+                    for c in cols_m
+                ]
+                continue
             for i, _ in enumerate(self):
                 if X is not None:
                     X_ = X[i]
                 else:
                     X_ = None
-                res_i = fm[i, i_model].predict(h=h, X=X_, **kwargs)
+                res_i = col[i].predict(h=h, X=X_, **kwargs)
                 cols_m = [
                     key
                     for key in res_i.keys()
                     if any(key.startswith(m) for m in matches)
                 ]
                 fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                model_name = repr(fm[i, i_model])
+                model_name = repr(col[i])
                 cols_m = [
-                    f"{model_name}" if col == "mean" else f"{model_name}-{col}"
-                    for col in cols_m
+                    f"{model_name}" if c == "mean" else f"{model_name}-{c}"
+                    for c in cols_m
                 ]
                 if fcsts_i.ndim == 1:
                     fcsts_i = fcsts_i[:, None]
@@ -146,6 +358,19 @@ class GroupedArray(BaseGroupedArray):
         verbose=False,
         target_col="y",
     ):
+        if self._can_forecast_batch(models=models, X=X, level=level):
+            try:
+                return self._forecast_batch(
+                    models=models,
+                    h=h,
+                    fitted=fitted,
+                    level=level,
+                    target_col=target_col,
+                )
+            except Exception as error:
+                if fallback_model is None:
+                    raise error
+                # the loop below applies the fallback model serie by serie
         fcsts, cuts, has_level_models = self._output_fcst(
             models=models, attr="forecast", h=h, X=X, level=level
         )
@@ -232,6 +457,69 @@ class GroupedArray(BaseGroupedArray):
             result["fitted"]["cols"] = [target_col] + cols_fitted
         return result
 
+    def _can_forecast_batch(self, models, X=None, level=tuple()):
+        # models with a `batch_forecast` method compute all the series in one pass,
+        # they only use the target and their native prediction intervals
+        if X is not None or (self.data.ndim == 2 and self.data.shape[1] > 1):
+            return False
+        if not all(hasattr(model, "batch_forecast") for model in models):
+            return False
+        return not level or all(
+            getattr(model, "prediction_intervals", None) is None for model in models
+        )
+
+    def _forecast_batch(self, models, h, fitted=False, level=tuple(), target_col="y"):
+        fcsts, cuts, has_level_models = self._output_fcst(
+            models=models, attr="batch_forecast", h=h, X=None, level=level
+        )
+        matches = ["mean", "lo", "hi"]
+        matches_fitted = ["fitted", "fitted-lo", "fitted-hi"]
+        y = self.data[:, 0] if self.data.ndim == 2 else self.data
+        if fitted:
+            fitted_vals = np.full(
+                (self.data.shape[0], 1 + cuts[-1]), np.nan, dtype=np.float32
+            )
+            fitted_vals[:, 0] = y
+        cols = []
+        cols_fitted = []
+        for i_model, model in enumerate(models):
+            kwargs = {}
+            if has_level_models[i_model]:
+                kwargs["level"] = level
+            res = model.batch_forecast(
+                data=y, indptr=self.indptr, h=h, fitted=fitted, **kwargs
+            )
+            cols_m = [
+                key for key in res.keys() if any(key.startswith(m) for m in matches)
+            ]
+            fcsts[:, cuts[i_model] : cuts[i_model + 1]] = np.vstack(
+                [res[key] for key in cols_m]
+            ).T
+            cols += [
+                f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
+                for col in cols_m
+            ]
+            if fitted:
+                cols_m_fitted = [
+                    key
+                    for key in res.keys()
+                    if any(key.startswith(m) for m in matches_fitted)
+                ]
+                fitted_vals[
+                    :, (cuts[i_model] + 1) : (cuts[i_model + 1] + 1)
+                ] = np.vstack([res[key] for key in cols_m_fitted]).T
+                cols_fitted += [
+                    f"{repr(model)}"
+                    if col == "fitted"
+                    else f"{repr(model)}-{col.replace('fitted-', '')}"
+                    for col in cols_m_fitted
+                ]
+        result = {"forecasts": fcsts, "cols": cols}
+        if fitted:
+            result["fitted"] = {"values": fitted_vals}
+            result["fitted"]["cols"] = [target_col] + cols_fitted
+        return result
+
     def cross_validation(
         self,
         models,
@@ -266,6 +554,9 @@ class GroupedArray(BaseGroupedArray):
             last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
         matches = ["mean", "lo", "hi"]
         steps = list(range(-test_size, -h + 1, step_size))
+        # when the training window expands and the models aren't refitted,
+        # the models whose update matches forward only process the new values of each window
+        incremental = refit is not True and input_size is None and not fitted
         for i_ts, grp in enumerate(self):
             iterable = tqdm(
                 enumerate(steps, start=0),
@@ -324,21 +615,37 @@ class GroupedArray(BaseGroupedArray):
                     else:
                         if should_fit:
                             try:
-                                fitted_models[i_model] = model.fit(y=y_train, X=X_train)
+                                fitted_models[i_model] = model.new().fit(
+                                    y=y_train, X=X_train
+                                )
                             except Exception as error:
                                 if fallback_model is None:
                                     raise error
                                 fitted_models[i_model] = fallback_model.new().fit(
                                     y=y_train, X=X_train
                                 )
-                        res_i = fitted_models[i_model].forward(
-                            h=h,
-                            y=y_train,
-                            X=X_train,
-                            X_future=X_future,
-                            fitted=fitted,
-                            **kwargs,
-                        )
+                        fitted_model = fitted_models[i_model]
+                        if (
+                            incremental
+                            and not should_fit
+                            and getattr(fitted_model, "update_matches_forward", False)
+                            and getattr(fitted_model, "prediction_intervals", None)
+                            is None
+                        ):
+                            fitted_model.update(
+                                y=y_train[-step_size:],
+                                X=X_train[-step_size:] if X_train is not None else None,
+                            )
+                            res_i = fitted_model.predict(h=h, X=X_future, **kwargs)
+                        else:
+                            res_i = fitted_model.forward(
+                                h=h,
+                                y=y_train,
+                                X=X_train,
+                                X_future=X_future,
+                                fitted=fitted,
+                                **kwargs,
+                            )
                     cols_m = [
                         key
                         for key in res_i.keys()
@@ -373,20 +680,13 @@ class GroupedArray(BaseGroupedArray):
         data, indptr = super().take(idxs)
         return GroupedArray(data, indptr)
 
-    def split(self, n_chunks):
-        n_chunks = min(n_chunks, self.n_groups)
-        return [
-            self.take(idxs) for idxs in np.array_split(range(self.n_groups), n_chunks)
-        ]
+    def split(self, n_chunks, costs=None):
+        return [self.take(idxs) for idxs in _split_idxs(self.n_groups, n_chunks, costs)]
 
-    def split_fm(self, fm, n_chunks):
-        return [
-            fm[idxs]
-            for idxs in np.array_split(range(self.n_groups), n_chunks)
-            if idxs.size
-        ]
+    def split_fm(self, fm, n_chunks, costs=None):
+        return [fm[idxs] for idxs in _split_idxs(self.n_groups, n_chunks, costs)]
 
-# %% ../nbs/src/core/core.ipynb 24
+# %% ../nbs/src/core/core.ipynb 31
 def _get_n_jobs(n_groups, n_jobs):
     if n_jobs == -1 or (n_jobs is None):
         actual_n_jobs = os.cpu_count()
@@ -394,7 +694,260 @@ def _get_n_jobs(n_groups, n_jobs):
         actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../nbs/src/core/core.ipynb 27
+# %% ../nbs/src/core/core.ipynb 34
+def _warm_up_worker(models):
+    # compile the models' functions once per persistent worker
+    y = 10 + np.sin(np.arange(50)) + np.arange(50) / 10
+    ga = GroupedArray(y[:, None], np.array([0, y.size]))
+    for model in models:
+        try:
+            ga.forecast(models=[model], h=2)
+        except Exception:
+            pass
+
+# %% ../nbs/src/core/core.ipynb 35
+class _MemmapChunk:
+    """Contiguous group of series stored in a memory-mapped file.
+
+    Only the path and the offsets are sent to the workers, which map the
+    file instead of receiving a pickled copy of the data, and write their
+    outputs in place in files shared by all the chunks.
+    """
+
+    def __init__(self, path, start, end, indptr, group_start=0, outdir=None):
+        self.path = path
+        self.start = start
+        self.end = end
+        self.indptr = indptr
+        self.group_start = group_start
+        self.outdir = os.path.dirname(path) if outdir is None else outdir
+
+    def load(self):
+        # copy on write, the models never modify the file
+        data = np.load(self.path, mmap_mode="c")[self.start : self.end]
+        return GroupedArray(np.asarray(data), self.indptr)
+
+    def run(self, method, *args, **kwargs):
+        args = [arg.load() if isinstance(arg, _MemmapChunk) else arg for arg in args]
+        kwargs = {
+            k: v.load() if isinstance(v, _MemmapChunk) else v for k, v in kwargs.items()
+        }
+        return self._output(getattr(self.load(), method)(*args, **kwargs))
+
+    def _output(self, res, key="out"):
+        # the arrays are written to the rows of the chunk in a file shared by all the chunks
+        # instead of being pickled back to the caller, the fitted models are objects
+        # and still go through pickle
+        if isinstance(res, np.ndarray) and res.dtype != object:
+            # the fitted values have one row by observation, the other outputs by serie
+            if "fitted" in key:
+                first, n_units = self.start, self.end - self.start
+            else:
+                first, n_units = self.group_start, self.indptr.size - 1
+            row_size = res[:1].nbytes
+            path = os.path.join(self.outdir, f"{key}.bin")
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0))
+            with os.fdopen(fd, "wb") as f:
+                f.seek(first * (res.shape[0] // n_units) * row_size)
+                res.tofile(f)
+            return _SavedResult(path, res.dtype, res.shape[1:])
+        if isinstance(res, dict):
+            return {k: self._output(v, f"{key}-{k}") for k, v in res.items()}
+        if isinstance(res, tuple):
+            return tuple(self._output(v, f"{key}-{i}") for i, v in enumerate(res))
+        return res
+
+
+class _SavedResult:
+    """Array written in place by all the workers to a file next to their inputs."""
+
+    def __init__(self, path, dtype, row_shape):
+        self.path = path
+        self.dtype = dtype
+        self.row_shape = row_shape
+
+    def load(self):
+        res = np.fromfile(self.path, dtype=self.dtype).reshape(-1, *self.row_shape)
+        os.remove(self.path)
+        return res
+
+
+def _gather_results(outs):
+    """Combine the outputs of the chunks in a single one.
+
+    The files written by the workers hold the output of all the chunks
+    and are read once, the other arrays are concatenated."""
+    first = outs[0]
+    if isinstance(first, _SavedResult):
+        return first.load()
+    if isinstance(first, np.ndarray):
+        return np.concatenate(outs)
+    if isinstance(first, dict):
+        return {k: _gather_results([out[k] for out in outs]) for k in first}
+    if isinstance(first, tuple):
+        return tuple(_gather_results(list(out)) for out in zip(*outs))
+    # e.g. the names of the columns, which are the same for all the chunks
+    return first
+
+
+@contextmanager
+def _memmap_split(ga, n_chunks, costs=None, path=None):
+    """Split `ga` in `_MemmapChunk`s of the file `path`, which must hold its data.
+
+    If `path` is None the data is saved to a temporary file.
+    The outputs of the chunks are written to a temporary directory,
+    both are deleted when exiting the context."""
+    with ExitStack() as stack:
+        if path is None:
+            outdir = stack.enter_context(tempfile.TemporaryDirectory())
+            path = os.path.join(outdir, "data.npy")
+            np.save(path, ga.data)
+        else:
+            outdir = stack.enter_context(
+                tempfile.TemporaryDirectory(dir=os.path.dirname(path))
+            )
+        chunks = []
+        for idxs in _split_idxs(ga.n_groups, n_chunks, costs):
+            indptr = ga.indptr[idxs[0] : idxs[-1] + 2]
+            chunks.append(
+                _MemmapChunk(
+                    path, indptr[0], indptr[-1], indptr - indptr[0], idxs[0], outdir
+                )
+            )
+        yield chunks
+
+
+class _SharedChunk(_MemmapChunk):
+    """Contiguous group of series that is a view of the caller's data.
+
+    Used with thread workers, which share the memory of the caller.
+    """
+
+    def __init__(self, ga):
+        self.ga = ga
+
+    def load(self):
+        return self.ga
+
+    def _output(self, res):
+        # the caller gets the arrays without copies
+        return res
+
+
+@contextmanager
+def _shared_split(ga, n_chunks, costs=None):
+    """Split `ga` in `_SharedChunk`s without copying its data."""
+    chunks = []
+    for idxs in _split_idxs(ga.n_groups, n_chunks, costs):
+        indptr = ga.indptr[idxs[0] : idxs[-1] + 2]
+        data = ga.data[indptr[0] : indptr[-1]]
+        chunks.append(_SharedChunk(GroupedArray(data, indptr - indptr[0])))
+    yield chunks
+
+# %% ../nbs/src/core/core.ipynb 37
+def _read_parquet_batches(path):
+    import pyarrow.dataset as ds
+
+    # the fragments are read sequentially to keep the order of the rows
+    # and without read ahead, so only a batch is kept in memory
+    for fragment in ds.dataset(path, format="parquet").get_fragments():
+        for batch in fragment.to_batches(batch_readahead=0, fragment_readahead=0):
+            yield batch.to_pandas()
+
+
+def _iter_series_batches(dfs, batch_size, id_col):
+    pending = None
+    for df in dfs:
+        if pending is not None:
+            df = ufp.vertical_concat([pending, df])
+        ids = df[id_col].to_numpy()
+        starts = np.append(0, np.where(ids[1:] != ids[:-1])[0] + 1)
+        # the last serie of the chunk can continue in the next one
+        n_complete = (starts.size - 1) // batch_size * batch_size
+        for i in range(0, n_complete, batch_size):
+            yield ufp.take_rows(df, np.arange(starts[i], starts[i + batch_size]))
+        pending = ufp.take_rows(df, np.arange(starts[n_complete], ids.size))
+    if pending is None or not pending.shape[0]:
+        return
+    ids = pending[id_col].to_numpy()
+    starts = np.append(np.append(0, np.where(ids[1:] != ids[:-1])[0] + 1), ids.size)
+    for i in range(0, starts.size - 1, batch_size):
+        yield ufp.take_rows(
+            pending, np.arange(starts[i], starts[min(i + batch_size, starts.size - 1)])
+        )
+
+
+def _group_by_id(ids):
+    """Order of the rows that groups them by id, sorted ids and where each serie starts and ends."""
+    order = np.argsort(ids, kind="stable")
+    uids, starts = np.unique(ids[order], return_index=True)
+    return order, uids, starts, np.append(starts[1:], ids.size)
+
+
+def _group_rows(order, starts, ends, pos):
+    """Rows of the series in positions `pos` of the grouped ids."""
+    sizes = ends[pos] - starts[pos]
+    offsets = np.repeat(starts[pos] - np.cumsum(sizes) + sizes, sizes)
+    return order[offsets + np.arange(sizes.sum())]
+
+
+def _iter_frame_batches(df, batch_size, id_col):
+    """Batches of `batch_size` series of `df` sorted by id, only a batch is copied at a time."""
+    if isinstance(df, pd.DataFrame) and df.index.name == id_col:
+        ids = df.index.to_numpy()
+    else:
+        ids = df[id_col].to_numpy()
+    order, uids, starts, ends = _group_by_id(ids)
+    for i in range(0, uids.size, batch_size):
+        pos = np.arange(i, min(i + batch_size, uids.size))
+        yield ufp.take_rows(df, _group_rows(order, starts, ends, pos))
+
+
+def _with_X_batches(batches, X_df, batch_size, id_col):
+    """Pair each batch of series with the rows of `X_df` of its series."""
+    if X_df is None:
+        for batch in batches:
+            yield batch, None
+        return
+    if isinstance(X_df, (pd.DataFrame, pl_DataFrame)):
+        # the frame is grouped by id once, so each batch only takes its own rows
+        order, uids, starts, ends = _group_by_id(X_df[id_col].to_numpy())
+        for batch in batches:
+            batch_uids = np.unique(batch[id_col].to_numpy())
+            pos = np.minimum(np.searchsorted(uids, batch_uids), uids.size - 1)
+            pos = pos[uids[pos] == batch_uids]
+            yield batch, ufp.take_rows(X_df, _group_rows(order, starts, ends, pos))
+        return
+    # the future exogenous are read by batches like the series
+    if isinstance(X_df, (str, Path)):
+        X_df = _read_parquet_batches(X_df)
+    X_batches = _iter_series_batches(X_df, batch_size=batch_size, id_col=id_col)
+    for batch in batches:
+        X_batch = next(X_batches, None)
+        if X_batch is None or not np.array_equal(
+            np.unique(X_batch[id_col].to_numpy()), np.unique(batch[id_col].to_numpy())
+        ):
+            raise ValueError(
+                "The series of `X_df` must be in the same order as the ones of `df`."
+            )
+        yield batch, X_batch
+
+# %% ../nbs/src/core/core.ipynb 39
+# version of the directory format written by `StatsForecast.save`
+_SAVE_FORMAT_VERSION = 1
+
+
+def _load_models(path, offsets, idxs=None):
+    """Unpickle the models stored one after the other in `path`, only the ones in `idxs` if given."""
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    if idxs is None:
+        idxs = range(offsets.size - 1)
+    models = np.empty(len(idxs), dtype=object)
+    for i, idx in enumerate(idxs):
+        models[i] = pickle.loads(buffer[offsets[idx] : offsets[idx + 1]])
+    return models
+
+# %% ../nbs/src/core/core.ipynb 40
 def _warn_df_constructor():
     warnings.warn(
         "The `df` argument of the StatsForecast constructor as well as reusing stored "
@@ -425,7 +978,7 @@ def _warn_id_as_idx():
 def _id_as_idx() -> bool:
     return not bool(os.getenv("NIXTLA_ID_AS_COL", ""))
 
-# %% ../nbs/src/core/core.ipynb 28
+# %% ../nbs/src/core/core.ipynb 41
 _param_descriptions = {
     "freq": """freq : str or int
             Frequency of the data. Must be a valid pandas or polars offset alias, or an integer.""",
@@ -457,6 +1010,11 @@ _param_descriptions = {
             Number of jobs used in the parallel processing, use -1 for all cores.""",
     "verbose": """verbose : bool (default=True)
             Prints TQDM progress bar when `n_jobs=1`.""",
+    "backend": """backend : str (default='processes')
+            Workers used when `n_jobs != 1`, 'processes' or 'threads'.
+            Threads share the data without copies. They're used only if the numba functions
+            release the GIL (`NIXTLA_NUMBA_RELEASE_GIL` environment variable) and every model
+            sets `releases_gil`, otherwise the processes are used.""",
     "models": """models : List[Any]
             List of instantiated objects models.StatsForecast.""",
     "n_windows": """n_windows : int (default=1)
@@ -472,7 +1030,7 @@ _param_descriptions = {
             If int, train the models every `refit` windows.""",
 }
 
-# %% ../nbs/src/core/core.ipynb 29
+# %% ../nbs/src/core/core.ipynb 42
 class _StatsForecast:
     """The `StatsForecast` class allows you to efficiently fit multiple `StatsForecast` models
     for large sets of time series. It operates on a DataFrame `df` with at least three columns
@@ -495,6 +1053,7 @@ class _StatsForecast:
         sort_df: bool = True,
         fallback_model: Optional[Any] = None,
         verbose: bool = False,
+        backend: str = "processes",
     ):
         """Train statistical models.
 
@@ -507,6 +1066,7 @@ class _StatsForecast:
         {sort_df}
         {fallback_model}
         {verbose}
+        {backend}
         """
         # TODO @fede: needed for residuals, think about it later
         self.models = models
@@ -515,6 +1075,16 @@ class _StatsForecast:
         self.n_jobs = n_jobs
         self.fallback_model = fallback_model
         self.verbose = verbose
+        if backend not in ("processes", "threads"):
+            raise ValueError(
+                f"backend must be 'processes' or 'threads', got {backend!r}."
+            )
+        self.backend = backend
+        if backend == "threads" and not self._use_threads:
+            warnings.warn(
+                "The threads backend requires the NIXTLA_NUMBA_RELEASE_GIL environment variable "
+                "and models that release the GIL, using processes instead."
+            )
         if df is not None:
             _warn_df_constructor()
             self._prepare_fit(df=df, sort_df=sort_df)
@@ -612,6 +1182,8 @@ class _StatsForecast:
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
+        compact: bool = False,
+        warm_start: bool = False,
     ):
         """Fit statistical models.
 
@@ -627,12 +1199,30 @@ class _StatsForecast:
         {id_col}
         {time_col}
         {target_col}
+        compact : bool (default=False)
+            Store the fitted models that support it as arrays with their parameters and
+            last states instead of model objects. This reduces the memory used by
+            `fitted_` and makes `predict` and `save` faster, but the model objects
+            of those columns are no longer available for inspection.
+        warm_start : bool (default=False)
+            Start the models that support it, like `AutoARIMA`, from the models fitted
+            to the same series by the previous call to `fit`. Series that weren't seen
+            before and compact columns are fitted from scratch.
 
         Returns
         -------
         self : StatsForecast
             Returns with stored `StatsForecast` fitted `models`.
         """
+        if warm_start:
+            prev_fitted = getattr(self, "fitted_", None)
+            if prev_fitted is None:
+                raise ValueError(
+                    "`warm_start` requires the models to be fitted before."
+                )
+            if not hasattr(self, "_uid_index"):
+                self._set_uid_index()
+            prev_index = self._uid_index
         self._prepare_fit(
             df=df,
             sort_df=sort_df,
@@ -642,20 +1232,34 @@ class _StatsForecast:
         )
         self._validate_sizes_for_prediction_intervals(prediction_intervals)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        self._set_uid_index()
+        warm_start_fm = None
+        if warm_start:
+            warm_start_fm = _warm_start_models(
+                prev_fitted, prev_index.get_indexer(self._uid_index)
+            )
         if self.n_jobs == 1:
             self.fitted_ = self.ga.fit(
-                models=self.models, fallback_model=self.fallback_model
+                models=self.models,
+                fallback_model=self.fallback_model,
+                warm_start_fm=warm_start_fm,
             )
         else:
-            self.fitted_ = self._fit_parallel()
+            self.fitted_ = self._fit_parallel(warm_start_fm)
+        if compact:
+            self.fitted_ = _CompactFitted.from_fitted(self.fitted_, self.models)
         return self
 
     fit.__doc__ = fit.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
-    def _make_future_df(self, h: int):
-        start_dates = ufp.offset_times(self.last_dates, freq=self.freq, n=1)
+    def _make_future_df(self, h: int, idxs: Optional[np.ndarray] = None):
+        last_dates, uids = self.last_dates, self.uids
+        if idxs is not None:
+            last_dates = ufp.take_rows(last_dates, idxs)
+            uids = ufp.take_rows(uids, idxs)
+        start_dates = ufp.offset_times(last_dates, freq=self.freq, n=1)
         dates = ufp.time_ranges(start_dates, freq=self.freq, periods=h)
-        uids = ufp.repeat(self.uids, n=h)
+        uids = ufp.repeat(uids, n=h)
         df = self.df_constructor({self.id_col: uids, self.time_col: dates})
         if isinstance(df, pd.DataFrame):
             if _id_as_idx():
@@ -666,13 +1270,19 @@ class _StatsForecast:
         return df
 
     def _parse_X_level(
-        self, h: int, X: Optional[DataFrame], level: Optional[List[int]]
+        self,
+        h: int,
+        X: Optional[DataFrame],
+        level: Optional[List[int]],
+        n_series: Optional[int] = None,
     ):
         if level is None:
             level = []
         if X is None:
             return X, level
-        expected_shape = (h * len(self.ga), self.ga.data.shape[1] + 1)
+        if n_series is None:
+            n_series = len(self.ga)
+        expected_shape = (h * n_series, self.ga.data.shape[1] + 1)
         if X.shape != expected_shape:
             raise ValueError(
                 f"Expected X to have shape {expected_shape}, but got {X.shape}"
@@ -699,6 +1309,7 @@ class _StatsForecast:
         h: int,
         X_df: Optional[DataFrame] = None,
         level: Optional[List[int]] = None,
+        ids: Optional[List[Any]] = None,
     ):
         """Predict statistical models.
 
@@ -708,7 +1319,11 @@ class _StatsForecast:
         ----------
         {h}
         {X_df}
+            If `ids` is provided it must only contain those series.
         {level}
+        ids : list, optional (default=None)
+            Only predict the series with these ids. Only their fitted models are used,
+            so the cost depends on the number of ids instead of the total number of series.
 
         Returns
         -------
@@ -730,17 +1345,91 @@ class _StatsForecast:
                 "Predictions won't have intervals."
             )
         self._validate_exog(X_df)
-        X, level = self._parse_X_level(h=h, X=X_df, level=level)
-        if self.n_jobs == 1:
-            fcsts, cols = self.ga.predict(fm=self.fitted_, h=h, X=X, level=level)
+        if ids is None:
+            idxs = None
+            ga, fitted = self.ga, self.fitted_
+        else:
+            idxs = self._series_idxs(ids)
+            ga, fitted = self.ga.take(idxs), self.fitted_[idxs]
+        X, level = self._parse_X_level(h=h, X=X_df, level=level, n_series=len(ga))
+        if self.n_jobs == 1 or ids is not None:
+            fcsts, cols = ga.predict(fm=fitted, h=h, X=X, level=level)
         else:
             fcsts, cols = self._predict_parallel(h=h, X=X, level=level)
-        fcsts_df = self._make_future_df(h=h)
+        fcsts_df = self._make_future_df(h=h, idxs=idxs)
         fcsts_df[cols] = fcsts
         return fcsts_df
 
     predict.__doc__ = predict.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
+    def update(self, df: DataFrame):
+        """Update the fitted models with new observations.
+
+        Models that implement an `update` method (ARIMA, ETS, CES and Theta) advance their
+        states with the new values keeping their parameters fixed, so the cost only depends
+        on the number of new observations. The rest of the models are fitted again on the
+        whole history of their series.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame
+            DataFrame with the observations that follow the last ones of some or all of the series,
+            with the same columns used in `fit`.
+
+        Returns
+        -------
+        self : StatsForecast
+            Returns with the updated `fitted_` models.
+        """
+        if not hasattr(self, "fitted_"):
+            raise ValueError("You must call the fit method before calling update.")
+        if isinstance(self.fitted_, _CompactFitted):
+            raise ValueError("Models fitted with `compact=True` can't be updated.")
+        df = ensure_time_dtype(df, self.time_col)
+        validate_freq(df[self.time_col], self.freq)
+        cols = [self.id_col, self.time_col, self.target_col, *self._exog]
+        missing_cols = [c for c in cols if c not in df.columns]
+        if missing_cols:
+            raise ValueError(
+                f"The following columns are missing: {reprlib.repr(missing_cols)}"
+            )
+        uids, last_times, data, indptr, sort_idxs = ufp.process_df(
+            df[cols], self.id_col, self.time_col, self.target_col
+        )
+        times = df[self.time_col].to_numpy()
+        if sort_idxs is not None:
+            times = times[sort_idxs]
+        uids = uids if isinstance(uids, pd.Series) else uids.to_numpy()
+        idxs = self._series_idxs(uids, sort=False)
+        expected_times = ufp.offset_times(
+            ufp.take_rows(self.last_dates, idxs), freq=self.freq, n=1
+        )
+        if not np.array_equal(expected_times.to_numpy(), times[indptr[:-1]]):
+            raise ValueError(
+                "The new observations of each serie must start right after the last timestamp seen in fit."
+            )
+        old_indptr = self.ga.indptr
+        self.ga = GroupedArray(
+            *_append_to_groups(self.ga.data, old_indptr, data, indptr, idxs)
+        )
+        self.og_dates, _ = _append_to_groups(
+            self.og_dates, old_indptr, times, indptr, idxs
+        )
+        last_dates = self.last_dates.to_numpy().copy()
+        last_dates[idxs] = last_times
+        if isinstance(self.last_dates, pd.Index):
+            self.last_dates = pd.Index(last_dates, name=self.time_col)
+        else:
+            self.last_dates = pl_Series(last_dates)
+        self.fitted_ = self.ga.update(
+            fm=self.fitted_,
+            new=GroupedArray(data, indptr),
+            idxs=idxs,
+            models=self.models,
+            fallback_model=self.fallback_model,
+        )
+        return self
+
     def fit_predict(
         self,
         h: int,
@@ -795,6 +1484,7 @@ class _StatsForecast:
         self._validate_sizes_for_prediction_intervals(prediction_intervals)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        self._set_uid_index()
         if self.n_jobs == 1:
             self.fitted_, fcsts, cols = self.ga.fit_predict(
                 models=self.models, h=h, X=X, level=level
@@ -859,7 +1549,10 @@ class _StatsForecast:
         self._validate_sizes_for_prediction_intervals(prediction_intervals)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
-        if self.n_jobs == 1:
+        # batched models are faster in a single process than splitting the series
+        if self.n_jobs == 1 or self.ga._can_forecast_batch(
+            models=self.models, X=X, level=level
+        ):
             res_fcsts = self.ga.forecast(
                 models=self.models,
                 h=h,
@@ -884,6 +1577,82 @@ class _StatsForecast:
 
     forecast.__doc__ = forecast.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
+    def forecast_iter(
+        self,
+        h: int,
+        df: Union[str, Path, Iterable[DataFrame]],
+        X_df: Optional[Union[DataFrame, str, Path, Iterable[DataFrame]]] = None,
+        level: Optional[List[int]] = None,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        batch_size: int = 1_000,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> Iterator[DataFrame]:
+        """Memory Efficient predictions for panels larger than memory.
+
+        Reads the series from chunks of data and computes the forecasts
+        of `batch_size` series at a time, yielding them as soon as they're computed,
+        so only a batch of series has to be kept in memory.
+
+        Parameters
+        ----------
+        {h}
+        df : str, Path or iterable of pandas or polars DataFrame
+            Path to a parquet file or directory or an iterable of DataFrames with ids, times,
+            targets and exogenous. The rows of each serie must be contiguous,
+            although a serie can be split between consecutive chunks.
+        X_df : pandas or polars DataFrame, str, Path or iterable of DataFrame, optional (default=None)
+            DataFrame with ids, times and future exogenous. A path or an iterable of DataFrames
+            is read by batches like `df`, with the series in the same order as in `df`.
+        {level}
+        {prediction_intervals}
+        batch_size : int (default=1_000)
+            Number of series to forecast at a time.
+        {id_col}
+        {time_col}
+        {target_col}
+
+        Returns
+        -------
+        fcsts_dfs : iterator of pandas or polars DataFrame
+            DataFrames with `models` columns for point predictions and probabilistic
+            predictions for each batch of series.
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive integer.")
+        if isinstance(df, (str, Path)):
+            df = _read_parquet_batches(df)
+        batches = _iter_series_batches(df, batch_size=batch_size, id_col=id_col)
+        return self._forecast_batches(
+            batches=_with_X_batches(
+                batches, X_df, batch_size=batch_size, id_col=id_col
+            ),
+            h=h,
+            level=level,
+            prediction_intervals=prediction_intervals,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+
+    forecast_iter.__doc__ = forecast_iter.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
+    def _forecast_batches(
+        self, batches, h, level, prediction_intervals, id_col, time_col, target_col
+    ):
+        for batch, X_batch in batches:
+            yield self.forecast(
+                h=h,
+                df=batch,
+                X_df=X_batch,
+                level=level,
+                prediction_intervals=prediction_intervals,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+
     def forecast_fitted_values(self):
         """Access insample predictions.
 
@@ -966,6 +1735,224 @@ class _StatsForecast:
             DataFrame with insample `models` columns for point predictions and probabilistic
             predictions for all fitted `models`.
         """
+        test_size, level = self._prepare_cross_validation(
+            h=h,
+            df=df,
+            n_windows=n_windows,
+            step_size=step_size,
+            test_size=test_size,
+            level=level,
+            refit=refit,
+            sort_df=sort_df,
+            prediction_intervals=prediction_intervals,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        res_fcsts = self._cross_validation_ga(
+            ga=self.ga,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            fitted=fitted,
+            level=level,
+            refit=refit,
+            target_col=target_col,
+        )
+        if fitted:
+            self.cv_fitted_values_ = res_fcsts["fitted"]
+            self.n_cv_ = n_windows
+        return self._cross_validation_df(
+            res_fcsts=res_fcsts,
+            uids=self.uids,
+            times=self.og_dates,
+            indptr=self.ga.indptr,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+        )
+
+    cross_validation.__doc__ = cross_validation.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
+    def cross_validation_iter(
+        self,
+        h: int,
+        df: Optional[Union[DataFrame, str, Path, Iterable[DataFrame]]] = None,
+        n_windows: int = 1,
+        step_size: int = 1,
+        test_size: Optional[int] = None,
+        input_size: Optional[int] = None,
+        level: Optional[List[int]] = None,
+        refit: Union[bool, int] = True,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+        chunk_size: int = 1_000,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+    ) -> Iterator[DataFrame]:
+        """Temporal Cross-Validation by chunks of series.
+
+        Same as `StatsForecast.cross_validation` but the series are processed
+        in chunks of `chunk_size` and the results of each chunk are yielded as soon
+        as they're computed, so the memory used by the outputs is bounded by the
+        size of the chunk instead of the size of the panel. The chunks can be
+        written to disk as they arrive, e.g. to parquet files.
+        Each chunk is prepared from its own rows of `df`, which can also be read by
+        chunks from a parquet file or an iterable of DataFrames.
+
+        Parameters
+        ----------
+        {h}
+        df : pandas or polars DataFrame, str, Path or iterable of DataFrame, optional (default=None)
+            DataFrame with ids, times, targets and exogenous, or a path to a parquet file
+            or directory or an iterable of DataFrames in which the rows of each serie are contiguous,
+            although a serie can be split between consecutive DataFrames.
+            If None, the `StatsForecast` class should have been instantiated using `df`.
+        {n_windows}
+        {step_size}
+        {test_size}
+        {input_size}
+        {level}
+        {refit}
+        {sort_df}
+        {prediction_intervals}
+        chunk_size : int (default=1_000)
+            Number of series to process at a time.
+        {id_col}
+        {time_col}
+        {target_col}
+
+        Returns
+        -------
+        fcsts_dfs : iterator of pandas or polars DataFrame
+            DataFrames with the cross validation results for each chunk of series.
+        """
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        prepare_kwargs = dict(
+            h=h,
+            n_windows=n_windows,
+            step_size=step_size,
+            test_size=test_size,
+            level=level,
+            refit=refit,
+            sort_df=sort_df,
+            prediction_intervals=prediction_intervals,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        if df is None:
+            # the series given to the constructor are already in memory
+            test_size, level = self._prepare_cross_validation(df=None, **prepare_kwargs)
+            return self._cross_validation_chunks(
+                chunk_size=chunk_size,
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                level=level,
+                refit=refit,
+                target_col=target_col,
+            )
+        if isinstance(df, (pd.DataFrame, pl_DataFrame)):
+            batches = _iter_frame_batches(df, batch_size=chunk_size, id_col=id_col)
+        else:
+            if isinstance(df, (str, Path)):
+                df = _read_parquet_batches(df)
+            batches = _iter_series_batches(df, batch_size=chunk_size, id_col=id_col)
+        # the first chunk is prepared now, so the errors are raised when the method is called
+        first = next(batches, None)
+        if first is None:
+            raise ValueError("`df` must have at least one serie.")
+        test_size, level = self._prepare_cross_validation(df=first, **prepare_kwargs)
+        return self._cross_validation_batches(
+            batches=batches,
+            test_size=test_size,
+            level=level,
+            input_size=input_size,
+            prepare_kwargs=prepare_kwargs,
+        )
+
+    cross_validation_iter.__doc__ = cross_validation_iter.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
+
+    def _cross_validation_chunks(
+        self, chunk_size, h, test_size, step_size, input_size, level, refit, target_col
+    ):
+        indptr = self.ga.indptr
+        for start in range(0, len(self.ga), chunk_size):
+            idxs = np.arange(start, min(start + chunk_size, len(self.ga)))
+            ga = self.ga.take(idxs)
+            res_fcsts = self._cross_validation_ga(
+                ga=ga,
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=False,
+                level=level,
+                refit=refit,
+                target_col=target_col,
+            )
+            yield self._cross_validation_df(
+                res_fcsts=res_fcsts,
+                uids=ufp.take_rows(self.uids, idxs),
+                times=self.og_dates[indptr[idxs[0]] : indptr[idxs[-1] + 1]],
+                indptr=ga.indptr,
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+            )
+
+    def _cross_validation_batches(
+        self, batches, test_size, level, input_size, prepare_kwargs
+    ):
+        # the first batch was already prepared by the caller
+        while True:
+            res_fcsts = self._cross_validation_ga(
+                ga=self.ga,
+                h=prepare_kwargs["h"],
+                test_size=test_size,
+                step_size=prepare_kwargs["step_size"],
+                input_size=input_size,
+                fitted=False,
+                level=level,
+                refit=prepare_kwargs["refit"],
+                target_col=prepare_kwargs["target_col"],
+            )
+            yield self._cross_validation_df(
+                res_fcsts=res_fcsts,
+                uids=self.uids,
+                times=self.og_dates,
+                indptr=self.ga.indptr,
+                h=prepare_kwargs["h"],
+                test_size=test_size,
+                step_size=prepare_kwargs["step_size"],
+            )
+            batch = next(batches, None)
+            if batch is None:
+                return
+            test_size, level = self._prepare_cross_validation(
+                df=batch, **prepare_kwargs
+            )
+
+    def _prepare_cross_validation(
+        self,
+        h,
+        df,
+        n_windows,
+        step_size,
+        test_size,
+        level,
+        refit,
+        sort_df,
+        prediction_intervals,
+        id_col,
+        time_col,
+        target_col,
+    ):
         if n_windows is None and test_size is None:
             raise ValueError("you must define `n_windows` or `test_size`")
         if test_size is None:
@@ -1008,8 +1995,13 @@ class _StatsForecast:
         )
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         _, level = self._parse_X_level(h=h, X=None, level=level)
+        return test_size, level
+
+    def _cross_validation_ga(
+        self, ga, h, test_size, step_size, input_size, fitted, level, refit, target_col
+    ):
         if self.n_jobs == 1:
-            res_fcsts = self.ga.cross_validation(
+            return ga.cross_validation(
                 models=self.models,
                 h=h,
                 test_size=test_size,
@@ -1022,42 +2014,41 @@ class _StatsForecast:
                 refit=refit,
                 target_col=target_col,
             )
-        else:
-            res_fcsts = self._cross_validation_parallel(
-                h=h,
-                test_size=test_size,
-                step_size=step_size,
-                input_size=input_size,
-                fitted=fitted,
-                level=level,
-                refit=refit,
-                target_col=target_col,
-            )
-        if fitted:
-            self.cv_fitted_values_ = res_fcsts["fitted"]
-            self.n_cv_ = n_windows
+        return self._cross_validation_parallel(
+            ga=ga,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            fitted=fitted,
+            level=level,
+            refit=refit,
+            target_col=target_col,
+        )
+
+    def _cross_validation_df(
+        self, res_fcsts, uids, times, indptr, h, test_size, step_size
+    ):
         fcsts_df = ufp.cv_times(
-            times=self.og_dates,
-            uids=self.uids,
-            indptr=self.ga.indptr,
+            times=times,
+            uids=uids,
+            indptr=indptr,
             h=h,
             test_size=test_size,
             step_size=step_size,
-            id_col=id_col,
-            time_col=time_col,
+            id_col=self.id_col,
+            time_col=self.time_col,
         )
         # the cv_times is sorted by window and then id
-        fcsts_df = ufp.sort(fcsts_df, [id_col, "cutoff", time_col])
+        fcsts_df = ufp.sort(fcsts_df, [self.id_col, "cutoff", self.time_col])
         fcsts_df = ufp.assign_columns(
             fcsts_df, res_fcsts["cols"], res_fcsts["forecasts"]
         )
         if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
             _warn_id_as_idx()
-            fcsts_df = fcsts_df.set_index(id_col)
+            fcsts_df = fcsts_df.set_index(self.id_col)
         return fcsts_df
 
-    cross_validation.__doc__ = cross_validation.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
-
     def cross_validation_fitted_values(self) -> DataFrame:
         """Access insample cross validated predictions.
 
@@ -1104,47 +2095,142 @@ class _StatsForecast:
                 df = df.reset_index(drop=True)
         return df
 
+    @property
+    def _use_threads(self):
+        # objects saved before the backend was added don't have it
+        if not NOGIL or getattr(self, "backend", "processes") != "threads":
+            return False
+        models = (
+            self.models
+            if self.fallback_model is None
+            else [*self.models, self.fallback_model]
+        )
+        return all(getattr(model, "releases_gil", False) for model in models)
+
     def _get_pool(self):
-        from multiprocessing import Pool
+        if self._use_threads:
+            from multiprocessing.pool import ThreadPool as Pool
+        else:
+            from multiprocessing import Pool
 
         pool_kwargs = dict()
         return Pool, pool_kwargs
 
-    def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
+    def _split(self, ga, n_chunks, costs=None):
+        # the threads read the data in place, the processes map it from a file
+        if self._use_threads:
+            return _shared_split(ga, n_chunks, costs)
+        return _memmap_split(ga, n_chunks, costs, self._saved_data_path(ga))
+
+    def _saved_data_path(self, ga):
+        # inside the context the series are saved once for all the calls
+        tmpdir = getattr(self, "_tmpdir", None)
+        if tmpdir is None or ga is not self.ga:
+            return None
+        saved = getattr(self, "_saved_data", None)
+        if saved is None or saved[0] is not ga.data:
+            if saved is not None:
+                os.remove(saved[1])
+            fd, path = tempfile.mkstemp(suffix=".npy", dir=tmpdir.name)
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, ga.data)
+            saved = self._saved_data = (ga.data, path)
+        return saved[1]
+
+    @contextmanager
+    def _executor(self):
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            # reuse the workers started by the context manager
+            yield pool
+            return
         Pool, pool_kwargs = self._get_pool()
         with Pool(self.n_jobs, **pool_kwargs) as executor:
+            yield executor
+
+    def __enter__(self):
+        """Start a pool of workers that is reused by all the methods until exiting the context.
+
+        The workers are started once and compile the models on a small serie,
+        so successive calls to `fit`, `predict`, `forecast` and `cross_validation`
+        don't pay for the processes startup and the numba compilation again.
+        The process workers also map the series from a file that is written once.
+        """
+        if self.n_jobs != 1 and getattr(self, "_pool", None) is None:
+            Pool, pool_kwargs = self._get_pool()
+            n_workers = os.cpu_count() if self.n_jobs in (-1, None) else self.n_jobs
+            self._pool = Pool(
+                n_workers,
+                initializer=_warm_up_worker,
+                initargs=(self.models,),
+                **pool_kwargs,
+            )
+            if not self._use_threads:
+                self._tmpdir = tempfile.TemporaryDirectory()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pool = self.__dict__.pop("_pool", None)
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        self.__dict__.pop("_saved_data", None)
+        tmpdir = self.__dict__.pop("_tmpdir", None)
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    def __getstate__(self):
+        # the workers and the temporary files can't be pickled, e.g. when saving inside the context
+        state = self.__dict__.copy()
+        for attr in ["_pool", "_tmpdir", "_saved_data"]:
+            state.pop(attr, None)
+        return state
+
+    def _split_costs(self):
+        return _series_costs(np.diff(self.ga.indptr), self.models)
+
+    def _fit_parallel(self, warm_start_fm=None):
+        costs = self._split_costs()
+        if warm_start_fm is None:
+            warm_start_fms = [None] * self.n_jobs
+        else:
+            warm_start_fms = self.ga.split_fm(warm_start_fm, self.n_jobs, costs)
+        with self._split(
+            self.ga, self.n_jobs, costs
+        ) as gas, self._executor() as executor:
             futures = []
-            for ga in gas:
+            for ga, ws_fm in zip(gas, warm_start_fms):
                 future = executor.apply_async(
-                    ga.fit, (self.models, self.fallback_model)
+                    ga.run, ("fit", self.models, self.fallback_model, ws_fm)
                 )
                 futures.append(future)
-            fm = np.vstack([f.get() for f in futures])
+            fm = _gather_results([f.get() for f in futures])
         return fm
 
+    @contextmanager
     def _get_gas_Xs(self, X):
-        gas = self.ga.split(self.n_jobs)
-        if X is not None:
-            Xs = X.split(self.n_jobs)
-        else:
-            from itertools import repeat
+        costs = self._split_costs()
+        with ExitStack() as stack:
+            gas = stack.enter_context(self._split(self.ga, self.n_jobs, costs))
+            if X is not None:
+                Xs = stack.enter_context(self._split(X, self.n_jobs, costs))
+            else:
+                from itertools import repeat
 
-            Xs = repeat(None)
-        return gas, Xs
+                Xs = repeat(None)
+            yield gas, Xs
 
     def _predict_parallel(self, h, X, level):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        fms = self.ga.split_fm(self.fitted_, self.n_jobs, self._split_costs())
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._get_gas_Xs(X=X) as (gas, Xs), self._executor() as executor:
             futures = []
             for ga, fm, X_ in zip(gas, fms, Xs):
                 future = executor.apply_async(
-                    ga.predict,
+                    ga.run,
                     (
+                        "predict",
                         fm,
                         h,
                         X_,
@@ -1152,23 +2238,19 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts, cols = list(zip(*out))
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+            fcsts, cols = _gather_results([f.get() for f in futures])
         return fcsts, cols
 
     def _fit_predict_parallel(self, h, X, level):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._get_gas_Xs(X=X) as (gas, Xs), self._executor() as executor:
             futures = []
             for ga, X_ in zip(gas, Xs):
                 future = executor.apply_async(
-                    ga.fit_predict,
+                    ga.run,
                     (
+                        "fit_predict",
                         self.models,
                         h,
                         X_,
@@ -1176,25 +2258,18 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
-            fm, fcsts, cols = list(zip(*out))
-            fm = np.vstack(fm)
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+            fm, fcsts, cols = _gather_results([f.get() for f in futures])
         return fm, fcsts, cols
 
     def _forecast_parallel(self, h, fitted, X, level, target_col):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        with self._get_gas_Xs(X=X) as (gas, Xs), self._executor() as executor:
             futures = []
             for ga, X_ in zip(gas, Xs):
                 future = executor.apply_async(
-                    ga.forecast,
-                    tuple(),
+                    ga.run,
+                    ("forecast",),
                     dict(
                         models=self.models,
                         h=h,
@@ -1207,33 +2282,22 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
-            if fitted:
-                result["fitted"] = {}
-                fitted_vals = [d["fitted"]["values"] for d in out]
-                result["fitted"]["values"] = np.vstack(fitted_vals)
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+            result = _gather_results([f.get() for f in futures])
         return result
 
     def _cross_validation_parallel(
-        self, h, test_size, step_size, input_size, fitted, level, refit, target_col
+        self, ga, h, test_size, step_size, input_size, fitted, level, refit, target_col
     ):
         # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
+        n_chunks = min(self.n_jobs, ga.n_groups)
+        costs = _series_costs(np.diff(ga.indptr), self.models)
+        with self._split(ga, n_chunks, costs) as gas, self._executor() as executor:
             futures = []
             for ga in gas:
                 future = executor.apply_async(
-                    ga.cross_validation,
-                    tuple(),
+                    ga.run,
+                    ("cross_validation",),
                     dict(
                         models=self.models,
                         h=h,
@@ -1249,22 +2313,7 @@ class _StatsForecast:
                     ),
                 )
                 futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
-            if fitted:
-                result["fitted"] = {}
-                result["fitted"]["values"] = np.concatenate(
-                    [d["fitted"]["values"] for d in out]
-                )
-                for key in ["last_idxs", "idxs"]:
-                    result["fitted"][key] = np.concatenate(
-                        [d["fitted"][key] for d in out]
-                    )
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+            result = _gather_results([f.get() for f in futures])
         return result
 
     @staticmethod
@@ -1354,6 +2403,7 @@ class _StatsForecast:
         path: Optional[Union[Path, str]] = None,
         max_size: Optional[str] = None,
         trim: bool = False,
+        format: str = "pickle",
     ):
         """Function that will save StatsForecast class with certain settings to make it
         reproducible.
@@ -1368,7 +2418,13 @@ class _StatsForecast:
             Available byte naming: ['B', 'KB', 'MB', 'GB']
         trim : bool (default = False)
             Delete any attributes not needed for inference.
+        format : str (default = 'pickle')
+            'pickle' saves the object to a single file. 'directory' saves the training data
+            and the fitted models to separate files inside the `path` directory, which
+            `StatsForecast.load` reads lazily through memory mapping.
         """
+        if format not in ("pickle", "directory"):
+            raise ValueError("`format` must be either 'pickle' or 'directory'.")
         # Will be used to find the size of the fitted models
         # Never expecting anything higher than GB (even that's a lot')
         bytes_hmap = {
@@ -1386,7 +2442,15 @@ class _StatsForecast:
                 # remove unnecessary attributes here
                 self.__dict__.pop(attr, None)
 
-        sf_size = len(pickle.dumps(self))
+        files: Dict[str, Union[bytes, np.ndarray]]
+        if format == "pickle":
+            files = {"": pickle.dumps(self)}
+        else:
+            files = self._directory_files()
+        sf_size = sum(
+            len(content) if isinstance(content, bytes) else content.nbytes
+            for content in files.values()
+        )
 
         if max_size is not None:
             cap_size = self._get_cap_size(max_size, bytes_hmap)
@@ -1410,12 +2474,65 @@ class _StatsForecast:
 
         if path is None:
             datetime_record = dt.datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
-            path = f"StatsForecast_{datetime_record}.pkl"
-
-        with open(path, "wb") as m_file:
-            pickle.dump(self, m_file)
+            path = f"StatsForecast_{datetime_record}"
+            if format == "pickle":
+                path += ".pkl"
+
+        if format == "directory":
+            os.makedirs(path, exist_ok=True)
+        for name, content in files.items():
+            file_path = Path(path) / name
+            if isinstance(content, bytes):
+                with open(file_path, "wb") as m_file:
+                    m_file.write(content)
+            else:
+                np.save(file_path, content, allow_pickle=False)
         print("StatsForecast object saved")
 
+    def _directory_files(self) -> Dict[str, Union[bytes, np.ndarray]]:
+        # the arrays are saved as .npy files and the rest of the object is pickled
+        state = self.__getstate__()
+        files: Dict[str, Union[bytes, np.ndarray]] = {}
+        ga = state.pop("ga", None)
+        if ga is not None:
+            files["data.npy"] = ga.data
+            files["indptr.npy"] = ga.indptr
+        if state.get("og_dates") is not None and state["og_dates"].dtype != object:
+            files["dates.npy"] = state.pop("og_dates")
+        fitted = state.pop("fitted_", None)
+        columns: Optional[List[Dict[str, Any]]] = None
+        if fitted is not None:
+            if isinstance(fitted, _CompactFitted):
+                fitted_cols = fitted.columns
+            else:
+                fitted_cols = [fitted[:, i_model] for i_model in range(fitted.shape[1])]
+            columns = []
+            for i_model, col in enumerate(fitted_cols):
+                if isinstance(col, _CompactModels):
+                    columns.append(
+                        {"kind": "compact", "params": list(col.params.keys())}
+                    )
+                    for key, param in col.params.items():
+                        files[f"model_{i_model}_{key}.npy"] = param
+                else:
+                    # each model is pickled separately to load only the required ones
+                    rows = [pickle.dumps(fitted_model) for fitted_model in col]
+                    columns.append({"kind": "objects"})
+                    files[f"model_{i_model}.pkl"] = b"".join(rows)
+                    files[f"model_{i_model}_offsets.npy"] = np.cumsum(
+                        [0] + [len(row) for row in rows]
+                    )
+        sf = type(self).__new__(type(self))
+        sf.__dict__.update(state)
+        files["statsforecast.pkl"] = pickle.dumps(sf)
+        manifest = {
+            "version": _SAVE_FORMAT_VERSION,
+            "compact": isinstance(fitted, _CompactFitted),
+            "columns": columns,
+        }
+        files["manifest.json"] = json.dumps(manifest).encode()
+        return files
+
     def _get_cap_size(self, max_size, bytes_hmap):
         max_size = max_size.upper().replace(" ", "")
         match = re.match(r"(\d+\.\d+|\d+)(\w+)", max_size)
@@ -1436,24 +2553,118 @@ class _StatsForecast:
         return cap_size
 
     @staticmethod
-    def load(path: Union[Path, str]):
+    def load(path: Union[Path, str], ids: Optional[List[Any]] = None):
         """
         Automatically loads the model into ready StatsForecast.
 
         Parameters
         ----------
         path : str or pathlib.Path
-            Path to saved StatsForecast file.
+            Path to saved StatsForecast file or directory.
+        ids : list, optional (default=None)
+            Only keep the series with these ids. When the object was saved with
+            `format='directory'` the fitted models of the rest of the series are never read.
 
         Returns
         -------
         sf: StatsForecast
             Previously saved StatsForecast
         """
-        if not Path(path).exists():
+        path = Path(path)
+        if not path.exists():
             raise ValueError("Specified path does not exist, check again and retry.")
+        if path.is_dir():
+            return _StatsForecast._load_directory(path, ids)
         with open(path, "rb") as f:
-            return pickle.load(f)
+            sf = pickle.load(f)
+        if ids is not None:
+            sf._take_series(sf._series_idxs(ids))
+        return sf
+
+    @staticmethod
+    def _load_directory(path: Path, ids: Optional[List[Any]] = None):
+        with open(path / "manifest.json") as f:
+            manifest = json.load(f)
+        if manifest["version"] > _SAVE_FORMAT_VERSION:
+            raise ValueError(
+                f"The object was saved with version {manifest['version']} of the format "
+                f"but this version of statsforecast can only read up to version {_SAVE_FORMAT_VERSION}. "
+                "Please upgrade statsforecast."
+            )
+        with open(path / "statsforecast.pkl", "rb") as f:
+            sf = pickle.load(f)
+        # copy on write, the arrays are only read from disk when they're used
+        if (path / "data.npy").exists():
+            sf.ga = GroupedArray(
+                np.load(path / "data.npy", mmap_mode="c"), np.load(path / "indptr.npy")
+            )
+        if (path / "dates.npy").exists():
+            sf.og_dates = np.load(path / "dates.npy", mmap_mode="c")
+        idxs = None
+        if ids is not None:
+            idxs = sf._series_idxs(ids)
+            sf._take_series(idxs)
+        if manifest["columns"] is None:
+            return sf
+        columns: List[Union[_CompactModels, np.ndarray]] = []
+        for i_model, col in enumerate(manifest["columns"]):
+            column: Union[_CompactModels, np.ndarray]
+            if col["kind"] == "compact":
+                params = {
+                    key: np.load(path / f"model_{i_model}_{key}.npy", mmap_mode="c")
+                    for key in col["params"]
+                }
+                column = _CompactModels(sf.models[i_model], params)
+                if idxs is not None:
+                    column = column.take(idxs)
+            else:
+                offsets = np.load(path / f"model_{i_model}_offsets.npy")
+                column = _load_models(path / f"model_{i_model}.pkl", offsets, idxs)
+            columns.append(column)
+        if manifest["compact"]:
+            sf.fitted_ = _CompactFitted(columns)
+        else:
+            # all the columns are arrays of fitted models
+            sf.fitted_ = np.stack(columns, axis=1)  # type: ignore[arg-type]
+        return sf
+
+    def _set_uid_index(self) -> None:
+        # maps each id to its row in `uids`, `ga` and `fitted_`
+        uids = self.uids if isinstance(self.uids, pd.Series) else self.uids.to_numpy()
+        self._uid_index = pd.Index(uids)
+
+    def _series_idxs(
+        self, ids: Union[Sequence[Any], np.ndarray, pd.Series], sort: bool = True
+    ) -> np.ndarray:
+        if not hasattr(self, "_uid_index"):
+            self._set_uid_index()
+        idxs = self._uid_index.get_indexer(ids)
+        if (idxs == -1).any():
+            missing = [uid for uid, idx in zip(ids, idxs) if idx == -1]
+            raise ValueError(
+                f"The following ids weren't found: {reprlib.repr(missing)}"
+            )
+        if sort:
+            # keep the order of the fitted series
+            idxs = np.unique(idxs)
+        return idxs
+
+    def _take_series(self, idxs: np.ndarray) -> None:
+        # the stored fitted values refer to all the series
+        for attr in ["fcst_fitted_values_", "cv_fitted_values_"]:
+            self.__dict__.pop(attr, None)
+        if hasattr(self, "og_dates"):
+            indptr = self.ga.indptr
+            self.og_dates = np.concatenate(
+                [self.og_dates[indptr[i] : indptr[i + 1]] for i in idxs]
+            )
+        self.ga = self.ga.take(idxs)
+        self.uids = ufp.take_rows(self.uids, idxs)
+        self.last_dates = ufp.take_rows(self.last_dates, idxs)
+        if hasattr(self, "fitted_"):
+            self.fitted_ = self.fitted_[idxs]
+        self.n_jobs = min(self.n_jobs, idxs.size)
+        self._set_uid_index()
 
     def __repr__(self):
         return f"StatsForecast(models=[{','.join(map(repr, self.models))}])"
@@ -1461,7 +2672,7 @@ class _StatsForecast:
 
 _StatsForecast.plot.__doc__ = _StatsForecast.plot.__doc__.format(**_param_descriptions)  # type: ignore[union-attr]
 
-# %% ../nbs/src/core/core.ipynb 30
+# %% ../nbs/src/core/core.ipynb 43
 class ParallelBackend:
     def forecast(
         self,
@@ -1542,7 +2753,7 @@ class ParallelBackend:
 def make_backend(obj: Any, *args: Any, **kwargs: Any) -> ParallelBackend:
     return ParallelBackend()
 
-# %% ../nbs/src/core/core.ipynb 31
+# %% ../nbs/src/core/core.ipynb 44
 class StatsForecast(_StatsForecast):
     def forecast(
         self,
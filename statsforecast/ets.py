@@ -13,7 +13,7 @@ from numba import njit
 from numba.typed import List
 from statsmodels.tsa.seasonal import seasonal_decompose
 
-from .utils import _calculate_intervals, CACHE, NOGIL
+from .utils import _calculate_intervals, _quantiles, CACHE, NOGIL
 
 # %% ../nbs/src/ets.ipynb 5
 # Global variables
@@ -536,6 +536,15 @@ def pegelsresid_C(
 
 # %% ../nbs/src/ets.ipynb 27
 results = namedtuple("results", "x fn nit simplex")
+nm_state = namedtuple(
+    "nm_state", "simplex f_simplex order points fvals x_o x_r lower upper info par"
+)
+
+# phases of the optimizer
+_NM_START, _NM_REFLECT, _NM_EXPAND, _NM_OUTSIDE, _NM_INSIDE, _NM_SHRINK = range(6)
+# positions in the integer and float arrays of the state
+_PHASE, _IT, _MAX_ITER, _STALL, _MAX_STALL, _BOUNDS, _BATCH = range(7)
+_ALPHA, _GAMMA, _RHO, _SIGMA, _TOL_STD, _TOL_X, _F_R, _F_BEST = range(8)
 
 
 @njit(nogil=NOGIL, cache=CACHE)
@@ -554,21 +563,31 @@ def restrict_to_bounds(x, lower, upper):
 
 
 @njit(nogil=NOGIL, cache=CACHE)
-def nelder_mead_ets(
+def nelder_mead_init(
     x0: np.ndarray,
-    args: Tuple = (),
-    lower: np.ndarray = np.empty(0),
-    upper: np.ndarray = np.empty(0),
-    init_step: float = 0.05,
-    zero_pert: float = 0.0001,
-    alpha: float = 1.0,
-    gamma: float = 2.0,
-    rho: float = 0.5,
-    sigma: float = 0.5,
-    max_iter: int = 2_000,
-    tol_std: float = 1e-10,
-    adaptive: bool = False,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    init_step: float,
+    zero_pert: float,
+    alpha: float,
+    gamma: float,
+    rho: float,
+    sigma: float,
+    max_iter: int,
+    tol_std: float,
+    adaptive: bool,
+    tol_x: float,
+    max_stall: int,
+    init_simplex: np.ndarray,
+    batch: bool,
 ):
+    """Nelder-Mead optimizer driven by the caller.
+
+    The optimizer never calls the target function, it requests the points in `state.points`
+    and the caller writes their values in `state.fvals` before calling `nelder_mead_tell`,
+    which returns the number of points to evaluate next (zero when it has converged).
+    This way the same implementation serves every model, each one looping over its own target function.
+    """
     # We are trying to minimize the function fn(x, args)
     # with initial point x0.
     # Step 0:
@@ -587,88 +606,224 @@ def nelder_mead_ets(
     simplex = np.full(
         (n + 1, n), fill_value=np.nan, dtype=np.float64
     )  # each row is x_j
-    simplex[:] = x0
-    # perturb simplex using `init_step`
-    diag = np.copy(np.diag(simplex))
-    diag[diag == 0.0] = zero_pert
-    diag[diag != 0.0] *= 1 + init_step
-    np.fill_diagonal(simplex, diag)
+    if init_simplex.shape == simplex.shape:
+        # warm start from the simplex of a previous optimization
+        simplex[:] = init_simplex
+    else:
+        simplex[:] = x0
+        # perturb simplex using `init_step`
+        diag = np.copy(np.diag(simplex))
+        diag[diag == 0.0] = zero_pert
+        diag[diag != 0.0] *= 1 + init_step
+        np.fill_diagonal(simplex, diag)
     # restrict simplex to bounds if passed
     if bounds:
         for j in range(n + 1):
             simplex[j] = restrict_to_bounds(simplex[j], lower, upper)
-    # array of the value of f
-    f_simplex = np.full(n + 1, fill_value=np.nan)
-    for j in range(n + 1):
-        f_simplex[j] = ets_target_fn(simplex[j], *args)
-    for it in range(max_iter):
-        # Step1: order of f_simplex
-        # print(simplex)
-        # print(f_simplex)
-        order_f = f_simplex.argsort()
-        best_idx = order_f[0]
-        worst_idx = order_f[-1]
-        second_worst_idx = order_f[-2]
-        # Check whether method should stop.
-        if np.std(f_simplex) < tol_std:
-            break
-        # calculate centroid except argmax f_simplex
-        x_o = simplex[np.delete(order_f, -1)].sum(axis=0) / n
-        # Step2: Reflection, Compute reflected point
-        x_r = x_o + alpha * (x_o - simplex[worst_idx])
-        # restrict x_r to bounds if passed
-        if bounds:
-            x_r = restrict_to_bounds(x_r, lower, upper)
-        f_r = ets_target_fn(x_r, *args)
+    info = np.array(
+        [_NM_START, 0, max_iter, 0, max_stall, bounds, batch], dtype=np.int64
+    )
+    par = np.array([alpha, gamma, rho, sigma, tol_std, tol_x, np.nan, np.inf])
+    # the first request is the value of f at each vertex
+    return nm_state(
+        simplex,
+        np.full(n + 1, fill_value=np.nan),
+        np.arange(n + 1),
+        simplex.copy(),
+        np.full(n + 1, fill_value=np.nan),
+        np.empty(n),
+        np.empty(n),
+        lower,
+        upper,
+        info,
+        par,
+    )
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _nelder_mead_request(state, phase, x):
+    if state.info[_BOUNDS]:
+        x = restrict_to_bounds(x, state.lower, state.upper)
+    state.points[0] = x
+    state.info[_PHASE] = phase
+    return 1
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _nelder_mead_iterate(state):
+    simplex, f_simplex, order, info, par = (
+        state.simplex,
+        state.f_simplex,
+        state.order,
+        state.info,
+        state.par,
+    )
+    n = simplex.shape[1]
+    if info[_IT] == info[_MAX_ITER]:
+        return 0
+    info[_IT] += 1
+    # Step1: order of f_simplex
+    order[:] = f_simplex.argsort()
+    best_idx = order[0]
+    # Check whether method should stop.
+    if np.std(f_simplex) < par[_TOL_STD]:
+        return 0
+    if par[_TOL_X] > 0 and np.max(np.abs(simplex - simplex[best_idx])) < par[_TOL_X]:
+        return 0
+    # stop if the best value hasn't improved in the last `max_stall` iterations
+    if info[_MAX_STALL]:
+        if f_simplex[best_idx] < par[_F_BEST] - par[_TOL_STD]:
+            par[_F_BEST] = f_simplex[best_idx]
+            info[_STALL] = 0
+        else:
+            info[_STALL] += 1
+            if info[_STALL] >= info[_MAX_STALL]:
+                return 0
+    # calculate centroid except argmax f_simplex
+    state.x_o[:] = simplex[order[:-1]].sum(axis=0) / n
+    # Step2: Reflection, Compute reflected point
+    _nelder_mead_request(
+        state, _NM_REFLECT, state.x_o + par[_ALPHA] * (state.x_o - simplex[order[-1]])
+    )
+    state.x_r[:] = state.points[0]
+    if not info[_BATCH]:
+        return 1
+    # request the expansion point as well, so both can be evaluated together
+    x_e = state.x_o + par[_GAMMA] * (state.x_r - state.x_o)
+    if info[_BOUNDS]:
+        x_e = restrict_to_bounds(x_e, state.lower, state.upper)
+    state.points[1] = x_e
+    return 2
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def nelder_mead_tell(state):
+    simplex, f_simplex, order, points, fvals = (
+        state.simplex,
+        state.f_simplex,
+        state.order,
+        state.points,
+        state.fvals,
+    )
+    info, par = state.info, state.par
+    n = simplex.shape[1]
+    best_idx = order[0]
+    worst_idx = order[-1]
+    second_worst_idx = order[-2]
+    phase = info[_PHASE]
+    accept = -1
+    if phase == _NM_START:
+        f_simplex[:] = fvals
+    elif phase == _NM_REFLECT:
+        f_r = fvals[0]
+        par[_F_R] = f_r
         if f_simplex[best_idx] <= f_r < f_simplex[second_worst_idx]:
-            simplex[worst_idx] = x_r
-            f_simplex[worst_idx] = f_r
-            continue
+            accept = 0
         # Step3: Expansion, reflected point is the best point so far
-        if f_r < f_simplex[best_idx]:
-            x_e = x_o + gamma * (x_r - x_o)
-            # restrict x_e to bounds if passed
-            if bounds:
-                x_e = restrict_to_bounds(x_e, lower, upper)
-            f_e = ets_target_fn(x_e, *args)
-            if f_e < f_r:
-                simplex[worst_idx] = x_e
-                f_simplex[worst_idx] = f_e
-            else:
-                simplex[worst_idx] = x_r
-                f_simplex[worst_idx] = f_r
-            continue
+        elif f_r < f_simplex[best_idx]:
+            if not info[_BATCH]:
+                return _nelder_mead_request(
+                    state, _NM_EXPAND, state.x_o + par[_GAMMA] * (state.x_r - state.x_o)
+                )
+            accept = 1 if fvals[1] < f_r else 0
         # Step4: outside Contraction
-        if f_simplex[second_worst_idx] <= f_r < f_simplex[worst_idx]:
-            x_oc = x_o + rho * (x_r - x_o)
-            if bounds:
-                x_oc = restrict_to_bounds(x_oc, lower, upper)
-            f_oc = ets_target_fn(x_oc, *args)
-            if f_oc <= f_r:
-                simplex[worst_idx] = x_oc
-                f_simplex[worst_idx] = f_oc
-                continue
+        elif f_simplex[second_worst_idx] <= f_r < f_simplex[worst_idx]:
+            return _nelder_mead_request(
+                state, _NM_OUTSIDE, state.x_o + par[_RHO] * (state.x_r - state.x_o)
+            )
         # step 5 inside contraction
         else:
-            x_ic = x_o - rho * (x_r - x_o)
-            # restrict x_c to bounds if passed
-            if bounds:
-                x_ic = restrict_to_bounds(x_ic, lower, upper)
-            f_ic = ets_target_fn(x_ic, *args)
-            if f_ic < f_simplex[worst_idx]:
-                simplex[worst_idx] = x_ic
-                f_simplex[worst_idx] = f_ic
-                continue
+            return _nelder_mead_request(
+                state, _NM_INSIDE, state.x_o - par[_RHO] * (state.x_r - state.x_o)
+            )
+    elif phase == _NM_EXPAND:
+        # keep the reflected point if it's better than the expanded one
+        if not fvals[0] < par[_F_R]:
+            points[0] = state.x_r
+            fvals[0] = par[_F_R]
+        accept = 0
+    elif (phase == _NM_OUTSIDE and fvals[0] <= par[_F_R]) or (
+        phase == _NM_INSIDE and fvals[0] < f_simplex[worst_idx]
+    ):
+        accept = 0
+    elif phase != _NM_SHRINK:
         # step 6: shrink
-        simplex[np.delete(order_f, 0)] = simplex[best_idx] + sigma * (
-            simplex[np.delete(order_f, 0)] - simplex[best_idx]
-        )
-        for i in np.delete(order_f, 0):
-            simplex[i] = restrict_to_bounds(simplex[i], lower, upper)
-            f_simplex[i] = ets_target_fn(simplex[i], *args)
-    return results(simplex[best_idx], f_simplex[best_idx], it + 1, simplex)
+        for k in range(n):
+            i = order[k + 1]
+            simplex[i] = simplex[best_idx] + par[_SIGMA] * (
+                simplex[i] - simplex[best_idx]
+            )
+            if info[_BOUNDS]:
+                simplex[i] = restrict_to_bounds(simplex[i], state.lower, state.upper)
+            points[k] = simplex[i]
+        info[_PHASE] = _NM_SHRINK
+        return n
+    else:
+        for k in range(n):
+            f_simplex[order[k + 1]] = fvals[k]
+    if accept >= 0:
+        simplex[worst_idx] = points[accept]
+        f_simplex[worst_idx] = fvals[accept]
+    return _nelder_mead_iterate(state)
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def nelder_mead_result(state):
+    best_idx = state.order[0]
+    return results(
+        state.simplex[best_idx],
+        state.f_simplex[best_idx],
+        state.info[_IT],
+        state.simplex,
+    )
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def nelder_mead_ets(
+    x0: np.ndarray,
+    args: Tuple = (),
+    lower: np.ndarray = np.empty(0),
+    upper: np.ndarray = np.empty(0),
+    init_step: float = 0.05,
+    zero_pert: float = 0.0001,
+    alpha: float = 1.0,
+    gamma: float = 2.0,
+    rho: float = 0.5,
+    sigma: float = 0.5,
+    max_iter: int = 2_000,
+    tol_std: float = 1e-10,
+    adaptive: bool = False,
+    tol_x: float = 0.0,
+    max_stall: int = 0,
+    init_simplex: np.ndarray = np.empty((0, 0)),
+    batch: bool = False,
+):
+    state = nelder_mead_init(
+        x0,
+        lower,
+        upper,
+        init_step,
+        zero_pert,
+        alpha,
+        gamma,
+        rho,
+        sigma,
+        max_iter,
+        tol_std,
+        adaptive,
+        tol_x,
+        max_stall,
+        init_simplex,
+        batch,
+    )
+    n_points = state.points.shape[0]
+    while n_points:
+        for j in range(n_points):
+            state.fvals[j] = ets_target_fn(state.points[j], *args)
+        n_points = nelder_mead_tell(state)
+    return nelder_mead_result(state)
 
-# %% ../nbs/src/ets.ipynb 28
+# %% ../nbs/src/ets.ipynb 29
 @njit(nogil=NOGIL, cache=CACHE)
 def ets_target_fn(
     par,
@@ -775,7 +930,7 @@ def ets_target_fn(
         objval = mean
     return objval
 
-# %% ../nbs/src/ets.ipynb 29
+# %% ../nbs/src/ets.ipynb 30
 def optimize_ets_target_fn(
     x0,
     par,
@@ -794,6 +949,7 @@ def optimize_ets_target_fn(
     m,
     pnames,
     pnames2,
+    starts=(),
 ):
     alpha = par_noopt["alpha"] if np.isnan(par["alpha"]) else par["alpha"]
     if np.isnan(alpha):
@@ -847,34 +1003,44 @@ def optimize_ets_target_fn(
         beta = 0.0
     if seasontype == "N":
         gamma = 0.0
+    args = (
+        y,
+        nstate,
+        switch(errortype),
+        switch(trendtype),
+        switch(seasontype),
+        damped,
+        lowerb,
+        upperb,
+        opt_crit,
+        nmse,
+        bounds,
+        m,
+        optAlpha,
+        optBeta,
+        optGamma,
+        optPhi,
+        givenAlpha,
+        givenBeta,
+        givenGamma,
+        givenPhi,
+        alpha,
+        beta,
+        gamma,
+        phi,
+    )
+    # warm start: begin the search from the best of the default
+    # initial values and the optima of related candidates
+    if len(starts):
+        best = ets_target_fn(restrict_to_bounds(x0, lowerb, upperb), *args)
+        for start in starts:
+            start = restrict_to_bounds(start, lowerb, upperb)
+            val = ets_target_fn(start, *args)
+            if val < best:
+                x0, best = start, val
     res = nelder_mead_ets(
         x0,
-        args=(
-            y,
-            nstate,
-            switch(errortype),
-            switch(trendtype),
-            switch(seasontype),
-            damped,
-            lowerb,
-            upperb,
-            opt_crit,
-            nmse,
-            bounds,
-            m,
-            optAlpha,
-            optBeta,
-            optGamma,
-            optPhi,
-            givenAlpha,
-            givenBeta,
-            givenGamma,
-            givenPhi,
-            alpha,
-            beta,
-            gamma,
-            phi,
-        ),
+        args=args,
         lower=lowerb,
         upper=upperb,
         tol_std=1e-4,
@@ -883,7 +1049,7 @@ def optimize_ets_target_fn(
     )
     return res
 
-# %% ../nbs/src/ets.ipynb 30
+# %% ../nbs/src/ets.ipynb 31
 def etsmodel(
     y: np.ndarray,
     m: int,
@@ -904,6 +1070,8 @@ def etsmodel(
     control=None,
     seed=None,
     trace: bool = False,
+    init_state=None,
+    starts=(),
 ):
     if seasontype == "N":
         m = 1
@@ -929,7 +1097,8 @@ def etsmodel(
     if not check_param(alpha, beta, gamma, phi, lower, upper, bounds, m):
         raise Exception("Parameters out of range")
     # initialize state
-    init_state = initstate(y, m, trendtype, seasontype)
+    if init_state is None:
+        init_state = initstate(y, m, trendtype, seasontype)
     nstate = len(init_state)
     par_ = {key: val for key, val in par_.items() if not np.isnan(val)}
     par = np.full(len(par_) + nstate, fill_value=np.nan)
@@ -976,6 +1145,7 @@ def etsmodel(
         m=m,
         pnames=par_.keys(),
         pnames2=par_noopt.keys(),
+        starts=[start for start in starts if start.size == par.size],
     )
     fit_par = fred.x
     init_state = fit_par[-nstate:]
@@ -1056,12 +1226,12 @@ def etsmodel(
         n_params=np_,
     )
 
-# %% ../nbs/src/ets.ipynb 32
+# %% ../nbs/src/ets.ipynb 33
 @njit(nogil=NOGIL, cache=CACHE)
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/ets.ipynb 34
+# %% ../nbs/src/ets.ipynb 35
 def ets_f(
     y,
     m,
@@ -1252,6 +1422,10 @@ def ets_f(
     else:
         damped = [damped]
     best_ic = np.inf
+    # candidates sharing trend and season types have the same initial
+    # states and similar optima, so they are computed once and reused
+    init_states = {}
+    optima = {}
     for etype in errortype:
         for ttype in trendtype:
             for stype in seasontype:
@@ -1274,6 +1448,11 @@ def ets_f(
                         continue
                     if stype != "N" and m == 1:
                         continue
+                    key = (ttype, stype)
+                    if key not in init_states:
+                        init_states[key] = initstate(
+                            y, m if stype != "N" else 1, ttype, stype
+                        )
                     fit = etsmodel(
                         y,
                         m,
@@ -1291,7 +1470,11 @@ def ets_f(
                         nmse=nmse,
                         bounds=bounds,
                         maxit=maxit,
+                        init_state=init_states[key],
+                        starts=optima.get(key, []),
                     )
+                    if fit["fit"] is not None:
+                        optima.setdefault(key, []).append(fit["fit"].x)
                     fit_ic = fit[ic]
                     if not np.isnan(fit_ic):
                         if fit_ic < best_ic:
@@ -1306,7 +1489,7 @@ def ets_f(
     model["method"] = f"ETS({best_e},{best_t}{'d' if best_d else ''},{best_s})"
     return model
 
-# %% ../nbs/src/ets.ipynb 35
+# %% ../nbs/src/ets.ipynb 36
 def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     forecast = np.full(h, fill_value=np.nan)
     states = obj["states"][-1, :]
@@ -1316,10 +1499,11 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
     etsforecast(x=states, m=m, trend=ttype, season=stype, phi=phi, h=h, f=forecast)
     return forecast
 
-# %% ../nbs/src/ets.ipynb 36
+# %% ../nbs/src/ets.ipynb 37
 # @njit(nogil=NOGIL, cache=CACHE)
 def _compute_sigmah(pf, h, sigma, cvals):
-    theta = np.full(h, np.nan)
+    # pf can have the forecasts of several series by columns
+    theta = np.full(pf.shape, np.nan)
     theta[0] = pf[0] ** 2
 
     for k in range(1, h):
@@ -1329,13 +1513,13 @@ def _compute_sigmah(pf, h, sigma, cvals):
             sum_val = sum_val + val
         theta[k] = pf[k] ** 2 + sigma * sum_val
 
-    sigmah = np.full(h, np.nan)
+    sigmah = np.full(pf.shape, np.nan)
     for k in range(0, h):
         sigmah[k] = (1 + sigma) * theta[k] - pf[k] ** 2
 
     return sigmah
 
-# %% ../nbs/src/ets.ipynb 37
+# %% ../nbs/src/ets.ipynb 38
 def _class3models(
     h,
     sigma,
@@ -1437,16 +1621,14 @@ def _class3models(
 
     return var
 
-# %% ../nbs/src/ets.ipynb 38
-def _compute_pred_intervals(model, forecasts, h, level):
-    sigma = model["sigma2"]
-    season_length = model["m"]
-    pf = forecasts["mean"]
-
-    model_type = model["components"]
-    steps = steps = np.arange(1, h + 1)
+# %% ../nbs/src/ets.ipynb 39
+def _analytic_sigmah(model_type, alpha, beta, gamma, phi, sigma, pf, season_length):
+    # variances of the class 1 and 2 models, None for the rest.
+    # pf can have the forecasts of several models with the same components by columns,
+    # the parameters and sigma are then arrays with one value per model
+    h = pf.shape[0]
+    steps = np.arange(1, h + 1).reshape(-1, *[1] * (pf.ndim - 1))
     hm = np.floor((h - 1) / season_length)
-    last_state = model["states"][-1]
 
     # error, trend, and seasonality type
     error = model_type[0]
@@ -1454,12 +1636,6 @@ def _compute_pred_intervals(model, forecasts, h, level):
     seasonality = model_type[2]
     damped = model_type[3]
 
-    # parameters
-    alpha = model["par"][0]
-    beta = model["par"][1]
-    gamma = model["par"][2]
-    phi = model["par"][3]
-
     exp1 = (
         alpha**2
         + alpha * beta * steps
@@ -1470,7 +1646,6 @@ def _compute_pred_intervals(model, forecasts, h, level):
     exp4 = (beta * phi * (1 - phi**steps)) / ((1 - phi) ** 2 * (1 - phi**2))
     exp5 = 2 * alpha * (1 - phi**2) + beta * phi * (1 + 2 * phi - phi**steps)
 
-    compute_intervals = True
     # Class 1 models
     if error == "A" and trend == "N" and seasonality == "N" and damped == "N":
         # Model ANN
@@ -1517,7 +1692,7 @@ def _compute_pred_intervals(model, forecasts, h, level):
     # Class 2 models
     elif error == "M" and trend == "N" and seasonality == "N" and damped == "N":
         # Model MNN
-        cvals = np.full(h, alpha)
+        cvals = np.full(pf.shape, alpha)
         sigmah = _compute_sigmah(pf, h, sigma, cvals)
 
     elif error == "M" and trend == "A" and seasonality == "N" and damped == "N":
@@ -1527,7 +1702,7 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     elif error == "M" and trend == "A" and seasonality == "N" and damped == "D":
         # Model MAdN
-        cvals = np.full(h, np.nan)
+        cvals = np.full(pf.shape, np.nan)
         for k in range(1, h + 1):
             sum_phi = 0
             for j in range(1, k + 1):
@@ -1537,7 +1712,7 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     elif error == "M" and trend == "N" and seasonality == "A" and damped == "N":
         # Model MNA
-        dvals = np.zeros(h)
+        dvals = np.zeros(steps.shape)
         for k in range(1, h + 1):
             val = k % season_length
             if val == 0:
@@ -1547,7 +1722,7 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     elif error == "M" and trend == "A" and seasonality == "A" and damped == "N":
         # Model MAA
-        dvals = np.zeros(h)
+        dvals = np.zeros(steps.shape)
         for k in range(1, h + 1):
             val = k % season_length
             if val == 0:
@@ -1557,12 +1732,12 @@ def _compute_pred_intervals(model, forecasts, h, level):
 
     elif error == "M" and trend == "A" and seasonality == "A" and damped == "D":
         # Model MAdA
-        dvals = np.zeros(h)
+        dvals = np.zeros(steps.shape)
         for k in range(1, h + 1):
             val = k % season_length
             if val == 0:
                 dvals[k - 1] = 1
-        cvals = np.full(h, np.nan)
+        cvals = np.full(pf.shape, np.nan)
         for k in range(1, h + 1):
             sum_phi = 0
             for j in range(1, k + 1):
@@ -1570,7 +1745,94 @@ def _compute_pred_intervals(model, forecasts, h, level):
             cvals[k - 1] = alpha + beta * sum_phi + gamma * dvals[k - 1]
         sigmah = _compute_sigmah(pf, h, sigma, cvals)
 
-    elif error == "M" and seasonality == "M":
+    else:
+        sigmah = None
+
+    return sigmah
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def etssimulate_many(states, m, error, trend, season, par, sigma2, noise):
+    # sample paths of several models from their last states, one model by row.
+    # noise has the standard normal errors of each path and is shared by all the models
+    n_paths, h = noise.shape
+    y_path = np.zeros((states.shape[0], n_paths, h))
+    for i in range(states.shape[0]):
+        alpha = par[i, 0]
+        beta = 0.0 if math.isnan(par[i, 1]) else par[i, 1]
+        gamma = 0.0 if math.isnan(par[i, 2]) else par[i, 2]
+        phi = 0.0 if math.isnan(par[i, 3]) else par[i, 3]
+        for k in range(n_paths):
+            e = math.sqrt(sigma2[i]) * noise[k]
+            etssimulate(
+                states[i],
+                m[i],
+                error[i],
+                trend[i],
+                season[i],
+                alpha,
+                beta,
+                gamma,
+                phi,
+                h,
+                y_path[i, k],
+                e,
+            )
+    return y_path
+
+
+def _simulate_pred_intervals(
+    states, m, error, trend, season, par, sigma2, h, level, nsim=5_000
+):
+    # quantiles of the simulated paths, with shape (len(level), n_models, h)
+    noise = np.random.default_rng(1).standard_normal((nsim, h))
+    lower = np.empty((len(level), states.shape[0], h))
+    upper = np.empty_like(lower)
+    # bound the memory used by the paths
+    chunk_size = max(1, 2**24 // (nsim * h))
+    for start in range(0, states.shape[0], chunk_size):
+        rows = slice(start, start + chunk_size)
+        y_path = etssimulate_many(
+            states[rows],
+            m[rows],
+            error[rows],
+            trend[rows],
+            season[rows],
+            par[rows],
+            sigma2[rows],
+            noise,
+        )
+        lower[:, rows] = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=1)
+        upper[:, rows] = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=1)
+    return lower, upper
+
+
+def _compute_pred_intervals(model, forecasts, h, level):
+    sigma = model["sigma2"]
+    season_length = model["m"]
+    pf = forecasts["mean"]
+
+    model_type = model["components"]
+    last_state = model["states"][-1]
+
+    # error, trend, and seasonality type
+    error = model_type[0]
+    trend = model_type[1]
+    seasonality = model_type[2]
+    damped = model_type[3]
+
+    # parameters
+    alpha = model["par"][0]
+    beta = model["par"][1]
+    gamma = model["par"][2]
+    phi = model["par"][3]
+
+    # Classes 1 and 2 models
+    sigmah = _analytic_sigmah(
+        model_type, alpha, beta, gamma, phi, sigma, pf, season_length
+    )
+
+    if sigmah is None and error == "M" and seasonality == "M":
         # Class 3 models
         sigmah = _class3models(
             h,
@@ -1587,52 +1849,27 @@ def _compute_pred_intervals(model, forecasts, h, level):
             phi,
         )
 
-    else:
+    if sigmah is None:
         # Classes 4 and 5 models
-        np.random.seed(1)
-        compute_intervals = False
-        nsim = 5000
-        y_path = np.zeros([nsim, h])
-
-        if math.isnan(beta):
-            beta = 0
-        if math.isnan(gamma):
-            gamma = 0
-        if math.isnan(phi):
-            phi = 0
-
-        for k in range(nsim):
-            e = np.random.normal(0, np.sqrt(sigma), h)
-            yhat = np.zeros(h)
-            etssimulate(
-                last_state,
-                season_length,
-                switch(error),
-                switch(trend),
-                switch(seasonality),
-                alpha,
-                beta,
-                gamma,
-                phi,
-                h,
-                yhat,
-                e,
-            )
-            y_path[k,] = yhat
-
-        lower = np.quantile(y_path, 0.5 - np.array(level) / 200, axis=0)
-        upper = np.quantile(y_path, 0.5 + np.array(level) / 200, axis=0)
+        lower, upper = _simulate_pred_intervals(
+            last_state[None],
+            np.array([season_length]),
+            *[np.array([switch(comp)]) for comp in model_type[:3]],
+            np.array(model["par"][:4], dtype=np.float64)[None],
+            np.array([sigma]),
+            h=h,
+            level=level,
+        )
         pi = {
-            **{f"lo-{lv}": lower[i] for i, lv in enumerate(level)},
-            **{f"hi-{lv}": upper[i] for i, lv in enumerate(level)},
+            **{f"lo-{lv}": lower[i, 0] for i, lv in enumerate(level)},
+            **{f"hi-{lv}": upper[i, 0] for i, lv in enumerate(level)},
         }
-
-    if compute_intervals:
+    else:
         pi = _calculate_intervals(forecasts, level=level, h=h, sigmah=np.sqrt(sigmah))
 
     return pi
 
-# %% ../nbs/src/ets.ipynb 39
+# %% ../nbs/src/ets.ipynb 40
 def forecast_ets(obj, h, level=None):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
@@ -1643,6 +1880,123 @@ def forecast_ets(obj, h, level=None):
         out = {**out, **pi}
     return out
 
-# %% ../nbs/src/ets.ipynb 46
+# %% ../nbs/src/ets.ipynb 41
+@njit(nogil=NOGIL, cache=CACHE)
+def etsforecast_many(states, m, trend, season, phi, h):
+    # forecasts of several models from their last states, one model by row
+    f = np.full((states.shape[0], h), np.nan)
+    for i in range(states.shape[0]):
+        etsforecast(states[i], m[i], trend[i], season[i], phi[i], h, f[i])
+    return f
+
+
+def forecast_ets_compact(params, h, level=None):
+    """Forecast several models from their stacked components, parameters, last states,
+    seasonal periods and variances, as stored by `AutoETS`.
+
+    Returns arrays with one row per model."""
+    components, inverse = np.unique(params["components"], return_inverse=True)
+    inverse = inverse.ravel()
+    codes = np.array(
+        [[switch(comp) for comp in model_type[:3]] for model_type in components]
+    )
+    error, trend, season = codes[inverse].T
+    damped = np.array([model_type[3] != "N" for model_type in components])[inverse]
+    par = params["par"]
+    phi = np.where(damped, par[:, 3], 1.0)
+    m = params["m"]
+    out = {"mean": etsforecast_many(params["states"], m, trend, season, phi, h)}
+    if level is None:
+        return out
+    z = _quantiles(level)
+    lower = np.empty((len(level), *out["mean"].shape))
+    upper = np.empty_like(lower)
+    for i, model_type in enumerate(components):
+        for season_length in np.unique(m[inverse == i]):
+            idxs = np.where((inverse == i) & (m == season_length))[0]
+            # the forecasts of the models by columns
+            pf = out["mean"][idxs].T
+            sigma2 = params["sigma2"][idxs]
+            alpha, beta, gamma, phi = par[idxs, :4].T
+            sigmah = _analytic_sigmah(
+                model_type, alpha, beta, gamma, phi, sigma2, pf, season_length
+            )
+            if sigmah is not None:
+                lower[:, idxs] = (pf - z[:, None, None] * np.sqrt(sigmah)).transpose(
+                    0, 2, 1
+                )
+                upper[:, idxs] = (pf + z[:, None, None] * np.sqrt(sigmah)).transpose(
+                    0, 2, 1
+                )
+            elif model_type[0] == "M" and model_type[2] == "M":
+                # the class 3 variances are computed model by model
+                n_states = 1 + (model_type[1] != "N") + season_length
+                for j in idxs:
+                    sigmah = _class3models(
+                        h,
+                        params["sigma2"][j],
+                        params["states"][j, :n_states],
+                        season_length,
+                        *model_type,
+                        *par[j, :4],
+                    )
+                    lower[:, j] = out["mean"][j] - z[:, None] * np.sqrt(sigmah)
+                    upper[:, j] = out["mean"][j] + z[:, None] * np.sqrt(sigmah)
+            else:
+                lower[:, idxs], upper[:, idxs] = _simulate_pred_intervals(
+                    params["states"][idxs],
+                    m[idxs],
+                    error[idxs],
+                    trend[idxs],
+                    season[idxs],
+                    par[idxs],
+                    params["sigma2"][idxs],
+                    h=h,
+                    level=level,
+                )
+    out.update({f"lo-{lv}": lower[i] for i, lv in enumerate(level)})
+    out.update({f"hi-{lv}": upper[i] for i, lv in enumerate(level)})
+    return out
+
+# %% ../nbs/src/ets.ipynb 50
 def forward_ets(fitted_model, y):
     return ets_f(y=y, m=fitted_model["m"], model=fitted_model)
+
+# %% ../nbs/src/ets.ipynb 51
+def update_ets(fitted_model, y):
+    """Advance the states of `fitted_model` with the new observations `y`
+    without re-estimating its parameters."""
+    errortype, trendtype, seasontype = fitted_model["components"][:3]
+    damped = fitted_model["components"][3] != "N"
+    alpha, beta, gamma, phi = fitted_model["par"][:4]
+    _, e, states, _ = pegelsresid_C(
+        y=y,
+        m=fitted_model["m"],
+        init_state=fitted_model["states"][-1],
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=damped,
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
+        nmse=1,
+    )
+    if errortype == "A":
+        fits = y - e
+    else:
+        # protect e == -1
+        aux_e = np.copy(e)
+        aux_e[aux_e == -1.0] = -1 + 1e-3
+        fits = y / (1 + aux_e)
+    e = np.concatenate([fitted_model["residuals"], e])
+    sq_e = e**2
+    sigma2 = sq_e[~np.isinf(sq_e)].sum() / (e.size - fitted_model["n_params"] - 1)
+    return {
+        **fitted_model,
+        "residuals": e,
+        "fitted": np.concatenate([fitted_model["fitted"], fits]),
+        "states": np.vstack([fitted_model["states"], states[1:]]),
+        "sigma2": sigma2,
+    }
@@ -6,7 +6,6 @@ __all__ = ['garch_model', 'garch_forecast']
 # %% ../nbs/src/garch.ipynb 4
 import numpy as np
 from numba import njit
-from scipy.optimize import minimize
 
 from .utils import CACHE, NOGIL
 
@@ -64,11 +63,18 @@ def garch_sigma2(x0, x, p, q):
     sigma2[0] = np.var(x)  # sigma2 can be initialized with the unconditional variance
 
     for k in range(max(p, q), len(x)):
-        psum = np.flip(alpha) * (x[k - p : k] ** 2)
-        psum = np.nansum(psum)
+        # same terms and order as np.nansum(np.flip(alpha)*(x[k-p:k]**2))
+        psum = 0.0
+        for i in range(p - 1, -1, -1):
+            term = alpha[i] * x[k - 1 - i] ** 2
+            if not np.isnan(term):
+                psum += term
         if q != 0:
-            qsum = np.flip(beta) * (sigma2[k - q : k])
-            qsum = np.nansum(qsum)
+            qsum = 0.0
+            for j in range(q - 1, -1, -1):
+                term = beta[j] * sigma2[k - 1 - j]
+                if not np.isnan(term):
+                    qsum += term
             sigma2[k] = w + psum + qsum
         else:
             sigma2[k] = w + psum
@@ -99,28 +105,169 @@ def garch_loglik(x0, x, p, q):
     return -loglik
 
 # %% ../nbs/src/garch.ipynb 18
-def garch_model(x, p, q):
-    np.random.seed(1)
-    x0 = np.repeat(0.1, p + q + 1)
-    bnds = ((0, None),) * len(x0)
-    cons = {"type": "ineq", "fun": garch_cons}
-    opt = minimize(
-        garch_loglik, x0, args=(x, p, q), method="SLSQP", bounds=bnds, constraints=cons
-    )
-
-    coeff = opt.x
+@njit(nogil=NOGIL, cache=CACHE)
+def garch_loglik_grad(x0, x, p, q):
+    # negative log likelihood along with its gradient and the information matrix,
+    # using the derivatives of the recursion of garch_sigma2
+    n_par = x0.size
+    w = x0[0]
+    alpha = x0[1 : (p + 1)]
+    beta = x0[(p + 1) :]
+
+    sigma2 = np.full((len(x),), np.nan)
+    sigma2[0] = np.var(x)
+    dsigma2 = np.zeros((len(x), n_par))
+    z = x - np.nanmean(x)
+    loglik = 0.0
+    grad = np.zeros(n_par)
+    info = np.zeros((n_par, n_par))
+
+    for k in range(max(p, q), len(x)):
+        sigma2[k] = w
+        dsigma2[k, 0] = 1.0
+        for i in range(p):
+            sigma2[k] += alpha[i] * x[k - 1 - i] ** 2
+            dsigma2[k, 1 + i] = x[k - 1 - i] ** 2
+        for j in range(q):
+            if not np.isnan(sigma2[k - 1 - j]):
+                sigma2[k] += beta[j] * sigma2[k - 1 - j]
+                dsigma2[k, 1 + p + j] += sigma2[k - 1 - j]
+                for i in range(n_par):
+                    dsigma2[k, i] += beta[j] * dsigma2[k - 1 - j, i]
+        s2 = sigma2[k] if sigma2[k] != 0 else 1e-10
+        loglik = loglik - 0.5 * (np.log(2 * np.pi) + np.log(s2) + (z[k] ** 2) / s2)
+        for i in range(n_par):
+            grad[i] += 0.5 * (1 / s2 - (z[k] ** 2) / (s2**2)) * dsigma2[k, i]
+            for j in range(n_par):
+                info[i, j] += 0.5 * dsigma2[k, i] * dsigma2[k, j] / (s2**2)
+
+    return -loglik, grad, info
+
+# %% ../nbs/src/garch.ipynb 20
+@njit(nogil=NOGIL, cache=CACHE)
+def solve_qp(B, g, G, h):
+    # minimizes 0.5*s'Bs + g's subject to Gs >= h with a primal active set method.
+    # s = 0 is the starting point, so h must be non positive.
+    n = g.size
+    m = G.shape[0]
+    s = np.zeros(n)
+    lam = np.zeros(m)
+    active = h >= 0
+    for _ in range(5 * (n + m)):
+        idxs = np.nonzero(active)[0]
+        k = idxs.size
+        # step to the minimum keeping the active constraints
+        kkt = np.zeros((n + k, n + k))
+        kkt[:n, :n] = B
+        kkt[:n, n:] = -G[idxs].T
+        kkt[n:, :n] = G[idxs]
+        rhs = np.zeros(n + k)
+        rhs[:n] = -(B @ s + g)
+        sol = np.linalg.lstsq(kkt, rhs)[0]
+        d = sol[:n]
+        if np.abs(d).max() <= 1e-10 * (1 + np.abs(s).max()):
+            lam[:] = 0.0
+            if k == 0:
+                break
+            lam[idxs] = sol[n:]
+            j = idxs[np.argmin(sol[n:])]
+            if lam[j] >= 0:
+                break
+            # release the constraint with the most negative multiplier
+            active[j] = False
+            lam[j] = 0.0
+            continue
+        step = 1.0
+        block = -1
+        for i in range(m):
+            gd = G[i] @ d
+            if not active[i] and gd < 0:
+                max_step = (h[i] - G[i] @ s) / gd
+                if max_step < step:
+                    step = max(max_step, 0.0)
+                    block = i
+        s = s + step * d
+        if block >= 0:
+            active[block] = True
+    return s, lam
+
+# %% ../nbs/src/garch.ipynb 21
+@njit(nogil=NOGIL, cache=CACHE)
+def garch_fit(x, p, q, max_iter=100, acc=1e-6):
+    # Sequential quadratic programming using the information matrix as the hessian
+    # and an L1 merit function for the line search, as in SLSQP.
+    # Constraints: coefficients are nonnegative and alpha+beta <= 1
+    n_par = p + q + 1
+    x0 = np.repeat(0.1, n_par)
+    G = np.zeros((n_par + 1, n_par))
+    G[0, 1:] = -1.0
+    for i in range(n_par):
+        G[i + 1, i] = 1.0
+    h = np.empty(n_par + 1)
+    loglik, grad, info = garch_loglik_grad(x0, x, p, q)
+    cons = garch_cons(x0)
+    penalty = 0.0
+    status = 9
+    for _ in range(max_iter):
+        h[0] = min(-cons, 0.0)
+        h[1:] = np.minimum(-x0, 0.0)
+        B = info + 1e-10 * np.trace(info) / n_par * np.eye(n_par)
+        s, lam = solve_qp(B, grad, G, h)
+        # check convergence
+        if abs(grad @ s) + lam[0] * abs(cons) < acc and max(-cons, 0.0) < acc:
+            status = 0
+            break
+        penalty = max(lam[0], (penalty + lam[0]) / 2)
+        merit0 = loglik + penalty * max(-cons, 0.0)
+        deriv = grad @ s - penalty * max(-cons, 0.0)
+        if deriv >= 0:
+            status = 8
+            break
+        # line search
+        prev_loglik = loglik
+        prev_x = x0
+        alpha = 1.0
+        for line in range(10):
+            deriv *= alpha
+            s *= alpha
+            x0 = np.maximum(prev_x + s, 0.0)
+            loglik = garch_loglik(x0, x, p, q)
+            cons = garch_cons(x0)
+            decrease = loglik + penalty * max(-cons, 0.0) - merit0
+            if decrease <= deriv / 10:
+                break
+            alpha = max(deriv / (2 * (deriv - decrease)), 0.1)
+        if (abs(loglik - prev_loglik) < acc or np.sqrt(s @ s) < acc) and max(
+            -cons, 0.0
+        ) < acc:
+            status = 0
+            break
+        loglik, grad, info = garch_loglik_grad(x0, x, p, q)
+    return x0, status
+
+# %% ../nbs/src/garch.ipynb 23
+_garch_messages = {
+    0: "Optimization terminated successfully",
+    8: "Positive directional derivative for linesearch",
+    9: "Iteration limit reached",
+}
+
+
+def garch_model(x, p, q, seed=1):
+    # a local generator keeps the global numpy state untouched, so fits can run in threads
+    rng = np.random.default_rng(seed)
+    coeff, status = garch_fit(x, p, q)
     sigma2 = garch_sigma2(coeff, x, p, q)
     fitted = np.full((len(x),), np.nan)
 
-    for k in range(p, len(x)):
-        error = np.random.normal(loc=0, scale=1)
-        fitted[k] = error * np.sqrt(sigma2[k])
+    error = rng.normal(loc=0, scale=1, size=max(len(x) - p, 0))
+    fitted[p:] = error * np.sqrt(sigma2[p:])
 
     res = {
         "p": p,
         "q": q,
         "coeff": coeff,
-        "message": opt.message,
+        "message": _garch_messages[status],
         "y_vals": x[-p:],
         "sigma2_vals": sigma2[-q:],
         "fitted": fitted,
@@ -128,27 +275,16 @@ def garch_model(x, p, q):
 
     return res
 
-# %% ../nbs/src/garch.ipynb 22
-def garch_forecast(mod, h):
-    np.random.seed(1)
-
-    p = mod["p"]
-    q = mod["q"]
-
-    w = mod["coeff"][0]
-    alpha = mod["coeff"][1 : (p + 1)]
-    beta = mod["coeff"][(p + 1) :]
-
-    y_vals = np.full((h + p,), np.nan)
-    sigma2_vals = np.full((h + q,), np.nan)
-
-    y_vals[0:p] = mod["y_vals"]
-
-    if q != 0:
-        sigma2_vals[0:q] = mod["sigma2_vals"]
+# %% ../nbs/src/garch.ipynb 27
+@njit(nogil=NOGIL, cache=CACHE)
+def garch_fcst(coeff, p, q, y_vals, sigma2_vals, errors):
+    h = len(errors)
+    w = coeff[0]
+    alpha = coeff[1 : (p + 1)]
+    beta = coeff[(p + 1) :]
 
     for k in range(0, h):
-        error = np.random.normal(loc=0, scale=1)
+        error = errors[k]
         psum = np.flip(alpha) * (y_vals[k : p + k] ** 2)
         psum = np.nansum(psum)
         if q != 0:
@@ -161,6 +297,24 @@ def garch_forecast(mod, h):
         y_vals[p + k] = yhat
         sigma2_vals[q + k] = sigma2hat
 
+# %% ../nbs/src/garch.ipynb 28
+def garch_forecast(mod, h, seed=1):
+    rng = np.random.default_rng(seed)
+
+    p = mod["p"]
+    q = mod["q"]
+
+    y_vals = np.full((h + p,), np.nan)
+    sigma2_vals = np.full((h + q,), np.nan)
+
+    y_vals[0:p] = mod["y_vals"]
+
+    if q != 0:
+        sigma2_vals[0:q] = mod["sigma2_vals"]
+
+    errors = rng.normal(loc=0, scale=1, size=h)
+    garch_fcst(mod["coeff"], p, q, y_vals, sigma2_vals, errors)
+
     res = {"mean": y_vals[-h:], "sigma2": sigma2_vals[-h:], "fitted": mod["fitted"]}
 
     return res
@@ -15,26 +15,44 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from numba import njit
-from scipy.optimize import minimize
 from scipy.special import inv_boxcox
 
 from statsforecast.arima import (
     Arima,
     auto_arima_f,
+    compact_arima,
     forecast_arima,
+    forecast_arima_batch,
+    forecast_arima_compact,
     fitted_arima,
     forward_arima,
+    update_arima,
+    warm_start_arima,
+)
+from statsforecast.ces import (
+    auto_ces,
+    forecast_ces,
+    forecast_ces_compact,
+    forward_ces,
+    update_ces,
 )
-from .ces import auto_ces, forecast_ces, forward_ces
 from statsforecast.ets import (
     _PHI_LOWER,
     _PHI_UPPER,
     ets_f,
     forecast_ets,
+    forecast_ets_compact,
     forward_ets,
+    update_ets,
 )
 from .mstl import mstl
-from .theta import auto_theta, forecast_theta, forward_theta
+from statsforecast.theta import (
+    auto_theta,
+    forecast_theta,
+    forecast_theta_compact,
+    forward_theta,
+    update_theta,
+)
 from .garch import garch_model, garch_forecast
 from .tbats import tbats_selection, tbats_forecast, _compute_sigmah
 from statsforecast.utils import (
@@ -65,6 +83,19 @@ def _add_fitted_pi(res, se, level):
     res = {**res, **lo, **hi}
     return res
 
+
+def _flatten_arima_batch(fcst, level):
+    # one row per serie to the layout of the forecasts of all the series
+    res = {"mean": fcst["mean"].ravel()}
+    if level is None:
+        return res
+    level = sorted(level)
+    return {
+        **res,
+        **{f"lo-{l}": fcst["lower"][f"{l}%"].ravel() for l in reversed(level)},
+        **{f"hi-{l}": fcst["upper"][f"{l}%"].ravel() for l in level},
+    }
+
 # %% ../nbs/src/core/models.ipynb 10
 def _add_conformal_distribution_intervals(
     fcst: Dict,
@@ -110,6 +141,13 @@ def _get_conformal_method(method: str):
 # %% ../nbs/src/core/models.ipynb 12
 class _TS:
     uses_exog = False
+    # whether the fit and forecast hot paths are compiled with nogil, so they can run in threads
+    releases_gil = False
+    # whether `fit` accepts the previously fitted model of the series in `warm_start_from`
+    warm_starts = False
+    # whether `update` and `predict` give the forecasts of `forward` on the expanded series,
+    # so cross validation without refit only processes the new values of each window
+    update_matches_forward = False
 
     def new(self):
         b = type(self).__new__(type(self))
@@ -250,9 +288,18 @@ class AutoARIMA(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_jobs : int (default 1)
+        Number of threads used to fit the candidate models of a single series, -1 uses all the cores.
+        Useful for few long series, set `NIXTLA_NUMBA_RELEASE_GIL=1` so the threads run in parallel.
+    warm_start_tol : float (default 0.05)
+        Maximum increase of the information criterion per observation accepted in a warm start.
+        See the `warm_start_from` argument of `fit`.
     """
 
     uses_exog = True
+    warm_starts = True
+    update_matches_forward = True
+    model_: Dict[str, Any]
 
     def __init__(
         self,
@@ -289,6 +336,8 @@ class AutoARIMA(_TS):
         season_length: int = 1,
         alias: str = "AutoARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_jobs: int = 1,
+        warm_start_tol: float = 0.05,
     ):
         self.d = d
         self.D = D
@@ -323,6 +372,8 @@ class AutoARIMA(_TS):
         self.season_length = season_length
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.n_jobs = n_jobs
+        self.warm_start_tol = warm_start_tol
 
     def __repr__(self):
         return self.alias
@@ -331,6 +382,7 @@ class AutoARIMA(_TS):
         self,
         y: np.ndarray,
         X: Optional[np.ndarray] = None,
+        warm_start_from: Optional["AutoARIMA"] = None,
     ):
         """Fit the AutoARIMA model.
 
@@ -343,6 +395,10 @@ class AutoARIMA(_TS):
             Clean time series of shape (t, ).
         X : array-like
             Optional exogenous of shape (t, n_x).
+        warm_start_from : Optional[AutoARIMA]
+            AutoARIMA previously fitted on the same series. Its order is kept and its
+            coefficients are the starting point of the optimization. The order is searched
+            again only when the information criterion degrades more than `warm_start_tol`.
 
         Returns
         -------
@@ -350,41 +406,54 @@ class AutoARIMA(_TS):
             AutoARIMA fitted model.
         """
         with np.errstate(invalid="ignore"):
-            self.model_ = auto_arima_f(
-                x=y,
-                d=self.d,
-                D=self.D,
-                max_p=self.max_p,
-                max_q=self.max_q,
-                max_P=self.max_P,
-                max_Q=self.max_Q,
-                max_order=self.max_order,
-                max_d=self.max_d,
-                max_D=self.max_D,
-                start_p=self.start_p,
-                start_q=self.start_q,
-                start_P=self.start_P,
-                start_Q=self.start_Q,
-                stationary=self.stationary,
-                seasonal=self.seasonal,
-                ic=self.ic,
-                stepwise=self.stepwise,
-                nmodels=self.nmodels,
-                trace=self.trace,
-                approximation=self.approximation,
-                method=self.method,
-                truncate=self.truncate,
-                xreg=X,
-                test=self.test,
-                test_kwargs=self.test_kwargs,
-                seasonal_test=self.seasonal_test,
-                seasonal_test_kwargs=self.seasonal_test_kwargs,
-                allowdrift=self.allowdrift,
-                allowmean=self.allowmean,
-                blambda=self.blambda,
-                biasadj=self.biasadj,
-                period=self.season_length,
-            )
+            model_: Optional[Dict[str, Any]] = None
+            if isinstance(warm_start_from, AutoARIMA):
+                model_ = warm_start_arima(
+                    warm_start_from.model_,
+                    x=y,
+                    ic=self.ic,
+                    xreg=X,
+                    method=self.method,
+                    ic_tol=self.warm_start_tol,
+                )
+            if model_ is None:
+                model_ = auto_arima_f(
+                    x=y,
+                    d=self.d,
+                    D=self.D,
+                    max_p=self.max_p,
+                    max_q=self.max_q,
+                    max_P=self.max_P,
+                    max_Q=self.max_Q,
+                    max_order=self.max_order,
+                    max_d=self.max_d,
+                    max_D=self.max_D,
+                    start_p=self.start_p,
+                    start_q=self.start_q,
+                    start_P=self.start_P,
+                    start_Q=self.start_Q,
+                    stationary=self.stationary,
+                    seasonal=self.seasonal,
+                    ic=self.ic,
+                    stepwise=self.stepwise,
+                    nmodels=self.nmodels,
+                    trace=self.trace,
+                    approximation=self.approximation,
+                    method=self.method,
+                    truncate=self.truncate,
+                    xreg=X,
+                    test=self.test,
+                    test_kwargs=self.test_kwargs,
+                    seasonal_test=self.seasonal_test,
+                    seasonal_test_kwargs=self.seasonal_test_kwargs,
+                    allowdrift=self.allowdrift,
+                    allowmean=self.allowmean,
+                    blambda=self.blambda,
+                    biasadj=self.biasadj,
+                    period=self.season_length,
+                    n_jobs=self.n_jobs,
+                )
+            self.model_ = model_
 
         self._store_cs(y=y, X=X)
         return self
@@ -427,6 +496,68 @@ class AutoARIMA(_TS):
             }
         return res
 
+    def batch_predict_fitted(
+        self,
+        fitted_models: Sequence[Any],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted AutoARIMA models at once.
+
+        The Kalman forecasts of the models with the same state dimension
+        are computed in a single call.
+
+        Parameters
+        ----------
+        fitted_models : sequence
+            Fitted AutoARIMA models without exogenous regressors.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        fcst = forecast_arima_batch(
+            [fm.model_ for fm in fitted_models], h=h, level=level
+        )
+        return _flatten_arima_batch(fcst, level)
+
+    def _compact(self):
+        # the models with exogenous regressors need them to predict
+        if any("ex_" in name for name in self.model_["coef"]):
+            return None
+        return compact_arima(self.model_)
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted AutoARIMA models at once.
+
+        Parameters
+        ----------
+        params : dict
+            State spaces and coefficients of the fitted models stacked by rows,
+            the state spaces of smaller dimension are padded with zeros.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        fcst = forecast_arima_compact(params, h=h, level=level)
+        return _flatten_arima_batch(fcst, level)
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted AutoArima insample predictions.
 
@@ -517,6 +648,7 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                n_jobs=self.n_jobs,
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
@@ -538,6 +670,34 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted AutoARIMA model with new observations.
+
+        Runs the Kalman filter of the fitted model over the observations `y`
+        that follow the ones used to fit it, keeping the coefficients fixed.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of the new observations of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            AutoARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X, method=self.method)
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -593,7 +753,7 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 33
+# %% ../nbs/src/core/models.ipynb 41
 class AutoETS(_TS):
     """Automatic Exponential Smoothing model.
 
@@ -637,6 +797,9 @@ class AutoETS(_TS):
         intervals.
     """
 
+    releases_gil = True
+    update_matches_forward = True
+
     def __init__(
         self,
         season_length: int = 1,
@@ -724,6 +887,48 @@ class AutoETS(_TS):
             }
         return res
 
+    def _compact(self):
+        # the states have the same size for every serie to stack them
+        states = np.full(2 + self.season_length, np.nan)
+        last_state = self.model_["states"][-1]
+        states[: last_state.size] = last_state
+        return {
+            "components": np.array(self.model_["components"]),
+            "par": self.model_["par"][:4],
+            "states": states,
+            "m": np.array(self.model_["m"]),
+            "sigma2": np.array(self.model_["sigma2"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted Exponential Smoothing models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters and last states of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        keys = ["mean"]
+        if level is not None:
+            level = sorted(level)
+            keys += [f"lo-{l}" for l in reversed(level)] + [f"hi-{l}" for l in level]
+        fcst = forecast_ets_compact(params, h=h, level=level)
+        return {key: fcst[key].ravel() for key in keys}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted Exponential Smoothing insample predictions.
 
@@ -803,6 +1008,37 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted Exponential Smoothing model with new observations.
+
+        Advances the states of the fitted model with the observations `y`
+        that follow the ones used to fit it, keeping the parameters fixed.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            Exponential Smoothing updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        model_ = update_ets(self.model_, y=y)
+        model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - model_["fitted"][-y.size :]
+        )
+        self.model_ = model_
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -858,7 +1094,7 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 48
+# %% ../nbs/src/core/models.ipynb 59
 class ETS(AutoETS):
     @classmethod
     def _warn(cls):
@@ -890,7 +1126,7 @@ class ETS(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 53
+# %% ../nbs/src/core/models.ipynb 64
 class AutoCES(_TS):
     """Complex Exponential Smoothing model.
 
@@ -922,19 +1158,29 @@ class AutoCES(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 5_000)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 1)
+        Seed of the simulated sample paths.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int = 1,
         model: str = "Z",
         alias: str = "CES",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 5_000,
+        seed: int = 1,
     ):
         self.season_length = season_length
         self.model = model
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.n_samples = n_samples
+        self.seed = seed
 
     def __repr__(self):
         return self.alias
@@ -985,7 +1231,9 @@ class AutoCES(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
-        fcst = forecast_ces(self.model_, h=h, level=level)
+        fcst = forecast_ces(
+            self.model_, h=h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         res = {"mean": fcst["mean"]}
         if level is None:
             return res
@@ -1000,6 +1248,57 @@ class AutoCES(_TS):
             }
         return res
 
+    def _compact(self):
+        # the forecasts start from the states of the last season
+        n, m = self.model_["n"], self.model_["m"]
+        states = self.model_["states"][
+            n : n + (1 if self.model_["seasontype"] == "N" else m)
+        ]
+        return {
+            "seasontype": np.array(self.model_["seasontype"]),
+            "par": np.array(
+                [
+                    self.model_["par"][k]
+                    for k in ["alpha_0", "alpha_1", "beta_0", "beta_1"]
+                ]
+            ),
+            "states": states,
+            "n_states": np.array(states.shape),
+            "m": np.array(m),
+            "sigma2": np.array(self.model_["sigma2"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted Complex Exponential Smoothing models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters and last states of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        keys = ["mean"]
+        if level is not None:
+            level = sorted(level)
+            keys += [f"lo-{l}" for l in reversed(level)] + [f"hi-{l}" for l in level]
+        fcst = forecast_ces_compact(
+            params, h=h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
+        return {key: fcst[key].ravel() for key in keys}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted Exponential Smoothing insample predictions.
 
@@ -1056,7 +1355,9 @@ class AutoCES(_TS):
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
         mod = auto_ces(y, m=self.season_length, model=self.model)
-        fcst = forecast_ces(mod, h, level=level)
+        fcst = forecast_ces(
+            mod, h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         keys = ["mean"]
         if fitted:
             keys.append("fitted")
@@ -1077,6 +1378,39 @@ class AutoCES(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted Complex Exponential Smoothing model with new observations.
+
+        Advances the states of the fitted model with the observations `y`
+        that follow the ones used to fit it, keeping the parameters fixed.
+        Unlike `forward`, the initial states aren't estimated again from the whole series,
+        so the forecasts can differ from the ones of `forward`.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            Complex Exponential Smoothing updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        model_ = update_ces(self.model_, y=y)
+        model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - model_["fitted"][-y.size :]
+        )
+        self.model_ = model_
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -1111,7 +1445,9 @@ class AutoCES(_TS):
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         mod = forward_ces(self.model_, y=y)
-        fcst = forecast_ces(mod, h, level=level)
+        fcst = forecast_ces(
+            mod, h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         keys = ["mean"]
         if fitted:
             keys.append("fitted")
@@ -1132,7 +1468,7 @@ class AutoCES(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 71
+# %% ../nbs/src/core/models.ipynb 85
 class AutoTheta(_TS):
     """AutoTheta model.
 
@@ -1158,8 +1494,14 @@ class AutoTheta(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 200)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 0)
+        Seed of the simulated sample paths.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int = 1,
@@ -1167,12 +1509,16 @@ class AutoTheta(_TS):
         model: Optional[str] = None,
         alias: str = "AutoTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
+        seed: int = 0,
     ):
         self.season_length = season_length
         self.decomposition_type = decomposition_type
         self.model = model
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.n_samples = n_samples
+        self.seed = seed
 
     def __repr__(self):
         return self.alias
@@ -1231,11 +1577,57 @@ class AutoTheta(_TS):
         forecasts : dict
             Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
         """
-        fcst = forecast_theta(self.model_, h=h, level=level)
+        fcst = forecast_theta(
+            self.model_, h=h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         if self.prediction_intervals is not None and level is not None:
             fcst = self._add_predict_conformal_intervals(fcst, level)
         return fcst
 
+    def _compact(self):
+        decompose = self.model_.get("decompose", False)
+        return {
+            "modeltype": np.array(self.model_["modeltype"]),
+            "par": np.array([self.model_["par"]["alpha"], self.model_["par"]["theta"]]),
+            "states": self.model_["states"][-1],
+            "n": np.array(self.model_["n"]),
+            "mean_y": np.array(self.model_["mean_y"]),
+            "sigma": np.array(np.std(self.model_["residuals"][3:], ddof=1)),
+            "decomposition_type": np.array(
+                self.model_["decomposition_type"] if decompose else ""
+            ),
+            "seas_forecast": self.model_["seas_forecast"]["mean"]
+            if decompose
+            else np.empty(0),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted AutoTheta models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters and last states of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        fcst = forecast_theta_compact(
+            params, h=h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
+        return {key: val.ravel() for key, val in fcst.items()}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted AutoTheta insample predictions.
 
@@ -1296,7 +1688,9 @@ class AutoTheta(_TS):
             model=self.model,
             decomposition_type=self.decomposition_type,
         )
-        res = forecast_theta(mod, h, level=level)
+        res = forecast_theta(
+            mod, h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         if self.prediction_intervals is not None:
             res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
         if fitted:
@@ -1307,6 +1701,39 @@ class AutoTheta(_TS):
             res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted AutoTheta model with new observations.
+
+        Advances the states of the fitted model with the observations `y`
+        that follow the ones used to fit it, keeping the parameters fixed.
+        Unlike `forward`, the initial states aren't estimated again from the whole series,
+        so the forecasts can differ from the ones of `forward`.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            AutoTheta updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        model_ = update_theta(self.model_, y=y)
+        model_["fitted"] = np.append(
+            self.model_["fitted"], y - model_["residuals"][-y.size :]
+        )
+        self.model_ = model_
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -1341,7 +1768,9 @@ class AutoTheta(_TS):
         if not hasattr(self, "model_"):
             raise Exception("You have to use the `fit` method first")
         mod = forward_theta(self.model_, y=y)
-        res = forecast_theta(mod, h, level=level)
+        res = forecast_theta(
+            mod, h, level=level, n_samples=self.n_samples, seed=self.seed
+        )
         if self.prediction_intervals is not None:
             res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
         if fitted:
@@ -1352,7 +1781,7 @@ class AutoTheta(_TS):
             res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 87
+# %% ../nbs/src/core/models.ipynb 104
 class ARIMA(_TS):
     """ARIMA model.
 
@@ -1403,6 +1832,7 @@ class ARIMA(_TS):
     """
 
     uses_exog = True
+    update_matches_forward = True
 
     def __init__(
         self,
@@ -1511,6 +1941,68 @@ class ARIMA(_TS):
             }
         return res
 
+    def batch_predict_fitted(
+        self,
+        fitted_models: Sequence[Any],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted ARIMA models at once.
+
+        The Kalman forecasts of the models with the same state dimension
+        are computed in a single call.
+
+        Parameters
+        ----------
+        fitted_models : sequence
+            Fitted ARIMA models without exogenous regressors.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        fcst = forecast_arima_batch(
+            [fm.model_ for fm in fitted_models], h=h, level=level
+        )
+        return _flatten_arima_batch(fcst, level)
+
+    def _compact(self):
+        # the models with exogenous regressors need them to predict
+        if any("ex_" in name for name in self.model_["coef"]):
+            return None
+        return compact_arima(self.model_)
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted ARIMA models at once.
+
+        Parameters
+        ----------
+        params : dict
+            State spaces and coefficients of the fitted models stacked by rows,
+            the state spaces of smaller dimension are padded with zeros.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        fcst = forecast_arima_compact(params, h=h, level=level)
+        return _flatten_arima_batch(fcst, level)
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted insample predictions.
 
@@ -1600,6 +2092,34 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted ARIMA model with new observations.
+
+        Runs the Kalman filter of the fitted model over the observations `y`
+        that follow the ones used to fit it, keeping the coefficients fixed.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of the new observations of shape (t, n_x).
+
+        Returns
+        -------
+        self :
+            ARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X, method=self.method)
+        return self
+
     def forward(
         self,
         y: np.ndarray,
@@ -1655,7 +2175,7 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 102
+# %% ../nbs/src/core/models.ipynb 122
 class AutoRegressive(ARIMA):
     """Simple Autoregressive model.
 
@@ -1730,7 +2250,7 @@ class AutoRegressive(ARIMA):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 117
+# %% ../nbs/src/core/models.ipynb 137
 @njit(nogil=NOGIL, cache=CACHE)
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     """Perform simple exponential smoothing on a series.
@@ -1754,12 +2274,21 @@ def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray
     return forecast, mse, fitted
 
 
+@njit(nogil=NOGIL, cache=CACHE)
 def _ses_mse(alpha: float, x: np.ndarray) -> float:
     """Compute the mean squared error of a simple exponential smoothing fit."""
-    _, mse, _ = _ses_fcst_mse(x, alpha)
-    return mse
+    # same computations as _ses_fcst_mse without storing the fitted values
+    smoothed = x[0]
+    n = x.size
+    mse = 0.0
+    for i in range(1, n):
+        smoothed = (alpha * x[i - 1] + (1 - alpha) * smoothed).item()
+        error = x[i] - smoothed
+        mse += error * error
+    return mse / n
 
 
+@njit(nogil=NOGIL, cache=CACHE)
 def _ses_forecast(x: np.ndarray, alpha: float) -> Tuple[float, np.ndarray]:
     """One step ahead forecast with simple exponential smoothing."""
     forecast, _, fitted = _ses_fcst_mse(x, alpha)
@@ -1782,17 +2311,161 @@ def _probability(x: np.ndarray) -> np.ndarray:
     return (x != 0).astype(np.int32)
 
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _ses_optimal_alpha(
+    x: np.ndarray,
+    lower: float,
+    upper: float,
+    xatol: float = 1e-8,
+    maxiter: int = 500,
+) -> float:
+    """Minimizes the SES mean squared error over [lower, upper] with Brent's bounded method."""
+    if x.size < 3:
+        # the mse doesn't depend on alpha
+        return lower
+    golden_mean = 0.5 * (3.0 - np.sqrt(5.0))
+    sqrt_eps = np.sqrt(2.2e-16)
+    a, b = lower, upper
+    # xf is the best point so far, nfc the second best and fulc the previous value of nfc
+    xf = nfc = fulc = a + golden_mean * (b - a)
+    fx = fnfc = ffulc = _ses_mse(xf, x)
+    rat = e = 0.0
+    xm = 0.5 * (a + b)
+    tol1 = sqrt_eps * abs(xf) + xatol / 3.0
+    tol2 = 2.0 * tol1
+    for _ in range(maxiter):
+        if abs(xf - xm) <= tol2 - 0.5 * (b - a):
+            break
+        golden = True
+        if abs(e) > tol1:
+            # parabolic step
+            golden = False
+            r = (xf - nfc) * (fx - ffulc)
+            q = (xf - fulc) * (fx - fnfc)
+            p = (xf - fulc) * q - (xf - nfc) * r
+            q = 2.0 * (q - r)
+            if q > 0.0:
+                p = -p
+            q = abs(q)
+            r = e
+            e = rat
+            if abs(p) < abs(0.5 * q * r) and q * (a - xf) < p < q * (b - xf):
+                rat = p / q
+                u = xf + rat
+                # don't evaluate too close to the bounds
+                if u - a < tol2 or b - u < tol2:
+                    rat = tol1 if xm >= xf else -tol1
+            else:
+                golden = True
+        if golden:
+            e = a - xf if xf >= xm else b - xf
+            rat = golden_mean * e
+        u = xf + max(abs(rat), tol1) * (1.0 if rat >= 0 else -1.0)
+        fu = _ses_mse(u, x)
+        if fu <= fx:
+            if u >= xf:
+                a = xf
+            else:
+                b = xf
+            fulc, ffulc = nfc, fnfc
+            nfc, fnfc = xf, fx
+            xf, fx = u, fu
+        else:
+            if u < xf:
+                a = u
+            else:
+                b = u
+            if fu <= fnfc or nfc == xf:
+                fulc, ffulc = nfc, fnfc
+                nfc, fnfc = u, fu
+            elif fu <= ffulc or fulc == xf or fulc == nfc:
+                fulc, ffulc = u, fu
+        xm = 0.5 * (a + b)
+        tol1 = sqrt_eps * abs(xf) + xatol / 3.0
+        tol2 = 2.0 * tol1
+    return xf
+
+
+@njit(nogil=NOGIL, cache=CACHE)
 def _optimized_ses_forecast(
-    x: np.ndarray, bounds: Sequence[Tuple[float, float]] = [(0.1, 0.3)]
+    x: np.ndarray,
+    lower: float = 0.1,
+    upper: float = 0.3,
 ) -> Tuple[float, np.ndarray]:
-    """Searches for the optimal alpha and computes SES one step forecast."""
-    alpha = minimize(
-        fun=_ses_mse, x0=(0,), args=(x,), bounds=bounds, method="L-BFGS-B"
-    ).x[0]
+    """Searches for the optimal alpha in [lower, upper] and computes SES one step forecast."""
+    alpha = _ses_optimal_alpha(x, lower, upper)
     forecast, fitted = _ses_forecast(x, alpha)
     return forecast, fitted
 
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _ses_mse_derivatives(alpha: float, x: np.ndarray) -> Tuple[float, float, float]:
+    """Mean squared error of a simple exponential smoothing fit and its first two derivatives wrt alpha."""
+    smoothed = x[0]
+    d_smoothed = 0.0
+    d2_smoothed = 0.0
+    n = x.size
+    mse = 0.0
+    d_mse = 0.0
+    d2_mse = 0.0
+    for i in range(1, n):
+        d2_smoothed = -2 * d_smoothed + (1 - alpha) * d2_smoothed
+        d_smoothed = x[i - 1] - smoothed + (1 - alpha) * d_smoothed
+        smoothed = (alpha * x[i - 1] + (1 - alpha) * smoothed).item()
+        error = x[i] - smoothed
+        mse += error * error
+        d_mse -= 2 * error * d_smoothed
+        d2_mse += 2 * (d_smoothed * d_smoothed - error * d2_smoothed)
+    return mse / n, d_mse / n, d2_mse / n
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _ses_warm_alpha(
+    x: np.ndarray,
+    alpha: float,
+    lower: float,
+    upper: float,
+    xtol: float = 1e-8,
+    maxiter: int = 20,
+) -> float:
+    """Optimal alpha in [lower, upper] using Newton steps from a previous solution.
+
+    Falls back to the bounded search when the error isn't convex around `alpha`
+    or when one of the bounds has a lower error than the point found."""
+    if x.size < 3:
+        return lower
+    for _ in range(maxiter):
+        mse, d_mse, d2_mse = _ses_mse_derivatives(alpha, x)
+        if d2_mse <= 0:
+            break
+        new_alpha = min(max(alpha - d_mse / d2_mse, lower), upper)
+        if abs(new_alpha - alpha) < xtol:
+            if new_alpha > lower and _ses_mse(lower, x) < mse:
+                break
+            if new_alpha < upper and _ses_mse(upper, x) < mse:
+                break
+            return new_alpha
+        alpha = new_alpha
+    return _ses_optimal_alpha(x, lower, upper)
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _optimized_ses_prefix_forecasts(
+    x: np.ndarray,
+    lower: float = 0.1,
+    upper: float = 0.3,
+) -> np.ndarray:
+    """`_optimized_ses_forecast` of every prefix x[:i + 1].
+
+    The alpha of each prefix starts from the one of the previous prefix."""
+    out = np.empty(x.size)
+    alpha = lower
+    for i in range(x.size):
+        alpha = _ses_warm_alpha(x[: i + 1], alpha, lower, upper)
+        out[i], _ = _ses_forecast(x[: i + 1], alpha)
+    return out
+
+
 def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     """Splits an array into chunks and returns the sum of each chunk.
 
@@ -1801,7 +2474,7 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     n_elems = n_chunks * chunk_size
     return array[:n_elems].reshape(n_chunks, chunk_size).sum(axis=1)
 
-# %% ../nbs/src/core/models.ipynb 118
+# %% ../nbs/src/core/models.ipynb 140
 def _ses(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1814,7 +2487,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 119
+# %% ../nbs/src/core/models.ipynb 141
 class SimpleExponentialSmoothing(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -1840,6 +2513,8 @@ class SimpleExponentialSmoothing(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         alpha: float,
@@ -1977,20 +2652,20 @@ class SimpleExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 131
+# %% ../nbs/src/core/models.ipynb 153
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
     fitted: bool,  # fitted values
 ):
-    fcst_, fitted_vals = _optimized_ses_forecast(y, [(0.01, 0.99)])
+    fcst_, fitted_vals = _optimized_ses_forecast(y, 0.01, 0.99)
     mean = _repeat_val(val=fcst_, h=h)
     fcst = {"mean": mean}
     if fitted:
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 132
+# %% ../nbs/src/core/models.ipynb 154
 class SimpleExponentialSmoothingOptimized(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -2014,6 +2689,8 @@ class SimpleExponentialSmoothingOptimized(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "SESOpt",
@@ -2148,7 +2825,7 @@ class SimpleExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 144
+# %% ../nbs/src/core/models.ipynb 166
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2172,7 +2849,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 145
+# %% ../nbs/src/core/models.ipynb 167
 class SeasonalExponentialSmoothing(_TS):
     """SeasonalExponentialSmoothing model.
 
@@ -2205,6 +2882,8 @@ class SeasonalExponentialSmoothing(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int,
@@ -2351,7 +3030,7 @@ class SeasonalExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 160
+# %% ../nbs/src/core/models.ipynb 182
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2366,7 +3045,7 @@ def _seasonal_ses_optimized(
     for i in range(season_length):
         init_idx = i + n % season_length
         season_vals[i], fitted_vals[init_idx::season_length] = _optimized_ses_forecast(
-            y[init_idx::season_length], [(0.01, 0.99)]
+            y[init_idx::season_length], 0.01, 0.99
         )
     out = _repeat_val_seas(season_vals=season_vals, h=h)
     fcst = {"mean": out}
@@ -2374,8 +3053,10 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 161
+# %% ../nbs/src/core/models.ipynb 183
 class SeasonalExponentialSmoothingOptimized(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int,
@@ -2549,7 +3230,7 @@ class SeasonalExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 174
+# %% ../nbs/src/core/models.ipynb 196
 class Holt(AutoETS):
     """Holt's method.
 
@@ -2593,7 +3274,7 @@ class Holt(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 188
+# %% ../nbs/src/core/models.ipynb 210
 class HoltWinters(AutoETS):
     """Holt-Winters' method.
 
@@ -2636,7 +3317,23 @@ class HoltWinters(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 203
+# %% ../nbs/src/core/models.ipynb 224
+@njit(nogil=NOGIL, cache=CACHE)
+def _calculate_sigma_batch(
+    residuals: np.ndarray,  # stacked residuals
+    indptr: np.ndarray,  # series boundaries
+    dof: np.ndarray,  # degrees of freedom of each serie
+) -> np.ndarray:
+    n_series = indptr.size - 1
+    sigma = np.zeros(n_series)
+    for i in range(n_series):
+        if dof[i] > 0:
+            sigma[i] = np.sqrt(
+                np.nansum(residuals[indptr[i] : indptr[i + 1]] ** 2) / dof[i]
+            )
+    return sigma
+
+# %% ../nbs/src/core/models.ipynb 226
 def _historic_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2648,8 +3345,28 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 204
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _historic_average_batch(
+    data: np.ndarray,  # stacked time series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    fitted_vals = np.empty(data.size if fitted else 0, np.float32)
+    for i in range(n_series):
+        avg = data[indptr[i] : indptr[i + 1]].mean()
+        mean[i * h : (i + 1) * h] = avg
+        if fitted:
+            fitted_vals[indptr[i] : indptr[i + 1]] = avg
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 227
 class HistoricAverage(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "HistoricAverage",
@@ -2748,6 +3465,48 @@ class HistoricAverage(_TS):
 
         return res
 
+    def _compact(self):
+        return {
+            "mean": self.model_["mean"][0],
+            "sigma": np.array(self.model_["sigma"]),
+            "n": np.array(self.model_["n"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted HistoricAverage models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean = np.repeat(params["mean"], h)
+        res = {"mean": mean}
+        if level is None:
+            return res
+        level = sorted(level)
+        if self.prediction_intervals is not None:
+            raise NotImplementedError(
+                "Conformal prediction intervals are only available through `predict`."
+            )
+        sigmah = params["sigma"] * np.sqrt(1 + (1 / params["n"]))
+        pred_int = _calculate_intervals(res, level, mean.size, np.repeat(sigmah, h))
+        return {**res, **pred_int}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted HistoricAverage insample predictions.
 
@@ -2826,8 +3585,80 @@ class HistoricAverage(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 217
+    def batch_forecast(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Memory Efficient HistoricAverage predictions for many series at once.
+
+        Computes the same output as `forecast` for every serie in `data`
+        using a single compiled pass instead of one call per serie.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series stacked into an array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `data`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean, fitted_vals = _historic_average_batch(
+            data=data, indptr=indptr, h=h, fitted=fitted or (level is not None)
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            if self.prediction_intervals is not None:
+                raise NotImplementedError(
+                    "Conformal prediction intervals are only available through `forecast`."
+                )
+            sizes = np.diff(indptr)
+            sigma = _calculate_sigma_batch(data - fitted_vals, indptr, sizes - 1)
+            sigmah = sigma * np.sqrt(1 + (1 / sizes))
+            pred_int = _calculate_intervals(res, level, mean.size, np.repeat(sigmah, h))
+            res = {**res, **pred_int}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigmah, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 241
+@njit(nogil=NOGIL, cache=CACHE)
+def _naive_batch(
+    data: np.ndarray,  # stacked time series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    fitted_vals = np.full(data.size if fitted else 0, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        mean[i * h : (i + 1) * h] = data[end - 1]
+        if fitted:
+            fitted_vals[start + 1 : end] = data[start : end - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 242
 class Naive(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "Naive",
@@ -2925,6 +3756,48 @@ class Naive(_TS):
             res = {**res, **pred_int}
         return res
 
+    def _compact(self):
+        return {
+            "mean": self.model_["mean"][0],
+            "sigma": np.array(self.model_["sigma"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted Naive models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean = np.repeat(params["mean"], h)
+        res = {"mean": mean}
+        if level is None:
+            return res
+        level = sorted(level)
+        if self.prediction_intervals is not None:
+            raise NotImplementedError(
+                "Conformal prediction intervals are only available through `predict`."
+            )
+        steps = np.arange(1, h + 1)
+        sigmah = params["sigma"][:, None] * np.sqrt(steps)
+        pred_int = _calculate_intervals(res, level, mean.size, sigmah.ravel())
+        return {**res, **pred_int}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted Naive insample predictions.
 
@@ -2954,20 +3827,72 @@ class Naive(_TS):
     ):
         """Memory Efficient Naive predictions.
 
-        This method avoids memory burden due from object storage.
-        It is analogous to `fit_predict` without storing information.
-        It assumes you know the forecast horizon in advance.
+        This method avoids memory burden due from object storage.
+        It is analogous to `fit_predict` without storing information.
+        It assumes you know the forecast horizon in advance.
+
+        Parameters
+        ----------
+        y : numpy.array
+            Clean time series of shape (n,).
+        h: int
+            Forecast horizon.
+        X : array-like
+            Optional insample exogenous of shape (t, n_x).
+        X_future : array-like
+            Optional exogenous of shape (h, n_x).
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
+        """
+        out = _naive(y=y, h=h, fitted=fitted or (level is not None))
+        res = {"mean": out["mean"]}
+        if fitted:
+            res["fitted"] = out["fitted"]
+        if level is not None:
+            level = sorted(level)
+            if self.prediction_intervals is not None:
+                res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
+            else:
+                steps = np.arange(1, h + 1)
+                residuals = y - out["fitted"]
+                sigma = _calculate_sigma(residuals, len(residuals) - 1)
+                sigmah = sigma * np.sqrt(steps)
+                pred_int = _calculate_intervals(out, level, h, sigmah)
+                res = {**res, **pred_int}
+            if fitted:
+                residuals = y - out["fitted"]
+                sigma = _calculate_sigma(residuals, len(residuals) - 1)
+                res = _add_fitted_pi(res=res, se=sigma, level=level)
+        return res
+
+    def batch_forecast(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Memory Efficient Naive predictions for many series at once.
+
+        Computes the same output as `forecast` for every serie in `data`
+        using a single compiled pass instead of one call per serie.
 
         Parameters
         ----------
-        y : numpy.array
-            Clean time series of shape (n,).
-        h: int
+        data : numpy.array
+            Clean time series stacked into an array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `data`, of shape (n_series + 1,).
+        h : int
             Forecast horizon.
-        X : array-like
-            Optional insample exogenous of shape (t, n_x).
-        X_future : array-like
-            Optional exogenous of shape (h, n_x).
         level : List[float]
             Confidence levels (0-100) for prediction intervals.
         fitted : bool
@@ -2976,27 +3901,28 @@ class Naive(_TS):
         Returns
         -------
         forecasts : dict
-            Dictionary with entries `mean` for point predictions and `level_*` for probabilistic predictions.
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
         """
-        out = _naive(y=y, h=h, fitted=fitted or (level is not None))
-        res = {"mean": out["mean"]}
+        mean, fitted_vals = _naive_batch(
+            data=data, indptr=indptr, h=h, fitted=fitted or (level is not None)
+        )
+        res = {"mean": mean}
         if fitted:
-            res["fitted"] = out["fitted"]
+            res["fitted"] = fitted_vals
         if level is not None:
             level = sorted(level)
             if self.prediction_intervals is not None:
-                res = self._add_conformal_intervals(fcst=res, y=y, X=X, level=level)
-            else:
-                steps = np.arange(1, h + 1)
-                residuals = y - out["fitted"]
-                sigma = _calculate_sigma(residuals, len(residuals) - 1)
-                sigmah = sigma * np.sqrt(steps)
-                pred_int = _calculate_intervals(out, level, h, sigmah)
-                res = {**res, **pred_int}
+                raise NotImplementedError(
+                    "Conformal prediction intervals are only available through `forecast`."
+                )
+            sizes = np.diff(indptr)
+            sigma = _calculate_sigma_batch(data - fitted_vals, indptr, sizes - 1)
+            steps = np.arange(1, h + 1)
+            sigmah = sigma[:, None] * np.sqrt(steps)
+            pred_int = _calculate_intervals(res, level, mean.size, sigmah.ravel())
+            res = {**res, **pred_int}
             if fitted:
-                residuals = y - out["fitted"]
-                sigma = _calculate_sigma(residuals, len(residuals) - 1)
-                res = _add_fitted_pi(res=res, se=sigma, level=level)
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
         return res
 
     def forward(
@@ -3035,7 +3961,7 @@ class Naive(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 233
+# %% ../nbs/src/core/models.ipynb 259
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3054,8 +3980,34 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 234
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _random_walk_with_drift_batch(
+    data: np.ndarray,  # stacked time series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    fitted_vals = np.full(data.size if fitted else 0, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start > 1:
+            slope = (data[end - 1] - data[start]) / (end - start - 1)
+        else:
+            slope = np.nan
+        for j in range(h):
+            mean[i * h + j] = slope * (1 + j) + data[end - 1]
+        if fitted:
+            for t in range(start + 1, end):
+                fitted_vals[t] = slope + data[t - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 260
 class RandomWalkWithDrift(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "RWD",
@@ -3155,6 +4107,52 @@ class RandomWalkWithDrift(_TS):
             res = {**res, **pred_int}
         return res
 
+    def _compact(self):
+        return {
+            "slope": self.model_["slope"][0],
+            "last_y": self.model_["last_y"][0],
+            "sigma": np.array(self.model_["sigma"]),
+            "n": np.array(self.model_["n"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted RandomWalkWithDrift models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        hrange = np.arange(h, dtype=np.float32)
+        mean = params["slope"][:, None] * (1 + hrange) + params["last_y"][:, None]
+        res = {"mean": mean.ravel()}
+        if level is None:
+            return res
+        level = sorted(level)
+        if self.prediction_intervals is not None:
+            raise NotImplementedError(
+                "Conformal prediction intervals are only available through `predict`."
+            )
+        steps = np.arange(1, h + 1)
+        n = params["n"][:, None]
+        sigmah = params["sigma"][:, None] * np.sqrt(steps * (1 + steps / (n - 1)))
+        pred_int = _calculate_intervals(res, level, mean.size, sigmah.ravel())
+        return {**res, **pred_int}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted RandomWalkWithDrift insample predictions.
 
@@ -3232,8 +4230,89 @@ class RandomWalkWithDrift(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 249
+    def batch_forecast(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Memory Efficient RandomWalkWithDrift predictions for many series at once.
+
+        Computes the same output as `forecast` for every serie in `data`
+        using a single compiled pass instead of one call per serie.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series stacked into an array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `data`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean, fitted_vals = _random_walk_with_drift_batch(
+            data=data, indptr=indptr, h=h, fitted=fitted or (level is not None)
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            if self.prediction_intervals is not None:
+                raise NotImplementedError(
+                    "Conformal prediction intervals are only available through `forecast`."
+                )
+            sizes = np.diff(indptr)
+            sigma = _calculate_sigma_batch(data - fitted_vals, indptr, sizes - 1)
+            steps = np.arange(1, h + 1)
+            sigmah = sigma[:, None] * np.sqrt(
+                steps * (1 + steps / (sizes[:, None] - 1))
+            )
+            pred_int = _calculate_intervals(res, level, mean.size, sigmah.ravel())
+            res = {**res, **pred_int}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 276
+@njit(nogil=NOGIL, cache=CACHE)
+def _seasonal_naive_batch(
+    data: np.ndarray,  # stacked time series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+    season_length: int,  # season length
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, np.float32)
+    fitted_vals = np.full(data.size if fitted else 0, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        season_samples = min(season_length, end - start)
+        for j in range(h):
+            k = j % season_length
+            if k < season_samples:
+                mean[i * h + j] = data[end - season_samples + k]
+        if fitted:
+            for t in range(start + season_length, end):
+                fitted_vals[t] = data[t - season_length]
+    return mean, fitted_vals
+
+# %% ../nbs/src/core/models.ipynb 277
 class SeasonalNaive(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int,
@@ -3338,6 +4417,49 @@ class SeasonalNaive(_TS):
             res = {**res, **pred_int}
         return res
 
+    def _compact(self):
+        return {
+            "season_vals": self.model_["mean"],
+            "sigma": np.array(self.model_["sigma"]),
+        }
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted SeasonalNaive models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        repeats = int(np.ceil(h / self.season_length))
+        mean = np.tile(params["season_vals"], (1, repeats))[:, :h].ravel()
+        res = {"mean": mean}
+        if level is None:
+            return res
+        level = sorted(level)
+        if self.prediction_intervals is not None:
+            raise NotImplementedError(
+                "Conformal prediction intervals are only available through `predict`."
+            )
+        k = np.floor((h - 1) / self.season_length)
+        sigmah = params["sigma"] * np.sqrt(k + 1)
+        pred_int = _calculate_intervals(res, level, mean.size, np.repeat(sigmah, h))
+        return {**res, **pred_int}
+
     def predict_in_sample(self, level: Optional[List[int]] = None):
         """Access fitted SeasonalNaive insample predictions.
 
@@ -3420,7 +4542,66 @@ class SeasonalNaive(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 264
+    def batch_forecast(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Memory Efficient SeasonalNaive predictions for many series at once.
+
+        Computes the same output as `forecast` for every serie in `data`
+        using a single compiled pass instead of one call per serie.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series stacked into an array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `data`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean, fitted_vals = _seasonal_naive_batch(
+            data=data,
+            indptr=indptr,
+            h=h,
+            fitted=fitted or (level is not None),
+            season_length=self.season_length,
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        if level is not None:
+            level = sorted(level)
+            if self.prediction_intervals is not None:
+                raise NotImplementedError(
+                    "Conformal prediction intervals are only available through `forecast`."
+                )
+            sizes = np.diff(indptr)
+            sigma = _calculate_sigma_batch(
+                data - fitted_vals, indptr, sizes - self.season_length
+            )
+            k = np.floor((h - 1) / self.season_length)
+            sigmah = sigma * np.sqrt(k + 1)
+            pred_int = _calculate_intervals(res, level, mean.size, np.repeat(sigmah, h))
+            res = {**res, **pred_int}
+            if fitted:
+                res = _add_fitted_pi(res=res, se=np.repeat(sigma, sizes), level=level)
+        return res
+
+# %% ../nbs/src/core/models.ipynb 293
 def _window_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3435,8 +4616,29 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 265
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _window_average_batch(
+    data: np.ndarray,  # stacked time series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+    window_size: int,  # window size
+) -> np.ndarray:
+    if fitted:
+        raise NotImplementedError("return fitted")
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start >= window_size:
+            mean[i * h : (i + 1) * h] = data[end - window_size : end].mean()
+    return mean
+
+# %% ../nbs/src/core/models.ipynb 294
 class WindowAverage(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         window_size: int,
@@ -3533,6 +4735,36 @@ class WindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
+    def _compact(self):
+        return {"mean": self.model_["mean"][0]}
+
+    def batch_predict(
+        self,
+        params: Dict[str, np.ndarray],
+        h: int,
+        level: Optional[List[int]] = None,
+    ):
+        """Predict with many fitted WindowAverage models at once.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the fitted models stacked by rows.
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        res = {"mean": np.repeat(params["mean"], h)}
+        if level is None:
+            return res
+        raise Exception("You must pass `prediction_intervals` to compute them.")
+
     def predict_in_sample(self):
         """Access fitted WindowAverage insample predictions.
 
@@ -3594,7 +4826,50 @@ class WindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 276
+    def batch_forecast(
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        level: Optional[List[int]] = None,
+        fitted: bool = False,
+    ):
+        """Memory Efficient WindowAverage predictions for many series at once.
+
+        Computes the same output as `forecast` for every serie in `data`
+        using a single compiled pass instead of one call per serie.
+
+        Parameters
+        ----------
+        data : numpy.array
+            Clean time series stacked into an array of shape (n,).
+        indptr : numpy.array
+            Boundaries of each serie in `data`, of shape (n_series + 1,).
+        h : int
+            Forecast horizon.
+        level : List[float]
+            Confidence levels (0-100) for prediction intervals.
+        fitted : bool
+            Whether or not to return insample predictions.
+
+        Returns
+        -------
+        forecasts : dict
+            Dictionary with entries `mean` of shape (n_series * h,) for point predictions and `level_*` for probabilistic predictions.
+        """
+        mean = _window_average_batch(
+            data=data, indptr=indptr, h=h, fitted=fitted, window_size=self.window_size
+        )
+        res = {"mean": mean}
+        if level is None:
+            return res
+        if self.prediction_intervals is not None:
+            raise NotImplementedError(
+                "Conformal prediction intervals are only available through `forecast`."
+            )
+        raise Exception("You must pass `prediction_intervals` to compute them.")
+
+# %% ../nbs/src/core/models.ipynb 306
 def _seasonal_window_average(
     y: np.ndarray,
     h: int,
@@ -3611,8 +4886,10 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h)
     return {"mean": out}
 
-# %% ../nbs/src/core/models.ipynb 277
+# %% ../nbs/src/core/models.ipynb 307
 class SeasonalWindowAverage(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         season_length: int,
@@ -3784,7 +5061,7 @@ class SeasonalWindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 289
+# %% ../nbs/src/core/models.ipynb 319
 def _chunk_forecast(y, aggregation_level):
     lost_remainder_data = len(y) % aggregation_level
     y_cut = y[lost_remainder_data:]
@@ -3793,6 +5070,28 @@ def _chunk_forecast(y, aggregation_level):
     return sums_forecast
 
 
+@njit(nogil=NOGIL, cache=CACHE)
+def _chunk_prefix_forecasts(
+    y: np.ndarray, aggregation_levels: np.ndarray
+) -> np.ndarray:
+    """`_chunk_forecast` of every prefix y[:i + 1] with aggregation_levels[i].
+
+    The sums of the chunks are taken from the cumulative sum of the serie and
+    the alpha of each level starts from the last one found for that level."""
+    cumsum = np.zeros(y.size + 1)
+    cumsum[1:] = np.cumsum(y)
+    alphas = np.full(aggregation_levels.max() + 1, 0.1)
+    out = np.empty(aggregation_levels.size)
+    for i, agg_lvl in enumerate(aggregation_levels):
+        n = i + 1
+        lost_remainder_data = n % agg_lvl
+        bounds = cumsum[lost_remainder_data : n + 1 : agg_lvl]
+        aggregation_sums = bounds[1:] - bounds[:-1]
+        alphas[agg_lvl] = _ses_warm_alpha(aggregation_sums, alphas[agg_lvl], 0.1, 0.3)
+        out[i], _ = _ses_forecast(aggregation_sums, alphas[agg_lvl])
+    return out
+
+
 @njit(nogil=NOGIL, cache=CACHE)
 def _expand_fitted_demand(fitted: np.ndarray, y: np.ndarray) -> np.ndarray:
     out = np.empty_like(y)
@@ -3852,7 +5151,6 @@ def _adida(
     forecast = sums_forecast / aggregation_level
     res = {"mean": _repeat_val(val=forecast, h=h)}
     if fitted:
-        warnings.warn("Computing fitted values for ADIDA is very expensive")
         fitted_aggregation_levels = np.round(
             y_intervals.cumsum() / np.arange(1, y_intervals.size + 1)
         )
@@ -3860,15 +5158,17 @@ def _adida(
             np.append(np.nan, fitted_aggregation_levels), y
         )[1:].astype(np.int32)
 
-        sums_fitted = np.empty(y.size - 1, dtype=y.dtype)
-        for i, agg_lvl in enumerate(fitted_aggregation_levels):
-            sums_fitted[i] = _chunk_forecast(y[: i + 1], agg_lvl)
+        sums_fitted = _chunk_prefix_forecasts(y, fitted_aggregation_levels).astype(
+            y.dtype
+        )
 
         res["fitted"] = np.append(np.nan, sums_fitted / fitted_aggregation_levels)
     return res
 
-# %% ../nbs/src/core/models.ipynb 290
+# %% ../nbs/src/core/models.ipynb 320
 class ADIDA(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "ADIDA",
@@ -4036,7 +5336,7 @@ class ADIDA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 302
+# %% ../nbs/src/core/models.ipynb 332
 def _croston_classic(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4064,8 +5364,10 @@ def _croston_classic(
         out["fitted"] = ydf / yif
     return out
 
-# %% ../nbs/src/core/models.ipynb 303
+# %% ../nbs/src/core/models.ipynb 333
 class CrostonClassic(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "CrostonClassic",
@@ -4228,7 +5530,7 @@ class CrostonClassic(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 314
+# %% ../nbs/src/core/models.ipynb 344
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4251,27 +5553,24 @@ def _croston_optimized(
         mean = ydp
     out = {"mean": _repeat_val(val=mean, h=h)}
     if fitted:
-        warnings.warn("Computing fitted values for CrostonOptimized is very expensive")
         ydf = np.empty(yd.size + 1, dtype=y.dtype)
         ydf[0] = np.nan
-        for i in range(yd.size):
-            ydf[i + 1] = _optimized_ses_forecast(yd[: i + 1])[0]
+        ydf[1:] = _optimized_ses_prefix_forecasts(yd)
 
         yif = np.empty(yi.size + 1, dtype=y.dtype)
         yif[0] = np.nan
-        for i in range(yi.size):
-            yiff = _optimized_ses_forecast(yi[: i + 1])[0]
-            if yiff == 0:
-                yiff = 1.0
-            yif[i + 1] = yiff
+        yif[1:] = _optimized_ses_prefix_forecasts(yi)
+        yif[1:][yif[1:] == 0] = 1.0
 
         ydf = _expand_fitted_demand(ydf, y)
         yif = _expand_fitted_intervals(yif, y)
         out["fitted"] = ydf / yif
     return out
 
-# %% ../nbs/src/core/models.ipynb 315
+# %% ../nbs/src/core/models.ipynb 345
 class CrostonOptimized(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "CrostonOptimized",
@@ -4432,7 +5731,7 @@ class CrostonOptimized(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 326
+# %% ../nbs/src/core/models.ipynb 356
 def _croston_sba(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4444,8 +5743,10 @@ def _croston_sba(
         out["fitted"] *= 0.95
     return out
 
-# %% ../nbs/src/core/models.ipynb 327
+# %% ../nbs/src/core/models.ipynb 357
 class CrostonSBA(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "CrostonSBA",
@@ -4610,7 +5911,61 @@ class CrostonSBA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 338
+# %% ../nbs/src/core/models.ipynb 368
+@njit(nogil=NOGIL, cache=CACHE)
+def _imapa_forecast(
+    cumsum: np.ndarray,
+    n: int,
+    max_aggregation_level: int,
+    alphas: np.ndarray,
+) -> float:
+    """IMAPA one step forecast of the first n values of a serie with cumulative sum `cumsum`.
+
+    The sums of the chunks of every aggregation level are differences of the cumulative sum.
+    The alphas of the levels that aren't NaN are used as starting points of the search
+    and all of them are updated with the values found."""
+    forecasts = np.empty(max_aggregation_level, np.float32)
+    for aggregation_level in range(1, max_aggregation_level + 1):
+        # incomplete chunks at the start are discarded
+        lost_remainder_data = n % aggregation_level
+        bounds = cumsum[lost_remainder_data : n + 1 : aggregation_level]
+        aggregation_sums = bounds[1:] - bounds[:-1]
+        alpha = alphas[aggregation_level]
+        if np.isnan(alpha):
+            alpha = _ses_optimal_alpha(aggregation_sums, 0.1, 0.3)
+        else:
+            alpha = _ses_warm_alpha(aggregation_sums, alpha, 0.1, 0.3)
+        alphas[aggregation_level] = alpha
+        forecast, _ = _ses_forecast(aggregation_sums, alpha)
+        forecasts[aggregation_level - 1] = forecast / aggregation_level
+    return forecasts.mean()
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _imapa_prefix_forecasts(y: np.ndarray) -> np.ndarray:
+    """IMAPA forecast of every prefix y[:i + 1].
+
+    The mean interval is updated with each demand and the alpha of each
+    aggregation level starts from the last one found for that level."""
+    cumsum = np.zeros(y.size + 1)
+    cumsum[1:] = np.cumsum(y)
+    alphas = np.full(y.size + 1, np.nan)
+    out = np.zeros(y.size, np.float32)
+    n_demands = 0
+    last_demand = -1
+    for i in range(y.size):
+        if y[i] != 0:
+            n_demands += 1
+            last_demand = i
+        if n_demands == 0:
+            continue
+        n = i + 1
+        # the intervals add up to the position of the last demand
+        max_aggregation_level = int(np.round((last_demand + 1) / n_demands))
+        out[i] = _imapa_forecast(cumsum, n, max_aggregation_level, alphas)
+    return out
+
+
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4626,26 +5981,21 @@ def _imapa(
     y_intervals = _intervals(y)
     mean_interval = y_intervals.mean().item()
     max_aggregation_level = round(mean_interval)
-    forecasts = np.empty(max_aggregation_level, np.float32)
-    for aggregation_level in range(1, max_aggregation_level + 1):
-        lost_remainder_data = len(y) % aggregation_level
-        y_cut = y[lost_remainder_data:]
-        aggregation_sums = _chunk_sums(y_cut, aggregation_level)
-        forecast, _ = _optimized_ses_forecast(aggregation_sums)
-        forecasts[aggregation_level - 1] = forecast / aggregation_level
-    forecast = forecasts.mean()
+    cumsum = np.append(0.0, np.cumsum(y, dtype=np.float64))
+    alphas = np.full(max_aggregation_level + 1, np.nan)
+    forecast = _imapa_forecast(cumsum, y.size, max_aggregation_level, alphas)
     res = {"mean": _repeat_val(val=forecast, h=h)}
     if fitted:
-        warnings.warn("Computing fitted values for IMAPA is very expensive.")
         fitted_vals = np.empty_like(y)
         fitted_vals[0] = np.nan
-        for i in range(y.size - 1):
-            fitted_vals[i + 1] = _imapa(y[: i + 1], h=1, fitted=False)["mean"].item()
+        fitted_vals[1:] = _imapa_prefix_forecasts(y[:-1])
         res["fitted"] = fitted_vals
     return res
 
-# %% ../nbs/src/core/models.ipynb 339
+# %% ../nbs/src/core/models.ipynb 370
 class IMAPA(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alias: str = "IMAPA",
@@ -4809,7 +6159,7 @@ class IMAPA(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 350
+# %% ../nbs/src/core/models.ipynb 381
 def _tsb(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4834,8 +6184,10 @@ def _tsb(
         res["fitted"] = ypft * ydft
     return res
 
-# %% ../nbs/src/core/models.ipynb 351
+# %% ../nbs/src/core/models.ipynb 382
 class TSB(_TS):
+    releases_gil = True
+
     def __init__(
         self,
         alpha_d: float,
@@ -5010,7 +6362,7 @@ class TSB(_TS):
             res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 363
+# %% ../nbs/src/core/models.ipynb 394
 def _predict_mstl_seas(mstl_ob, h, season_length):
     seasoncolumns = mstl_ob.filter(regex="seasonal*").columns
     nseasons = len(seasoncolumns)
@@ -5027,7 +6379,7 @@ def _predict_mstl_seas(mstl_ob, h, season_length):
     lastseas = seascomp.sum(axis=1)
     return lastseas
 
-# %% ../nbs/src/core/models.ipynb 364
+# %% ../nbs/src/core/models.ipynb 395
 class MSTL(_TS):
     """MSTL model.
 
@@ -5306,7 +6658,7 @@ class MSTL(_TS):
         }
         return res
 
-# %% ../nbs/src/core/models.ipynb 380
+# %% ../nbs/src/core/models.ipynb 411
 class TBATS(_TS):
     """Trigonometric Box-Cox transform, ARMA errors, Trend and Seasonal components (TBATS) model.
 
@@ -5521,7 +6873,7 @@ class TBATS(_TS):
             res_trans = res
         return res_trans
 
-# %% ../nbs/src/core/models.ipynb 388
+# %% ../nbs/src/core/models.ipynb 419
 class AutoTBATS(TBATS):
     """AutoTBATS model.
 
@@ -5580,7 +6932,7 @@ class AutoTBATS(TBATS):
             alias=alias,
         )
 
-# %% ../nbs/src/core/models.ipynb 398
+# %% ../nbs/src/core/models.ipynb 429
 class Theta(AutoTheta):
     """Standard Theta Method.
 
@@ -5600,6 +6952,10 @@ class Theta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 200)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 0)
+        Seed of the simulated sample paths.
     """
 
     def __init__(
@@ -5608,6 +6964,8 @@ class Theta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "Theta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
+        seed: int = 0,
     ):
         super().__init__(
             season_length=season_length,
@@ -5615,9 +6973,11 @@ class Theta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
+            seed=seed,
         )
 
-# %% ../nbs/src/core/models.ipynb 412
+# %% ../nbs/src/core/models.ipynb 443
 class OptimizedTheta(AutoTheta):
     """Optimized Theta Method.
 
@@ -5637,6 +6997,10 @@ class OptimizedTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 200)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 0)
+        Seed of the simulated sample paths.
     """
 
     def __init__(
@@ -5645,6 +7009,8 @@ class OptimizedTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "OptimizedTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
+        seed: int = 0,
     ):
         super().__init__(
             season_length=season_length,
@@ -5652,9 +7018,11 @@ class OptimizedTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
+            seed=seed,
         )
 
-# %% ../nbs/src/core/models.ipynb 426
+# %% ../nbs/src/core/models.ipynb 457
 class DynamicTheta(AutoTheta):
     """Dynamic Standard Theta Method.
 
@@ -5674,6 +7042,10 @@ class DynamicTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 200)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 0)
+        Seed of the simulated sample paths.
     """
 
     def __init__(
@@ -5682,6 +7054,8 @@ class DynamicTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "DynamicTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
+        seed: int = 0,
     ):
         super().__init__(
             season_length=season_length,
@@ -5689,9 +7063,11 @@ class DynamicTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
+            seed=seed,
         )
 
-# %% ../nbs/src/core/models.ipynb 440
+# %% ../nbs/src/core/models.ipynb 471
 class DynamicOptimizedTheta(AutoTheta):
     """Dynamic Optimized Theta Method.
 
@@ -5711,6 +7087,10 @@ class DynamicOptimizedTheta(AutoTheta):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    n_samples : int (default 200)
+        Number of sample paths simulated to compute the prediction intervals.
+    seed : int (default 0)
+        Seed of the simulated sample paths.
     """
 
     def __init__(
@@ -5719,6 +7099,8 @@ class DynamicOptimizedTheta(AutoTheta):
         decomposition_type: str = "multiplicative",
         alias: str = "DynamicOptimizedTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        n_samples: int = 200,
+        seed: int = 0,
     ):
         super().__init__(
             season_length=season_length,
@@ -5726,9 +7108,11 @@ class DynamicOptimizedTheta(AutoTheta):
             decomposition_type=decomposition_type,
             alias=alias,
             prediction_intervals=prediction_intervals,
+            n_samples=n_samples,
+            seed=seed,
         )
 
-# %% ../nbs/src/core/models.ipynb 455
+# %% ../nbs/src/core/models.ipynb 487
 class GARCH(_TS):
     """Generalized Autoregressive Conditional Heteroskedasticity (GARCH) model.
 
@@ -5771,6 +7155,8 @@ class GARCH(_TS):
         intervals.
     """
 
+    releases_gil = True
+
     def __init__(
         self,
         p: int = 1,
@@ -5923,7 +7309,7 @@ class GARCH(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 468
+# %% ../nbs/src/core/models.ipynb 500
 class ARCH(GARCH):
     """Autoregressive Conditional Heteroskedasticity (ARCH) model.
 
@@ -5970,8 +7356,10 @@ class ARCH(GARCH):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 479
+# %% ../nbs/src/core/models.ipynb 511
 class ConstantModel(_TS):
+    releases_gil = True
+
     def __init__(self, constant: float, alias: str = "ConstantModel"):
         """Constant Model.
 
@@ -6155,7 +7543,7 @@ class ConstantModel(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 493
+# %% ../nbs/src/core/models.ipynb 525
 class ZeroModel(ConstantModel):
     def __init__(self, alias: str = "ZeroModel"):
         """Returns Zero forecasts.
@@ -6169,7 +7557,7 @@ class ZeroModel(ConstantModel):
         """
         super().__init__(constant=0, alias=alias)
 
-# %% ../nbs/src/core/models.ipynb 507
+# %% ../nbs/src/core/models.ipynb 539
 class NaNModel(ConstantModel):
     def __init__(self, alias: str = "NaNModel"):
         """NaN Model.
@@ -13,7 +13,7 @@ from scipy.stats import norm
 from statsmodels.tsa.seasonal import seasonal_decompose
 from statsmodels.tsa.stattools import acf
 
-from .ets import restrict_to_bounds, results
+from .ets import nelder_mead_init, nelder_mead_result, nelder_mead_tell
 from .utils import _seasonal_naive, _repeat_val_seas, CACHE, NOGIL
 
 # %% ../nbs/src/theta.ipynb 4
@@ -139,32 +139,38 @@ def thetafcst(states, i, modeltype, f, h, alpha, theta):
 
 # %% ../nbs/src/theta.ipynb 10
 @njit(nogil=NOGIL, cache=CACHE)
-def thetaupdate(states, i, modeltype, alpha, theta, y, usemu):  # kind of model
+def thetastep(prev, new, i, modeltype, alpha, theta, y, usemu):  # kind of model
     # states
     # level, meany, An, Bn, mu
+    # computes the states `new` of time i from the states `prev` of time i - 1
     # get params
-    level = states[i - 1, 0]
-    meany = states[i - 1, 1]
-    An = states[i - 1, 2]
-    Bn = states[i - 1, 3]
+    level = prev[0]
+    meany = prev[1]
+    An = prev[2]
+    Bn = prev[3]
     # update mu
-    states[i, 4] = level + (1 - 1 / theta) * (
+    new[4] = level + (1 - 1 / theta) * (
         An * ((1 - alpha) ** i) + Bn * (1 - (1 - alpha) ** (i + 1)) / alpha
     )
     if usemu:
-        y = states[i, 4]
+        y = new[4]
     # update level
-    states[i, 0] = alpha * y + (1 - alpha) * level
+    new[0] = alpha * y + (1 - alpha) * level
     # update meany
-    states[i, 1] = (i * meany + y) / (i + 1)
+    new[1] = (i * meany + y) / (i + 1)
     # update Bn and An
     if modeltype in [DSTM, DOTM]:
         # dynamic models
-        states[i, 3] = ((i - 1) * Bn + 6 * (y - meany) / (i + 1)) / (i + 2)
-        states[i, 2] = states[i, 1] - states[i, 3] * (i + 2) / 2
+        new[3] = ((i - 1) * Bn + 6 * (y - meany) / (i + 1)) / (i + 2)
+        new[2] = new[1] - new[3] * (i + 2) / 2
     else:
-        states[i, 2] = An
-        states[i, 3] = Bn
+        new[2] = An
+        new[3] = Bn
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def thetaupdate(states, i, modeltype, alpha, theta, y, usemu):  # kind of model
+    thetastep(states[i - 1], states[i], i, modeltype, alpha, theta, y, usemu)
 
 # %% ../nbs/src/theta.ipynb 11
 @njit(nogil=NOGIL, cache=CACHE)
@@ -323,105 +329,35 @@ def nelder_mead_theta(
     max_iter: int = 2_000,
     tol_std: float = 1e-10,
     adaptive: bool = False,
+    tol_x: float = 0.0,
+    max_stall: int = 0,
+    init_simplex: np.ndarray = np.empty((0, 0)),
+    batch: bool = False,
 ):
-    # We are trying to minimize the function fn(x, args)
-    # with initial point x0.
-    # Step 0:
-    # get x1, ..., x_{n+1}
-    # the original article suggested a simplex where an initial point is given as x0
-    # with the others generated with a fixed step along each dimension in turn.
-    bounds = len(lower) and len(upper)
-    if bounds:
-        x0 = restrict_to_bounds(x0, lower, upper)
-
-    n = x0.size
-    if adaptive:
-        gamma = 1.0 + 2.0 / n
-        rho = 0.75 - 1.0 / (2.0 * n)
-        sigma = 1.0 - 1.0 / n
-    simplex = np.full(
-        (n + 1, n), fill_value=np.nan, dtype=np.float64
-    )  # each row is x_j
-    simplex[:] = x0
-    # perturb simplex using `init_step`
-    diag = np.copy(np.diag(simplex))
-    diag[diag == 0.0] = zero_pert
-    diag[diag != 0.0] *= 1 + init_step
-    np.fill_diagonal(simplex, diag)
-    # restrict simplex to bounds if passed
-    if bounds:
-        for j in range(n + 1):
-            simplex[j] = restrict_to_bounds(simplex[j], lower, upper)
-    # array of the value of f
-    f_simplex = np.full(n + 1, fill_value=np.nan)
-    for j in range(n + 1):
-        f_simplex[j] = theta_target_fn(simplex[j], *args)
-    for it in range(max_iter):
-        # Step1: order of f_simplex
-        # print(simplex)
-        # print(f_simplex)
-        order_f = f_simplex.argsort()
-        best_idx = order_f[0]
-        worst_idx = order_f[-1]
-        second_worst_idx = order_f[-2]
-        # Check whether method should stop.
-        if np.std(f_simplex) < tol_std:
-            break
-        # calculate centroid except argmax f_simplex
-        x_o = simplex[np.delete(order_f, -1)].sum(axis=0) / n
-        # Step2: Reflection, Compute reflected point
-        x_r = x_o + alpha * (x_o - simplex[worst_idx])
-        # restrict x_r to bounds if passed
-        if bounds:
-            x_r = restrict_to_bounds(x_r, lower, upper)
-        f_r = theta_target_fn(x_r, *args)
-        if f_simplex[best_idx] <= f_r < f_simplex[second_worst_idx]:
-            simplex[worst_idx] = x_r
-            f_simplex[worst_idx] = f_r
-            continue
-        # Step3: Expansion, reflected point is the best point so far
-        if f_r < f_simplex[best_idx]:
-            x_e = x_o + gamma * (x_r - x_o)
-            # restrict x_e to bounds if passed
-            if bounds:
-                x_e = restrict_to_bounds(x_e, lower, upper)
-            f_e = theta_target_fn(x_e, *args)
-            if f_e < f_r:
-                simplex[worst_idx] = x_e
-                f_simplex[worst_idx] = f_e
-            else:
-                simplex[worst_idx] = x_r
-                f_simplex[worst_idx] = f_r
-            continue
-        # Step4: outside Contraction
-        if f_simplex[second_worst_idx] <= f_r < f_simplex[worst_idx]:
-            x_oc = x_o + rho * (x_r - x_o)
-            if bounds:
-                x_oc = restrict_to_bounds(x_oc, lower, upper)
-            f_oc = theta_target_fn(x_oc, *args)
-            if f_oc <= f_r:
-                simplex[worst_idx] = x_oc
-                f_simplex[worst_idx] = f_oc
-                continue
-        # step 5 inside contraction
-        else:
-            x_ic = x_o - rho * (x_r - x_o)
-            # restrict x_c to bounds if passed
-            if bounds:
-                x_ic = restrict_to_bounds(x_ic, lower, upper)
-            f_ic = theta_target_fn(x_ic, *args)
-            if f_ic < f_simplex[worst_idx]:
-                simplex[worst_idx] = x_ic
-                f_simplex[worst_idx] = f_ic
-                continue
-        # step 6: shrink
-        simplex[np.delete(order_f, 0)] = simplex[best_idx] + sigma * (
-            simplex[np.delete(order_f, 0)] - simplex[best_idx]
-        )
-        for i in np.delete(order_f, 0):
-            simplex[i] = restrict_to_bounds(simplex[i], lower, upper)
-            f_simplex[i] = theta_target_fn(simplex[i], *args)
-    return results(simplex[best_idx], f_simplex[best_idx], it + 1, simplex)
+    state = nelder_mead_init(
+        x0,
+        lower,
+        upper,
+        init_step,
+        zero_pert,
+        alpha,
+        gamma,
+        rho,
+        sigma,
+        max_iter,
+        tol_std,
+        adaptive,
+        tol_x,
+        max_stall,
+        init_simplex,
+        batch,
+    )
+    n_points = state.points.shape[0]
+    while n_points:
+        for j in range(n_points):
+            state.fvals[j] = theta_target_fn(state.points[j], *args)
+        n_points = nelder_mead_tell(state)
+    return nelder_mead_result(state)
 
 # %% ../nbs/src/theta.ipynb 23
 def optimize_theta_target_fn(init_par, optimize_params, y, modeltype, nmse):
@@ -522,26 +458,39 @@ def thetamodel(
     )
 
 # %% ../nbs/src/theta.ipynb 28
-def compute_pi_samples(
-    n, h, states, sigma, alpha, theta, mean_y, seed=0, n_samples=200
-):
-    samples = np.full((h, n_samples), fill_value=np.nan, dtype=np.float32)
+@njit(nogil=NOGIL, cache=CACHE)
+def thetasimulate(n, states, noise, alpha, theta, mean_y):
+    # propagates all the paths at once, noise has shape (h, n_samples)
+    h, n_samples = noise.shape
+    samples = np.empty((h, n_samples), dtype=np.float32)
     # states: level, meany, An, Bn, mu
-    smoothed, _, A, B, _ = states[-1]
-    np.random.seed(seed)
+    smoothed = np.full(n_samples, states[-1, 0], dtype=np.float64)
+    A = np.full(n_samples, states[-1, 2], dtype=np.float64)
+    B = np.full(n_samples, states[-1, 3], dtype=np.float64)
+    means = np.full(n_samples, mean_y, dtype=np.float64)
     for i in range(n, n + h):
         samples[i - n] = smoothed + (1 - 1 / theta) * (
             A * ((1 - alpha) ** i) + B * (1 - (1 - alpha) ** (i + 1)) / alpha
         )
-        samples[i - n] += np.random.normal(scale=sigma, size=n_samples)
+        samples[i - n] += noise[i - n]
         smoothed = alpha * samples[i - n] + (1 - alpha) * smoothed
-        mean_y = (i * mean_y + samples[i - n]) / (i + 1)
-        B = ((i - 1) * B + 6 * (samples[i - n] - mean_y) / (i + 1)) / (i + 2)
-        A = mean_y - B * (i + 2) / 2
+        means = (i * means + samples[i - n]) / (i + 1)
+        B = ((i - 1) * B + 6 * (samples[i - n] - means) / (i + 1)) / (i + 2)
+        A = means - B * (i + 2) / 2
     return samples
 
 # %% ../nbs/src/theta.ipynb 29
-def forecast_theta(obj, h, level=None):
+def compute_pi_samples(
+    n, h, states, sigma, alpha, theta, mean_y, seed=0, n_samples=200
+):
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(scale=sigma, size=(h, n_samples))
+    return thetasimulate(
+        n=n, states=states, noise=noise, alpha=alpha, theta=theta, mean_y=mean_y
+    )
+
+# %% ../nbs/src/theta.ipynb 30
+def forecast_theta(obj, h, level=None, n_samples=200, seed=0):
     forecast = np.full(h, fill_value=np.nan)
     n = obj["n"]
     states = obj["states"]
@@ -559,7 +508,10 @@ def forecast_theta(obj, h, level=None):
     res = {"mean": forecast}
 
     if level is not None:
-        sigma = np.std(obj["residuals"][3:], ddof=1)
+        # the compact models only keep the standard deviation of the residuals
+        sigma = obj.get("sigma")
+        if sigma is None:
+            sigma = np.std(obj["residuals"][3:], ddof=1)
         mean_y = obj["mean_y"]
         samples = compute_pi_samples(
             n=n,
@@ -569,6 +521,8 @@ def forecast_theta(obj, h, level=None):
             alpha=alpha,
             theta=theta,
             mean_y=mean_y,
+            seed=seed,
+            n_samples=n_samples,
         )
         for lv in level:
             min_q = (100 - lv) / 200
@@ -586,6 +540,92 @@ def forecast_theta(obj, h, level=None):
     return res
 
 # %% ../nbs/src/theta.ipynb 31
+@njit(nogil=NOGIL, cache=CACHE)
+def thetaforecast_many(states, n, modeltype, h, alpha, theta):
+    # forecasts of several models from their last states, one model by row.
+    # only the previous states are needed, so the history isn't copied like in thetafcst
+    f = np.empty((states.shape[0], h))
+    new_states = np.zeros((h + 1, states.shape[1]), dtype=np.float32)
+    for k in range(states.shape[0]):
+        new_states[0] = states[k]
+        for i_h in range(h):
+            thetastep(
+                new_states[i_h],
+                new_states[i_h + 1],
+                n[k] + i_h,
+                modeltype[k],
+                alpha[k],
+                theta[k],
+                y=0,
+                usemu=1,
+            )
+            f[k, i_h] = new_states[i_h + 1, 4]  # mu is the forecast
+    return f
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def thetasimulate_many(n, states, sigma, noise, alpha, theta, mean_y):
+    # samples of several models from their last states, one model by row,
+    # noise has the standard normal errors of shape (h, n_samples) shared by all the models
+    h, n_samples = noise.shape
+    samples = np.empty((states.shape[0], h, n_samples), dtype=np.float32)
+    for k in range(states.shape[0]):
+        samples[k] = thetasimulate(
+            n[k], states[k : k + 1], sigma[k] * noise, alpha[k], theta[k], mean_y[k]
+        )
+    return samples
+
+
+def forecast_theta_compact(params, h, level=None, n_samples=200, seed=0):
+    """Forecast several models from their stacked model types, parameters, last states,
+    standard deviations of the residuals and seasonal forecasts, as stored by `AutoTheta`.
+
+    Returns arrays with one row per model."""
+    modeltypes, inverse = np.unique(params["modeltype"], return_inverse=True)
+    modeltype = np.array([switch_theta(x) for x in modeltypes])[inverse.ravel()]
+    alpha, theta = params["par"].T
+    n = params["n"]
+    states = params["states"]
+    res = {"mean": thetaforecast_many(states, n, modeltype, h, alpha, theta)}
+
+    if level is not None:
+        for lv in level:
+            res[f"lo-{lv}"] = np.empty_like(res["mean"])
+            res[f"hi-{lv}"] = np.empty_like(res["mean"])
+        noise = np.random.default_rng(seed).standard_normal((h, n_samples))
+        # bound the memory used by the samples
+        chunk_size = max(1, 2**24 // (n_samples * h))
+        for start in range(0, n.size, chunk_size):
+            rows = slice(start, start + chunk_size)
+            samples = thetasimulate_many(
+                n[rows],
+                states[rows],
+                params["sigma"][rows],
+                noise,
+                alpha[rows],
+                theta[rows],
+                params["mean_y"][rows],
+            )
+            for lv in level:
+                min_q = (100 - lv) / 200
+                max_q = min_q + lv / 100
+                res[f"lo-{lv}"][rows] = np.quantile(samples, min_q, axis=2)
+                res[f"hi-{lv}"][rows] = np.quantile(samples, max_q, axis=2)
+
+    seas_forecast = params["seas_forecast"]
+    if seas_forecast.shape[1] > 0:
+        # the seasonal forecasts of the models that weren't decomposed are padded with zeros
+        seas_forecast = seas_forecast[:, np.arange(h) % seas_forecast.shape[1]]
+        multiplicative = params["decomposition_type"] == "multiplicative"
+        additive = (params["decomposition_type"] != "") & ~multiplicative
+        for key in res:
+            res[key][multiplicative] = (
+                res[key][multiplicative] * seas_forecast[multiplicative]
+            )
+            res[key][additive] = res[key][additive] + seas_forecast[additive]
+    return res
+
+# %% ../nbs/src/theta.ipynb 33
 def auto_theta(
     y,
     m,
@@ -685,7 +725,7 @@ def auto_theta(
         model["seas_forecast"] = dict(seas_forecast)
     return model
 
-# %% ../nbs/src/theta.ipynb 41
+# %% ../nbs/src/theta.ipynb 45
 def forward_theta(fitted_model, y):
     m = fitted_model["m"]
     model = fitted_model["modeltype"]
@@ -700,3 +740,58 @@ def forward_theta(fitted_model, y):
         alpha=alpha,
         theta=theta,
     )
+
+# %% ../nbs/src/theta.ipynb 47
+@njit(nogil=NOGIL, cache=CACHE)
+def thetaupdate_many(states, n, modeltype, alpha, theta, y, e):
+    # filter the observations y that follow the first n states
+    for i in range(n, n + y.size):
+        thetaupdate(
+            states=states,
+            i=i,
+            modeltype=modeltype,
+            alpha=alpha,
+            theta=theta,
+            y=y[i - n],
+            usemu=0,
+        )
+        e[i - n] = y[i - n] - states[i, 4]
+
+# %% ../nbs/src/theta.ipynb 48
+def update_theta(fitted_model, y):
+    """Advance the states of `fitted_model` with the new observations `y`
+    without re-estimating its parameters."""
+    n = fitted_model["n"]
+    decompose = fitted_model.get("decompose", False)
+    if decompose:
+        multiplicative = fitted_model["decomposition_type"] == "multiplicative"
+        seas = _repeat_val_seas(fitted_model["seas_forecast"]["mean"], h=y.size)
+        y = y / seas if multiplicative else y - seas
+    states = np.zeros((n + y.size, 5), dtype=np.float32)
+    states[:n] = fitted_model["states"]
+    e = np.empty_like(y)
+    thetaupdate_many(
+        states=states,
+        n=n,
+        modeltype=switch_theta(fitted_model["modeltype"]),
+        alpha=fitted_model["par"]["alpha"],
+        theta=fitted_model["par"]["theta"],
+        y=y,
+        e=e,
+    )
+    out = {
+        **fitted_model,
+        "states": states,
+        "n": n + y.size,
+        "mean_y": (n * fitted_model["mean_y"] + y.sum()) / (n + y.size),
+    }
+    if decompose:
+        e = e * seas if multiplicative else e + seas
+        # the seasonal forecast has to start at the season following y
+        seas_forecast = fitted_model["seas_forecast"]
+        out["seas_forecast"] = {
+            **seas_forecast,
+            "mean": np.roll(seas_forecast["mean"], -y.size),
+        }
+    out["residuals"] = np.concatenate([fitted_model["residuals"], e])
+    return out
@@ -292,7 +292,19 @@ def _ensure_float(x: np.ndarray) -> np.ndarray:
         x = x.astype(np.float32)
     return x
 
-# %% ../nbs/src/utils.ipynb 19
+
+def _stack_padded(arrays):
+    """Stack the arrays padding the smaller ones with zeros at the end of each axis."""
+    shape = arrays[0].shape
+    if all(arr.shape == shape for arr in arrays):
+        return np.stack(arrays)
+    shape = tuple(np.max([arr.shape for arr in arrays], axis=0))
+    out = np.zeros((len(arrays), *shape), dtype=np.result_type(*arrays))
+    for i, arr in enumerate(arrays):
+        out[(i, *(slice(0, size) for size in arr.shape))] = arr
+    return out
+
+# %% ../nbs/src/utils.ipynb 20
 # Functions used for calculating prediction intervals
 def _quantiles(level):
     level = np.asarray(level)
@@ -322,7 +334,7 @@ def _calculate_sigma(residuals, n):
         sigma = 0
     return sigma
 
-# %% ../nbs/src/utils.ipynb 20
+# %% ../nbs/src/utils.ipynb 21
 class ConformalIntervals:
     """Class for storing conformal intervals metadata information."""
 
@@ -343,7 +355,7 @@ class ConformalIntervals:
         self.h = h
         self.method = method
 
-# %% ../nbs/src/utils.ipynb 21
+# %% ../nbs/src/utils.ipynb 22
 def _old_kw_to_pos(old_names, new_positions):
     def decorator(f):
         @wraps(f)